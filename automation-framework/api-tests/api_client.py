@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+API Client
+Author: QA Team
+Date: 2025-12-31
+Framework: requests library
+"""
+
+import time
+
+import requests
+
+from pagination import Paginator
+from request_timing import (
+    TimedHTTPAdapter,
+    TimingHooks,
+    global_hooks,
+    global_start_hooks,
+    start_timing,
+    stop_timing,
+)
+
+# (connect, read) seconds; a hung connection must not stall a test forever
+DEFAULT_TIMEOUT = (5, 30)
+
+
+class APIClient:
+    """
+    Wrapper class for API requests with common functionality
+
+    Every call is timed with perf_counter_ns: the RequestTiming is attached
+    to the response as `response.timing` and delivered to subscribers of
+    `timing_hooks` and of request_timing.global_hooks (global_start_hooks
+    hear about each request as it starts). Pass a
+    LatencyRecorder as `recorder` to collect per-endpoint latency
+    histograms for every call made through the client.
+    Pass a RateLimitThrottle as `throttle` (optionally shared between
+    clients) to hold requests back instead of tripping the server's quota;
+    time spent throttled is not counted as request latency.
+    Pass a ResourceTracker as `tracker` to record everything created via
+    post() so it can be deleted at teardown. Pass a Cassette as `cassette`
+    to record traffic to disk or replay it without touching the network.
+
+    Requests time out after `timeout` seconds (connect, read) unless a call
+    passes its own. Pass a RetryPolicy as `retry` to retry transient
+    failures, and a CircuitBreakers registry as `breakers` (shared between
+    clients) to stop sending to a host that keeps failing.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        recorder=None,
+        throttle=None,
+        tracker=None,
+        cassette=None,
+        timeout=DEFAULT_TIMEOUT,
+        retry=None,
+        breakers=None,
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retry = retry
+        self.breakers = breakers
+        self.session = requests.Session()
+        for prefix in ("http://", "https://"):
+            adapter = cassette.adapter() if cassette is not None else TimedHTTPAdapter()
+            self.session.mount(prefix, adapter)
+        self.token = None
+        self.timing_hooks = TimingHooks()
+        self.recorder = recorder
+        self.throttle = throttle
+        self.tracker = tracker
+        if recorder is not None:
+            self.timing_hooks.subscribe(
+                lambda timing: recorder.record(
+                    timing.method, timing.endpoint, timing.status, timing.total
+                )
+            )
+
+    def set_auth_token(self, token):
+        """Set authentication token for requests"""
+        self.token = token
+        self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+    def request(self, method, endpoint, **kwargs):
+        """
+        Send a request and record its phase timings
+
+        With stream=True the body is left unread, so the body and decode
+        phases stay at zero. `timeout` defaults to the client's. Retried
+        calls return the final attempt's response; its timing covers all
+        attempts (see RequestTiming.attempts and the retry phase). A
+        transport error that ends the call carries the timing as `timing`
+        too, so callers can still tell which endpoint failed.
+        """
+        url = f"{self.base_url}{endpoint}"
+        stream = kwargs.pop("stream", False)
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        breaker = self.breakers.for_url(url) if self.breakers is not None else None
+        if self.throttle is not None:
+            self.throttle.acquire()
+        timing = start_timing(method, endpoint)
+        global_start_hooks.emit(timing)
+        try:
+            while True:
+                response, error = None, None
+                try:
+                    response = self.attempt(method, url, timing, breaker, **kwargs)
+                    if not stream:
+                        self.read_body(response, timing)
+                except requests.RequestException as exc:
+                    error = exc
+                    timing.status = type(exc).__name__
+                retry = self.retry is not None and self.retry.should_retry(
+                    method, timing.attempts, response, error
+                )
+                if not retry:
+                    if error is not None:
+                        error.timing = timing
+                        raise error
+                    break
+                delay = self.retry.delay(timing.attempts, response)
+                if response is not None:
+                    response.close()
+                time.sleep(delay)
+                timing.next_attempt()
+                if self.throttle is not None:
+                    self.throttle.acquire()
+        finally:
+            stop_timing()
+            timing.finish()
+            self.timing_hooks.emit(timing)
+            global_hooks.emit(timing)
+
+        response.timing = timing
+        return response
+
+    def attempt(self, method, url, timing, breaker, **kwargs):
+        """One send through the circuit breaker and throttle"""
+        if breaker is not None:
+            try:
+                breaker.before()
+            except requests.RequestException:
+                if self.throttle is not None:
+                    self.throttle.release()
+                raise
+        try:
+            response = self.session.request(method, url, stream=True, **kwargs)
+        except requests.RequestException:
+            if self.throttle is not None:
+                # No response, so observe() never runs for this slot
+                self.throttle.release()
+            if breaker is not None:
+                breaker.failure()
+            raise
+        if self.throttle is not None:
+            self.throttle.observe(response)
+        if breaker is not None:
+            breaker.record(response.status_code)
+        setup_ns = timing.phases["connect"] + timing.phases["tls"]
+        elapsed_ns = time.perf_counter_ns() - timing.attempt_started_ns
+        timing.add("ttfb", elapsed_ns - setup_ns)
+        timing.status = response.status_code
+        return response
+
+    @staticmethod
+    def read_body(response, timing):
+        """Download the body and decode JSON once, timing both phases"""
+        start = time.perf_counter_ns()
+        content = response.content
+        timing.add("body", time.perf_counter_ns() - start)
+        timing.response_bytes = len(content)
+
+        if content and "json" in response.headers.get("Content-Type", ""):
+            start = time.perf_counter_ns()
+            try:
+                data = response.json()
+            except ValueError:
+                return
+            finally:
+                timing.add("decode", time.perf_counter_ns() - start)
+            response.json = lambda **kwargs: data
+
+    def get(self, endpoint, params=None, timeout=None):
+        """Send GET request"""
+        return self.request("GET", endpoint, params=params, timeout=timeout)
+
+    def post(self, endpoint, data=None, json_data=None, timeout=None):
+        """Send POST request"""
+        response = self.request(
+            "POST", endpoint, data=data, json=json_data, timeout=timeout
+        )
+        if self.tracker is not None:
+            self.tracker.record(self.base_url, endpoint, response)
+        return response
+
+    def put(self, endpoint, data=None, json_data=None, timeout=None):
+        """Send PUT request"""
+        return self.request("PUT", endpoint, data=data, json=json_data, timeout=timeout)
+
+    def delete(self, endpoint, timeout=None):
+        """Send DELETE request"""
+        response = self.request("DELETE", endpoint, timeout=timeout)
+        if self.tracker is not None and response.status_code in (204, 404):
+            self.tracker.discard(endpoint)
+        return response
+
+    def paginate(self, endpoint, params=None, **kwargs):
+        """Iterate the items of every page of a listing (see Paginator)"""
+        return Paginator(self, endpoint, params, **kwargs)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Async API Client
+Author: QA Team
+Date: 2026-10-18
+Framework: asyncio with aiohttp library
+"""
+
+import asyncio
+import json
+import time
+from datetime import timedelta
+
+import aiohttp
+
+from api_client import DEFAULT_TIMEOUT
+from request_timing import RequestTiming, TimingHooks, global_hooks, global_start_hooks
+
+
+class AsyncResponse:
+    """
+    Fully read response returned by AsyncAPIClient
+
+    Mirrors the parts of requests.Response used by the test suites so
+    assertions can be shared between the sync and async clients.
+    """
+
+    def __init__(self, status_code, headers, content, url, elapsed, timing=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.elapsed = timedelta(seconds=elapsed)
+        self.timing = timing
+
+    @property
+    def text(self):
+        """Response body decoded as UTF-8"""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """Decode the response body as JSON"""
+        return json.loads(self.content)
+
+
+class AsyncAPIClient:
+    """
+    Asyncio counterpart of APIClient backed by a bounded connection pool
+
+    Exposes the same get/post/put/delete surface as APIClient (as
+    coroutines) plus gather() to fan out many requests concurrently.
+
+    Requests are timed like APIClient's: each response carries a
+    RequestTiming as `response.timing`, delivered to `timing_hooks`,
+    request_timing.global_hooks/global_start_hooks and the optional
+    LatencyRecorder `recorder`. aiohttp opens connections and does TLS in
+    one step, so `connect` includes the handshake and `tls` stays zero.
+    `timeout` is (connect, read) seconds as for APIClient.
+    """
+
+    def __init__(
+        self,
+        base_url,
+        pool_size=100,
+        concurrency=50,
+        recorder=None,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.token = None
+        self.headers = {}
+        self.session = None
+        self.timing_hooks = TimingHooks()
+        self.recorder = recorder
+        if recorder is not None:
+            self.timing_hooks.subscribe(
+                lambda timing: recorder.record(
+                    timing.method, timing.endpoint, timing.status, timing.total
+                )
+            )
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Create the pooled session (must run inside the event loop)"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size, limit_per_host=self.pool_size
+            )
+            connect, read = self.timeout
+            tracing = aiohttp.TraceConfig()
+            tracing.on_connection_create_start.append(self.connection_started)
+            tracing.on_connection_create_end.append(self.connection_created)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+                trace_configs=[tracing],
+            )
+
+    async def close(self):
+        """Close the session and release pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def set_auth_token(self, token):
+        """Set authentication token for requests"""
+        self.token = token
+        self.headers["Authorization"] = f"Bearer {token}"
+
+    @staticmethod
+    async def connection_started(session, context, params):
+        """TraceConfig hook: a new connection is being opened"""
+        context.connect_started_ns = time.perf_counter_ns()
+
+    @staticmethod
+    async def connection_created(session, context, params):
+        """TraceConfig hook: charge the new connection to the request"""
+        elapsed = time.perf_counter_ns() - context.connect_started_ns
+        context.trace_request_ctx.add("connect", elapsed)
+
+    async def request(self, method, endpoint, params=None, data=None, json_data=None):
+        """Send a request, read the full body and record its phase timings"""
+        await self.open()
+        url = f"{self.base_url}{endpoint}"
+        timing = RequestTiming(method, endpoint)
+        global_start_hooks.emit(timing)
+        try:
+            async with self.session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json_data,
+                headers=self.headers,
+                trace_request_ctx=timing,
+            ) as response:
+                elapsed_ns = time.perf_counter_ns() - timing.started_ns
+                timing.add("ttfb", elapsed_ns - timing.phases["connect"])
+                timing.status = response.status
+                start = time.perf_counter_ns()
+                content = await response.read()
+                timing.add("body", time.perf_counter_ns() - start)
+                timing.response_bytes = len(content)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            timing.status = type(exc).__name__
+            raise
+        finally:
+            timing.finish()
+            self.timing_hooks.emit(timing)
+            global_hooks.emit(timing)
+        return AsyncResponse(
+            response.status,
+            response.headers,
+            content,
+            str(response.url),
+            timing.total,
+            timing,
+        )
+
+    async def get(self, endpoint, params=None):
+        """Send GET request"""
+        return await self.request("GET", endpoint, params=params)
+
+    async def post(self, endpoint, data=None, json_data=None):
+        """Send POST request"""
+        return await self.request("POST", endpoint, data=data, json_data=json_data)
+
+    async def put(self, endpoint, data=None, json_data=None):
+        """Send PUT request"""
+        return await self.request("PUT", endpoint, data=data, json_data=json_data)
+
+    async def delete(self, endpoint):
+        """Send DELETE request"""
+        return await self.request("DELETE", endpoint)
+
+    async def gather(self, calls, concurrency=None, return_exceptions=False):
+        """
+        Send many requests concurrently and return responses in call order
+
+        Each call is a (method, endpoint) or (method, endpoint, kwargs)
+        tuple, where kwargs are passed to request(). At most `concurrency`
+        requests are in flight at once (defaults to the client setting).
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def bounded(call):
+            method, endpoint = call[0], call[1]
+            kwargs = call[2] if len(call) > 2 else {}
+            async with semaphore:
+                return await self.request(method, endpoint, **kwargs)
+
+        return await asyncio.gather(
+            *(bounded(call) for call in calls), return_exceptions=return_exceptions
+        )
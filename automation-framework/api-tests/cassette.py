@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+HTTP Cassettes (Record and Replay)
+Author: QA Team
+Date: 2026-10-18
+Framework: requests transport adapter with an mmap-indexed binary file
+
+Record mode saves every request/response pair APIClient sends, including
+headers and phase timings. Replay mode serves them back without opening
+a socket, so functional suites run in milliseconds and perf analysis can
+be rerun offline against captured traffic.
+
+File layout (little-endian):
+
+    MAGIC
+    frame*  = u32 meta length, u32 body length, meta JSON, body bytes
+    index   = JSON {"meta": {...}, "index": {request key: [frame offset, ...]}}
+    footer  = u64 index offset, MAGIC
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from request_timing import TimedHTTPAdapter, current_timing
+
+MAGIC = b"QACASS2\n"
+FRAME = struct.Struct("<II")
+FOOTER = struct.Struct("<Q")
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMiss(requests.RequestException):
+    """
+    Replay found no recorded response for a request
+    """
+
+
+def body_digest(body):
+    """Short hash of a request body, JSON compared by value not layout"""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes) or not body:
+        return None
+    try:
+        canonical = json.dumps(
+            json.loads(body), sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+    except ValueError:
+        canonical = body
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def request_key(method, url, body=None, authorized=False):
+    """
+    Match key: method plus path, sorted query, body digest and whether
+    the request carried credentials
+
+    Scheme, host and port are left out so traffic recorded against one
+    mock server port replays against any base URL. The digest and the
+    auth flag keep requests that differ only in their body (a valid and
+    an invalid login) or their token (a 200 and a 401) apart, so replay
+    does not depend on which tests ran first.
+    """
+    parts = urlsplit(url)
+    key = f"{method.upper()} {parts.path}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if query:
+        key = f"{key}?{query}"
+    digest = body_digest(body)
+    if digest:
+        key = f"{key} #{digest}"
+    return f"{key} +auth" if authorized else key
+
+
+def prepared_key(request):
+    """request_key() of a prepared request"""
+    return request_key(
+        request.method,
+        request.url,
+        request.body,
+        "Authorization" in request.headers,
+    )
+
+
+class Cassette:
+    """
+    One cassette file, opened for recording or replay
+
+    Identical requests are answered in the order they were recorded (the
+    n-th GET of a URL gets the n-th recorded response, the last one once
+    they run out), so create/read/delete sequences replay faithfully.
+    With `replay_latency` each replayed response takes as long as the
+    recorded one and reports the recorded connect/TLS phases. `meta` is a
+    small dict saved alongside the index for state that replay must
+    reproduce (e.g. generated test-data seeds).
+    """
+
+    def __init__(self, path, mode=REPLAY, replay_latency=False):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.lock = threading.Lock()
+        self.index = {}
+        self.meta = {}
+        self.served = {}
+        self.file = None
+        self.map = None
+        if mode == RECORD:
+            self.file = open(self.path, "wb")
+            self.file.write(MAGIC)
+        else:
+            self.load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return sum(len(offsets) for offsets in self.index.values())
+
+    def load(self):
+        """Map the file and read its index"""
+        with open(self.path, "rb") as handle:
+            self.map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        tail = len(self.map) - FOOTER.size - len(MAGIC)
+        if self.map[: len(MAGIC)] != MAGIC or self.map[-len(MAGIC) :] != MAGIC:
+            raise ValueError(f"{self.path} is not a complete cassette file")
+        (index_offset,) = FOOTER.unpack_from(self.map, tail)
+        saved = json.loads(self.map[index_offset:tail])
+        self.meta, self.index = saved["meta"], saved["index"]
+
+    def close(self):
+        """Write the index (record mode) and release the file"""
+        if self.file is not None:
+            with self.lock:
+                index_offset = self.file.tell()
+                saved = {"meta": self.meta, "index": self.index}
+                self.file.write(json.dumps(saved).encode("utf-8"))
+                self.file.write(FOOTER.pack(index_offset))
+                self.file.write(MAGIC)
+                self.file.close()
+                self.file = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def record(self, request, response, content, timings):
+        """Append one exchange"""
+        meta = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": list(response.headers.items()),
+            "timings": timings,
+        }
+        meta = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        key = prepared_key(request)
+        with self.lock:
+            offset = self.file.tell()
+            self.file.write(FRAME.pack(len(meta), len(content)))
+            self.file.write(meta)
+            self.file.write(content)
+            self.index.setdefault(key, []).append(offset)
+
+    def lookup(self, request):
+        """Recorded (meta, body) for the next replay of a prepared request"""
+        key = prepared_key(request)
+        offsets = self.index.get(key)
+        if not offsets:
+            raise CassetteMiss(f"No recorded response for {key}")
+        with self.lock:
+            served = self.served.get(key, 0)
+            self.served[key] = served + 1
+        offset = offsets[min(served, len(offsets) - 1)]
+        meta_length, body_length = FRAME.unpack_from(self.map, offset)
+        start = offset + FRAME.size
+        meta = json.loads(self.map[start : start + meta_length])
+        start += meta_length
+        return meta, self.map[start : start + body_length]
+
+    def adapter(self):
+        """Transport adapter to mount on a requests session"""
+        return CassetteAdapter(self)
+
+
+class CassetteAdapter(TimedHTTPAdapter):
+    """
+    Records through the real timed transport, or replays with no sockets
+
+    When recording, the body is read inside send() so it can be saved;
+    its download then shows up in the ttfb phase rather than body.
+    """
+
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, stream=False, **kwargs):
+        if self.cassette.mode == REPLAY:
+            return self.replay(request)
+
+        timing = current_timing()
+        before = dict(timing.phases) if timing is not None else None
+        start = time.perf_counter_ns()
+        response = super().send(request, stream=stream, **kwargs)
+        content = response.content
+        timings = {"elapsed": time.perf_counter_ns() - start}
+        if timing is not None:
+            for phase in ("connect", "tls"):
+                timings[phase] = timing.phases[phase] - before[phase]
+        self.cassette.record(request, response, content, timings)
+        return response
+
+    def replay(self, request):
+        """Build a requests.Response from the recorded exchange"""
+        meta, body = self.cassette.lookup(request)
+        timings = meta["timings"]
+        if self.cassette.replay_latency:
+            timing = current_timing()
+            if timing is not None:
+                timing.add("connect", timings.get("connect", 0))
+                timing.add("tls", timings.get("tls", 0))
+            time.sleep(timings["elapsed"] / 1e9)
+
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response.reason = meta["reason"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = body
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
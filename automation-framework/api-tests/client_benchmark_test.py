@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Framework Overhead Benchmark Suite
+Author: QA Team
+Date: 2026-10-18
+Framework: pytest-benchmark against the loopback mock API
+
+Measures how much of a reported response time is the harness itself.
+The mock server runs in the same process, so compare rows and runs
+rather than reading absolute numbers. Store a baseline and fail on
+regressions with:
+
+    pytest client_benchmark_test.py --benchmark-autosave
+    pytest client_benchmark_test.py --benchmark-compare \
+        --benchmark-compare-fail=median:15%
+"""
+
+import asyncio
+import http.client
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+from api_client import APIClient
+from async_api_client import AsyncAPIClient
+from metrics_exporter import LiveMetrics
+from schema_registry import default_registry
+
+THROUGHPUT_REQUESTS = 200
+
+
+@pytest.fixture(scope="module")
+def authed_client(mock_api, api_credentials):
+    """APIClient logged in to the mock API"""
+    client = APIClient(mock_api.base_url)
+    login = client.post("/auth/login", json_data=api_credentials)
+    client.set_auth_token(login.json()["accessToken"])
+    return client
+
+
+class TestRequestOverhead:
+    """
+    Same GET through progressively heavier stacks; the difference between
+    rows is the cost each layer adds on top of the loopback round trip
+    """
+
+    def test_url_building(self, benchmark):
+        """APIClient f-string URL construction"""
+        base_url, endpoint = "https://api.example.com/v1", "/users/12345"
+        benchmark(lambda: f"{base_url}{endpoint}")
+
+    def test_http_client_baseline(self, benchmark, mock_api, authed_client):
+        """Raw keep-alive http.client request (no framework)"""
+        url = urlparse(mock_api.base_url)
+        connection = http.client.HTTPConnection(url.hostname, url.port)
+        headers = {"Authorization": authed_client.session.headers["Authorization"]}
+
+        def call():
+            connection.request("GET", f"{url.path}/users/12345", headers=headers)
+            response = connection.getresponse()
+            return response.status, response.read()
+
+        status, _ = benchmark(call)
+        connection.close()
+        assert status == 200
+
+    def test_requests_session(self, benchmark, mock_api, authed_client):
+        """Plain requests.Session GET"""
+        session = requests.Session()
+        session.headers.update(authed_client.session.headers)
+        url = f"{mock_api.base_url}/users/12345"
+
+        response = benchmark(session.get, url)
+        assert response.status_code == 200
+
+    def test_api_client(self, benchmark, authed_client):
+        """APIClient GET including timing instrumentation and JSON decode"""
+        response = benchmark(authed_client.get, "/users/12345")
+        assert response.status_code == 200
+
+    def test_api_client_live_metrics(self, benchmark, authed_client):
+        """APIClient GET while live metrics are being collected"""
+        metrics = LiveMetrics()
+        metrics.subscribe()
+        try:
+            response = benchmark(authed_client.get, "/users/12345")
+        finally:
+            metrics.unsubscribe()
+        assert response.status_code == 200
+
+    def test_response_assertions(self, benchmark, authed_client):
+        """Assertion block of test_get_user_by_id_success on a fixed response"""
+        response = authed_client.get("/users/12345")
+
+        def check():
+            assert response.status_code == 200
+            assert response.headers["Content-Type"] == "application/json"
+            data = response.json()
+            assert data["id"] == 12345
+            assert "email" in data
+            assert "firstName" in data
+            assert "lastName" in data
+            assert "password" not in data
+            assert isinstance(data["id"], int)
+            assert isinstance(data["email"], str)
+            assert "@" in data["email"]
+
+        benchmark(check)
+
+
+class TestJSONDecode:
+    """
+    Cost of response.json() by payload size
+    """
+
+    @pytest.mark.parametrize("items", [10, 100, 1000, 10000])
+    def test_decode_products(self, benchmark, mock_api, items):
+        """json.loads of a products page body"""
+        body = json.dumps(
+            {"data": [mock_api.state.product(i) for i in range(1, items + 1)]}
+        ).encode("utf-8")
+        benchmark.extra_info["bytes"] = len(body)
+
+        data = benchmark(json.loads, body)
+        assert len(data["data"]) == items
+
+
+class TestSchemaValidation:
+    """
+    Cost of validating a whole body against its cached validator
+    """
+
+    @pytest.fixture(scope="class")
+    def registry(self):
+        """Validators compiled once, as the session fixture does"""
+        return default_registry()
+
+    def test_user_body(self, benchmark, registry, authed_client):
+        """GET /users/{id} body, the shape TestUserAPI checks"""
+        data = authed_client.get("/users/12345").json()
+        benchmark(registry.validate_body, "GET", "/users/12345", 200, data)
+
+    @pytest.mark.parametrize("items", [10, 100])
+    def test_products_page(self, benchmark, registry, mock_api, items):
+        """GET /products page, the body validated on every load-test response"""
+        data = (
+            APIClient(mock_api.base_url)
+            .get("/products", params={"page": 1, "limit": items})
+            .json()
+        )
+        benchmark(registry.validate_body, "GET", "/products", 200, data)
+
+
+class TestThroughputCeiling:
+    """
+    Requests per second each client style can drive against loopback
+    """
+
+    def record(self, benchmark):
+        """Attach requests/second to the benchmark results"""
+        # No stats when benchmarking is disabled (--benchmark-disable, xdist)
+        if benchmark.stats is None:
+            return
+        benchmark.extra_info["requests_per_second"] = round(
+            THROUGHPUT_REQUESTS / benchmark.stats.stats.median, 1
+        )
+
+    def test_sync_sequential(self, benchmark, mock_api):
+        """One APIClient, one request at a time"""
+        client = APIClient(mock_api.base_url)
+
+        def run():
+            for _ in range(THROUGHPUT_REQUESTS):
+                client.get("/products", params={"page": 1, "limit": 10})
+
+        benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+        self.record(benchmark)
+
+    def test_sync_threaded(self, benchmark, mock_api):
+        """APIClient per thread, 8 threads"""
+        workers = 8
+        clients = [APIClient(mock_api.base_url) for _ in range(workers)]
+        per_worker = THROUGHPUT_REQUESTS // workers
+
+        def drive(client):
+            for _ in range(per_worker):
+                client.get("/products", params={"page": 1, "limit": 10})
+
+        def run():
+            with ThreadPoolExecutor(workers) as pool:
+                list(pool.map(drive, clients))
+
+        benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+        self.record(benchmark)
+
+    def test_async_gather(self, benchmark, mock_api):
+        """AsyncAPIClient.gather with 50 requests in flight"""
+        calls = [
+            ("GET", "/products", {"params": {"page": 1, "limit": 10}})
+        ] * THROUGHPUT_REQUESTS
+
+        async def gather():
+            async with AsyncAPIClient(mock_api.base_url, concurrency=50) as client:
+                return await client.gather(calls)
+
+        # A coroutine can only run once, so each round gets a fresh one
+        responses = benchmark.pedantic(
+            asyncio.run, setup=lambda: ((gather(),), {}), rounds=5, warmup_rounds=1
+        )
+        assert all(r.status_code == 200 for r in responses)
+        self.record(benchmark)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the API test suites
+Author: QA Team
+Date: 2026-10-18
+"""
+
+import os
+import secrets
+
+import pytest
+
+import slo_plugin
+from api_client import APIClient
+from cassette import RECORD, REPLAY, Cassette
+from data_factory import UserFactory, worker_id
+from metrics_exporter import MetricsExporter
+from mock_server import MockAPIServer
+from resource_tracker import ResourceTracker
+from result_store import ResultWriter
+from schema_registry import default_registry
+from slo import Budgets
+from token_cache import TokenCache
+
+
+def pytest_addoption(parser):
+    """Target selection for the API suites"""
+    group = parser.getgroup("api", "API target")
+    group.addoption(
+        "--api-url",
+        default=os.environ.get("API_BASE_URL", "https://api.example.com/v1"),
+        help="Base URL of the API under test (env: API_BASE_URL)",
+    )
+    group.addoption(
+        "--mock-api",
+        action="store_true",
+        help="Run against the bundled in-process mock API instead of --api-url",
+    )
+    group.addoption(
+        "--mock-latency",
+        type=float,
+        default=0.0,
+        help="Seconds of latency the mock API adds to every response",
+    )
+    group.addoption(
+        "--mock-error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of mock API requests that fail with HTTP 500",
+    )
+    group.addoption(
+        "--cassette",
+        default=None,
+        help="Cassette file for the functional suites' API traffic",
+    )
+    group.addoption(
+        "--cassette-mode",
+        choices=(RECORD, REPLAY),
+        default=REPLAY,
+        help="Record traffic to --cassette (single process only), or replay "
+        "it with no network",
+    )
+    group.addoption(
+        "--replay-latency",
+        action="store_true",
+        help="Replayed responses take as long as the recorded ones",
+    )
+    group.addoption(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve live APIClient metrics at http://127.0.0.1:PORT/metrics "
+        "(pytest-xdist worker gwN uses PORT+N+1)",
+    )
+    group.addoption(
+        "--metrics-file",
+        default=None,
+        help="Also rewrite live metrics to this file (suffixed per xdist worker)",
+    )
+    group.addoption(
+        "--results",
+        default=None,
+        help="Append every APIClient request sample to this binary result "
+        "file (suffixed per xdist worker); analyse with result_store.py",
+    )
+    slo_plugin.add_options(parser)
+
+
+def pytest_configure(config):
+    """Budget verdict, live metrics and sample recording for the session"""
+    slo_plugin.configure(config)
+    worker = worker_id()
+    recording = config.getoption("--cassette-mode") == RECORD
+    if config.getoption("--cassette") and recording:
+        # Workers would truncate and rewrite the same file; a per-worker
+        # cassette could not be replayed with a different test split
+        if worker != "main" or getattr(config.option, "numprocesses", None):
+            raise pytest.UsageError(
+                "--cassette-mode record cannot run under pytest-xdist; "
+                "record without -n"
+            )
+    results = config.getoption("--results")
+    if results:
+        path = results if worker == "main" else f"{results}.{worker}"
+        config.result_writer = ResultWriter(path).attach()
+    port = config.getoption("--metrics-port")
+    path = config.getoption("--metrics-file")
+    if port is None and not path:
+        return
+    if worker != "main":
+        port = port + int(worker.lstrip("gw")) + 1 if port is not None else None
+        path = f"{path}.{worker}" if path else None
+    config.metrics_exporter = MetricsExporter(port=port, path=path).start()
+
+
+def pytest_unconfigure(config):
+    """Stop the live metrics exporter and close the result file"""
+    exporter = getattr(config, "metrics_exporter", None)
+    if exporter is not None:
+        exporter.stop()
+    writer = getattr(config, "result_writer", None)
+    if writer is not None:
+        writer.close()
+
+
+@pytest.fixture(scope="session")
+def mock_api():
+    """Local mock API server shared by the whole session"""
+    with MockAPIServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def api_credentials():
+    """Login body of the test account (the mock server's built-in user)"""
+    return {"email": "testuser@example.com", "password": "Test@1234"}
+
+
+@pytest.fixture(scope="session")
+def api_base_url(request):
+    """Base URL of the API under test (the mock server with --mock-api)"""
+    config = request.config
+    if not config.getoption("--mock-api"):
+        yield config.getoption("--api-url")
+        return
+    with MockAPIServer(
+        latency=config.getoption("--mock-latency"),
+        error_rate=config.getoption("--mock-error-rate"),
+        seed=0,
+    ) as server:
+        yield server.base_url
+
+
+@pytest.fixture(scope="session")
+def cassette(request):
+    """Cassette from --cassette, or None to talk to the API directly"""
+    config = request.config
+    path = config.getoption("--cassette")
+    if not path:
+        yield None
+        return
+    with Cassette(
+        path,
+        mode=config.getoption("--cassette-mode"),
+        replay_latency=config.getoption("--replay-latency"),
+    ) as tape:
+        yield tape
+
+
+@pytest.fixture(scope="session")
+def rate_limited_api_url(request, api_base_url):
+    """
+    API URL for rate-limit tests; with --mock-api a dedicated mock
+    enforcing the documented 100 requests/minute so other tests keep
+    their own quota
+    """
+    if not request.config.getoption("--mock-api"):
+        yield api_base_url
+        return
+    with MockAPIServer(rate_limit=100, rate_window=60) as server:
+        yield server.base_url
+
+
+@pytest.fixture(scope="session")
+def token_cache(tmp_path_factory):
+    """Login token cache shared by all tests and pytest-xdist workers"""
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        # Workers get sibling basetemps; their common parent is shared
+        root = root.parent
+    return TokenCache(root / "auth-tokens")
+
+
+@pytest.fixture(scope="session")
+def resource_tracker(api_base_url, api_credentials, token_cache, cassette):
+    """
+    Everything created through tracked clients, deleted concurrently when
+    the session ends
+    """
+    tracker = ResourceTracker()
+    yield tracker
+    # Replayed creations never reached a server
+    if not len(tracker) or (cassette is not None and cassette.mode == REPLAY):
+        return
+    token = token_cache.get_token(APIClient(api_base_url), api_credentials)
+    print(f"\n{tracker.cleanup(api_base_url, token)}")
+
+
+@pytest.fixture(scope="session")
+def user_factory(resource_tracker, cassette):
+    """Unique test users for this worker"""
+    if cassette is None:
+        return UserFactory(tracker=resource_tracker)
+    # Replay must regenerate exactly the users that were recorded
+    run = cassette.meta.setdefault("user_factory_run", secrets.token_hex(3))
+    return UserFactory(tracker=resource_tracker, seed=0, run=run)
+
+
+@pytest.fixture(scope="session")
+def schema_registry():
+    """Response schemas for the API contract, compiled once per session"""
+    return default_registry()
+
+
+@pytest.fixture(scope="session")
+def slo_budgets(request):
+    """Budgets from --slo-budgets, for tests judging their own runs"""
+    return Budgets.load(request.config.getoption("--slo-budgets"))
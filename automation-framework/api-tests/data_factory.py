@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test Data Factory
+Author: QA Team
+Date: 2026-10-18
+Framework: Faker with aiohttp bulk creation
+
+Hands out pre-generated users whose emails are unique per pytest-xdist
+worker and per run, so create/delete tests can run in parallel without
+colliding on EMAIL_ALREADY_EXISTS. Created users go to a ResourceTracker
+for deletion at teardown.
+"""
+
+import asyncio
+import os
+import secrets
+import threading
+from collections import deque
+
+from faker import Faker
+
+from async_api_client import AsyncAPIClient
+
+
+def worker_id():
+    """pytest-xdist worker name, or 'main' outside xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+class UserFactory:
+    """
+    Pool of unique user payloads for POST /users
+
+    Users are generated `pool_size` at a time and popped in O(1). The email
+    local part carries the worker name, a per-run token and a counter, so
+    it stays unique across workers, across runs against a shared API and
+    across refills. Users created through bulk_create() are recorded in
+    `tracker` (create() relies on the client's own tracker).
+    """
+
+    def __init__(
+        self,
+        pool_size=200,
+        domain="example.com",
+        seed=None,
+        concurrency=20,
+        tracker=None,
+        run=None,
+    ):
+        self.pool_size = pool_size
+        self.domain = domain
+        self.concurrency = concurrency
+        self.worker = worker_id()
+        self.run = run or secrets.token_hex(3)
+        self.faker = Faker()
+        if seed is not None:
+            self.faker.seed_instance(f"{seed}:{self.worker}")
+        self.tracker = tracker
+        self.pool = deque()
+        self.generated = 0
+        self.lock = threading.Lock()
+
+    def generate(self):
+        """One new user payload"""
+        self.generated += 1
+        first, last = self.faker.first_name(), self.faker.last_name()
+        local = f"{first}.{last}.{self.worker}.{self.run}.{self.generated}"
+        return {
+            "email": f"{local.lower()}@{self.domain}",
+            "firstName": first,
+            "lastName": last,
+            "password": self.faker.password(length=14, special_chars=True),
+            "phone": self.faker.numerify("+1##########"),
+        }
+
+    def refill(self, count=None):
+        """Pre-generate another batch of users"""
+        with self.lock:
+            for _ in range(count or self.pool_size):
+                self.pool.append(self.generate())
+
+    def build(self, **overrides):
+        """Take the next unused user payload, with optional field overrides"""
+        while True:
+            try:
+                user = self.pool.popleft()
+                break
+            except IndexError:
+                self.refill()
+        user.update(overrides)
+        return user
+
+    def create(self, client, user=None):
+        """POST a user through an APIClient"""
+        user = user if user is not None else self.build()
+        return client.post("/users", json_data=user)
+
+    def async_client(self, client):
+        """AsyncAPIClient sharing an APIClient's base URL and token"""
+        bulk = AsyncAPIClient(client.base_url, concurrency=self.concurrency)
+        if client.token:
+            bulk.set_auth_token(client.token)
+        return bulk
+
+    def bulk_create(self, client, count):
+        """Create `count` users concurrently; returns the responses"""
+        users = [self.build() for _ in range(count)]
+        calls = [("POST", "/users", {"json_data": user}) for user in users]
+
+        async def run():
+            async with self.async_client(client) as bulk:
+                return await bulk.gather(calls)
+
+        responses = asyncio.run(run())
+        if self.tracker is not None:
+            for response in responses:
+                self.tracker.record(client.base_url, "/users", response)
+        return responses
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Distributed Load Runner
+Author: QA Team
+Date: 2026-10-18
+Framework: load_engine workers in separate processes over a TCP socket
+
+One Python process tops out on a single core (GIL, JSON and TLS work), so
+the coordinator splits a LoadProfile evenly across N worker processes,
+starts them together and merges their phase histograms, counters and
+per-endpoint SLOCollector data into one LoadResult. Local workers are
+spawned as subprocesses; workers on other hosts join over the same
+newline-delimited JSON protocol:
+
+    python distributed.py coordinator --api-url http://api:8080/v1 \
+        --profile load --peak 400 --rps --workers 4 --remote 2 --port 7070
+    python distributed.py worker --connect coordinator-host:7070
+
+Virtual users are dealt out to workers in turn and rps targets are
+divided evenly (see LoadEngine `partition`).
+"""
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from api_client import APIClient
+from load_engine import PROFILES, LoadEngine, LoadProfile, LoadResult, PhaseStats
+from slo import SLOCollector
+
+DEFAULT_TASK = "distributed:fetch_products"
+
+# Head start given to every worker so all phases begin at the same instant
+START_DELAY = 1.0
+
+# Seconds a worker gets to exit after its connection closes
+EXIT_TIMEOUT = 10.0
+
+
+def fetch_products(client):
+    """Default task: one product page"""
+    return client.get("/products", params={"page": 1, "limit": 10})
+
+
+def resolve(path):
+    """Callable named by a "module:attribute" path"""
+    module, _, name = path.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def send(stream, message):
+    """Write one JSON message line"""
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def receive(stream):
+    """Read one JSON message line, or None once the peer has gone"""
+    line = stream.readline()
+    return json.loads(line) if line else None
+
+
+class DistributedResult:
+    """
+    Merged LoadResult and per-endpoint collector of all workers
+    """
+
+    def __init__(self, result, collector, workers):
+        self.result = result
+        self.collector = collector
+        self.workers = workers
+
+    def summary(self):
+        """Load summary with the worker count"""
+        return f"{self.result.summary()}\n  workers={len(self.workers)}"
+
+
+class Coordinator:
+    """
+    Splits a profile across workers and merges their results
+
+    `workers` local worker processes are spawned; `remote` more are
+    expected to connect from elsewhere to `host`:`port` (0 picks a free
+    port, see `address` once listening). `task` is a "module:function"
+    path importable by every worker.
+    """
+
+    def __init__(
+        self,
+        api_url,
+        profile,
+        task=DEFAULT_TASK,
+        workers=2,
+        remote=0,
+        host="127.0.0.1",
+        port=0,
+        connect_timeout=30.0,
+    ):
+        self.api_url = api_url
+        self.profile = profile
+        self.task = task
+        self.local = workers
+        self.expected = workers + remote
+        self.connect_timeout = connect_timeout
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()[:2]
+        self.processes = []
+        self.connections = []
+
+    def spawn(self):
+        """Start the local worker processes"""
+        host, port = self.address
+        command = [sys.executable, os.path.abspath(__file__), "worker"]
+        command += ["--connect", f"{host}:{port}"]
+        for _ in range(self.local):
+            self.processes.append(
+                subprocess.Popen(command, cwd=os.path.dirname(__file__))
+            )
+
+    def accept(self):
+        """
+        Wait for every expected worker to say hello
+
+        Connections go straight into `connections`, so the ones made before
+        a timeout are still closed by run() and their workers exit.
+        """
+        deadline = time.monotonic() + self.connect_timeout
+        while len(self.connections) < self.expected:
+            try:
+                self.server.settimeout(max(deadline - time.monotonic(), 0.001))
+                connection, _ = self.server.accept()
+                stream = connection.makefile("rwb")
+                self.connections.append((connection, stream, None))
+                connection.settimeout(max(deadline - time.monotonic(), 0.001))
+                hello = receive(stream)
+            except socket.timeout:
+                raise RuntimeError(
+                    f"Only {len(self.connections)} of {self.expected} workers "
+                    "connected"
+                ) from None
+            if hello is None:
+                raise RuntimeError("Worker closed its connection before saying hello")
+            connection.settimeout(None)
+            self.connections[-1] = (connection, stream, hello)
+
+    def stop(self):
+        """Close every connection and reap the local workers"""
+        for connection, stream, _ in self.connections:
+            stream.close()
+            connection.close()
+        self.server.close()
+        for process in self.processes:
+            try:
+                process.wait(EXIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+                try:
+                    process.wait(EXIT_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+
+    def run(self):
+        """Run the profile on all workers and return a DistributedResult"""
+        self.spawn()
+        try:
+            self.accept()
+            connections = self.connections
+            start_at = time.time() + START_DELAY
+            for index, (_, stream, _) in enumerate(connections):
+                send(
+                    stream,
+                    {
+                        "type": "run",
+                        "api_url": self.api_url,
+                        "task": self.task,
+                        "profile": self.profile.to_dict(),
+                        "partition": [index, len(connections)],
+                        "start_at": start_at,
+                    },
+                )
+            replies = [receive(stream) for _, stream, _ in connections]
+        finally:
+            self.stop()
+        return self.merge([hello for _, _, hello in connections], replies)
+
+    def merge(self, workers, replies):
+        """Fold every worker's reply into one result"""
+        phases = [PhaseStats(phase.name) for phase in self.profile.phases]
+        collector = SLOCollector()
+        for worker, reply in zip(workers, replies):
+            if reply is None or reply["type"] != "result":
+                message = reply["message"] if reply else "connection lost"
+                raise RuntimeError(f"Worker {worker['name']} failed: {message}")
+            for merged, data in zip(phases, reply["phases"]):
+                merged.merge(PhaseStats.from_dict(data))
+            collector.merge(SLOCollector.from_dict(reply["collector"]))
+        return DistributedResult(LoadResult(self.profile, phases), collector, workers)
+
+
+def run_worker(address):
+    """Connect to a coordinator, run the share it sends and report back"""
+    host, _, port = address.rpartition(":")
+    with socket.create_connection((host, int(port))) as connection:
+        stream = connection.makefile("rwb")
+        send(stream, {"type": "hello", "name": f"{socket.gethostname()}:{os.getpid()}"})
+        order = receive(stream)
+        if order is None:
+            return
+        try:
+            collector = SLOCollector()
+            engine = LoadEngine(
+                lambda: APIClient(order["api_url"], recorder=collector),
+                resolve(order["task"]),
+                LoadProfile.from_dict(order["profile"]),
+                partition=tuple(order["partition"]),
+            )
+            time.sleep(max(order["start_at"] - time.time(), 0))
+            result = engine.run()
+            reply = {
+                "type": "result",
+                "phases": [phase.to_dict() for phase in result.phases],
+                "collector": collector.to_dict(),
+            }
+        except Exception as exc:
+            reply = {"type": "error", "message": f"{type(exc).__name__}: {exc}"}
+        send(stream, reply)
+        stream.close()
+
+
+def main():
+    """Command line entry point for coordinator and worker roles"""
+    parser = argparse.ArgumentParser(description="Multi-process load runner")
+    roles = parser.add_subparsers(dest="role", required=True)
+    worker = roles.add_parser("worker")
+    worker.add_argument("--connect", required=True, help="coordinator host:port")
+    coordinator = roles.add_parser("coordinator")
+    coordinator.add_argument("--api-url", required=True)
+    coordinator.add_argument("--profile", choices=sorted(PROFILES), default="load")
+    coordinator.add_argument("--peak", type=float, default=20)
+    coordinator.add_argument("--duration", type=float, default=60.0)
+    coordinator.add_argument("--rps", action="store_true", help="peak is req/s")
+    coordinator.add_argument("--task", default=DEFAULT_TASK)
+    coordinator.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    coordinator.add_argument("--remote", type=int, default=0)
+    coordinator.add_argument("--host", default="127.0.0.1")
+    coordinator.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.role == "worker":
+        run_worker(args.connect)
+        return
+
+    profile = PROFILES[args.profile](args.peak, args.duration)
+    if args.rps:
+        profile = LoadProfile(profile.name, profile.phases, LoadProfile.RPS)
+    runner = Coordinator(
+        args.api_url,
+        profile,
+        task=args.task,
+        workers=args.workers,
+        remote=args.remote,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Coordinator listening on {runner.address[0]}:{runner.address[1]}")
+    outcome = runner.run()
+    print(outcome.summary())
+    print(outcome.collector.report())
+
+
+if __name__ == "__main__":
+    main()
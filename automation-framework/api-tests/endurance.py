@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Endurance Runs
+Author: QA Team
+Date: 2026-10-18
+Framework: load_engine with rolling windows and trend detection
+
+Runs a LoadEngine task for hours in constant memory. Every `window`
+seconds the current window's stats (throughput, percentiles, error rate,
+harness memory) are appended as one JSON line to a snapshot file and the
+window is reset, so nothing grows with the run length except the file.
+At the end the window series is checked for latency drift, throughput
+decay and rising errors: the leak-like trends Section 2.3 of the
+performance testing guide asks endurance runs to catch.
+
+    python endurance.py --api-url http://localhost:8080/v1 --hours 8 \
+        --users 20 --out endurance.jsonl
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from api_client import APIClient
+from load_engine import LoadEngine, PhaseStats, endurance_profile
+
+SNAPSHOT_PERCENTILES = (50, 90, 95, 99)
+
+
+def process_rss():
+    """Resident memory of this process in bytes, or None if unavailable"""
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class WindowRecorder:
+    """
+    Rolling fixed-length windows of request outcomes
+
+    Pass `record` as a LoadEngine observer. A background thread closes a
+    window every `window` seconds, appends its snapshot to `path` (JSON
+    lines, flushed each time) and keeps the last `history` snapshots for
+    trend analysis.
+    """
+
+    def __init__(self, path=None, window=60.0, history=1440):
+        self.path = path
+        self.window = window
+        self.history = deque(maxlen=history)
+        self.index = 0
+        # Held by record() and by the swap in rotate(), so no sample lands
+        # in a window that has already been written out
+        self.lock = threading.Lock()
+        self.current = self.new_window()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.file = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def new_window(self):
+        """Fresh stats for the next window"""
+        stats = PhaseStats(f"window-{self.index}")
+        stats.started = time.perf_counter()
+        stats.wall_start = time.time()
+        return stats
+
+    def record(self, status, latency, ok):
+        """LoadEngine observer"""
+        with self.lock:
+            self.current.record(status, latency, ok)
+
+    def start(self):
+        """Open the snapshot file and start rotating windows"""
+        if self.path is not None:
+            self.file = open(self.path, "a", encoding="utf-8")
+        self.stop_event.clear()
+        with self.lock:
+            self.current = self.new_window()
+        self.thread = threading.Thread(target=self.rotate_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Close the last (partial) window and the file"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.rotate()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def rotate_loop(self):
+        """Close a window every `window` seconds"""
+        deadline = time.perf_counter() + self.window
+        while not self.stop_event.wait(max(deadline - time.perf_counter(), 0)):
+            self.rotate()
+            deadline += self.window
+
+    def rotate(self):
+        """Snapshot the current window and start the next one"""
+        with self.lock:
+            stats = self.current
+            self.index += 1
+            self.current = self.new_window()
+        stats.ended = time.perf_counter()
+        if not stats.requests and stats.elapsed < self.window / 2:
+            return
+        snapshot = self.snapshot(stats)
+        self.history.append(snapshot)
+        if self.file is not None:
+            self.file.write(json.dumps(snapshot) + "\n")
+            self.file.flush()
+
+    def snapshot(self, stats):
+        """JSON-serialisable summary of one closed window"""
+        with stats.lock:
+            histogram = stats.histogram
+            snapshot = {
+                "window": self.index - 1,
+                "start": round(stats.wall_start, 3),
+                "seconds": round(stats.elapsed, 3),
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "error_rate": round(stats.error_rate, 6),
+                "throughput": round(stats.throughput, 3),
+                "mean": round(histogram.mean, 6),
+                "max": round(histogram.max, 6),
+                "status_counts": {str(k): v for k, v in stats.status_counts.items()},
+                "harness_rss": process_rss(),
+            }
+            for percent in SNAPSHOT_PERCENTILES:
+                snapshot[f"p{percent}"] = round(histogram.percentile(percent), 6)
+        return snapshot
+
+
+def ranks(values):
+    """Average ranks (1-based), ties sharing their mean rank"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    result = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            result[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return result
+
+
+def spearman(values):
+    """Rank correlation of a series with time (-1 falling .. 1 rising)"""
+    n = len(values)
+    if n < 3:
+        return 0.0
+    x, y = ranks(list(range(n))), ranks(values)
+    mean = (n + 1) / 2
+    covariance = sum((a - mean) * (b - mean) for a, b in zip(x, y))
+    spread = (sum((a - mean) ** 2 for a in x) * sum((b - mean) ** 2 for b in y)) ** 0.5
+    return covariance / spread if spread else 0.0
+
+
+def median(values):
+    """Median of a non-empty list"""
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+class Trend:
+    """
+    Direction and size of change of one metric across the run
+
+    `change` compares the median of the last quarter of windows with the
+    first quarter; `correlation` (Spearman) says how steadily it moved.
+    A metric drifts when it moves the bad way by more than `threshold`
+    and the movement is steady rather than one noisy window.
+    """
+
+    def __init__(self, metric, values, worse="up", threshold=0.25, steadiness=0.6):
+        self.metric = metric
+        self.windows = len(values)
+        quarter = max(len(values) // 4, 1)
+        self.first = median(values[:quarter]) if values else 0.0
+        self.last = median(values[-quarter:]) if values else 0.0
+        if self.first:
+            self.change = (self.last - self.first) / self.first
+        else:
+            self.change = 0.0 if not self.last else float("inf")
+        self.correlation = spearman(values)
+        sign = 1 if worse == "up" else -1
+        self.drifting = (
+            len(values) >= 4
+            and sign * self.change > threshold
+            and sign * self.correlation >= steadiness
+        )
+
+    def __repr__(self):
+        flag = "DRIFT" if self.drifting else "stable"
+        return (
+            f"{self.metric:<10} {self.first:>10.4f} -> {self.last:<10.4f} "
+            f"change={self.change:+.1%} rho={self.correlation:+.2f} {flag}"
+        )
+
+
+def detect_drift(history, threshold=0.25, steadiness=0.6):
+    """Trends of latency, throughput and errors over window snapshots"""
+    windows = [w for w in history if w["requests"]]
+    trends = [
+        Trend(
+            metric,
+            [w[metric] for w in windows],
+            worse=worse,
+            threshold=threshold,
+            steadiness=steadiness,
+        )
+        for metric, worse in (
+            ("p50", "up"),
+            ("p95", "up"),
+            ("p99", "up"),
+            ("throughput", "down"),
+        )
+    ]
+    # Error rates start at zero, so judge them by absolute increase
+    errors = Trend("error_rate", [w["error_rate"] for w in windows])
+    errors.drifting = (
+        len(windows) >= 4
+        and errors.last - errors.first > 0.01
+        and errors.correlation >= steadiness
+    )
+    trends.append(errors)
+    return trends
+
+
+class EnduranceResult:
+    """
+    LoadResult of the run plus its window history and trends
+    """
+
+    def __init__(self, result, history, trends):
+        self.result = result
+        self.history = list(history)
+        self.trends = trends
+
+    @property
+    def drifting(self):
+        """Trends that moved the wrong way"""
+        return [trend for trend in self.trends if trend.drifting]
+
+    def summary(self):
+        """Load summary followed by one line per trend"""
+        lines = [self.result.summary(), f"Windows: {len(self.history)}"]
+        lines.extend(f"  {trend!r}" for trend in self.trends)
+        return "\n".join(lines)
+
+
+class EnduranceRunner:
+    """
+    LoadEngine run with windowed snapshots and drift detection
+    """
+
+    def __init__(
+        self,
+        client_factory,
+        task,
+        profile,
+        path=None,
+        window=60.0,
+        check=None,
+        threshold=0.25,
+    ):
+        self.client_factory = client_factory
+        self.task = task
+        self.profile = profile
+        self.path = path
+        self.window = window
+        self.check = check
+        self.threshold = threshold
+
+    def run(self):
+        """Run the profile and return an EnduranceResult"""
+        with WindowRecorder(self.path, self.window) as windows:
+            engine = LoadEngine(
+                self.client_factory,
+                self.task,
+                self.profile,
+                check=self.check,
+                observer=windows.record,
+            )
+            result = engine.run()
+        return EnduranceResult(
+            result, windows.history, detect_drift(windows.history, self.threshold)
+        )
+
+
+def main():
+    """Command line endurance run against GET /products"""
+    parser = argparse.ArgumentParser(description="Endurance run of GET /products")
+    parser.add_argument("--api-url", required=True)
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--users", type=int, default=10, help="peak users")
+    parser.add_argument("--window", type=float, default=60.0, help="seconds")
+    parser.add_argument("--out", default="endurance.jsonl")
+    args = parser.parse_args()
+
+    runner = EnduranceRunner(
+        lambda: APIClient(args.api_url),
+        lambda client: client.get("/products", params={"page": 1, "limit": 10}),
+        endurance_profile(args.users, args.hours * 3600),
+        path=args.out,
+        window=args.window,
+    )
+    outcome = runner.run()
+    print(outcome.summary())
+    raise SystemExit(1 if outcome.drifting else 0)
+
+
+if __name__ == "__main__":
+    main()
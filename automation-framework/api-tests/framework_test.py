@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Framework Support Test Suite
+Author: QA Team
+Date: 2026-10-18
+Framework: pytest against private MockAPIServer instances
+
+Direct tests of the harness building blocks the API suites lean on, so a
+broken cache or budget shows up here rather than as a vacuous pass there.
+"""
+
+import json
+import threading
+
+import pytest
+import requests
+
+from api_client import APIClient
+from cassette import RECORD, REPLAY, Cassette, CassetteMiss
+from mock_server import API_PREFIX, MockAPIServer
+from pagination import JSONArrayStream
+from rate_limit import burst
+from resilience import RetryPolicy
+from slo import Budgets, SLOCollector
+from token_cache import TokenCache
+
+CREDENTIALS = {"email": "testuser@example.com", "password": "Test@1234"}
+
+# Nothing listens here, so replay must not open a socket
+OFFLINE_URL = f"http://127.0.0.1:9{API_PREFIX}"
+
+
+@pytest.mark.no_slo
+class TestTokenCache:
+    """
+    Login reuse, refresh and invalidation against the mock's auth endpoints
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Private server so revoking tokens cannot disturb other tests"""
+        with MockAPIServer() as server:
+            self.server = server
+            yield
+
+    def test_token_reused_across_clients_and_caches(self, tmp_path):
+        """
+        A second cache on the same directory (another worker) skips login
+        """
+        first = TokenCache(tmp_path)
+        second = TokenCache(tmp_path)
+
+        token = first.get_token(APIClient(self.server.base_url), CREDENTIALS)
+        assert first.get_token(APIClient(self.server.base_url), CREDENTIALS) == token
+        assert second.get_token(APIClient(self.server.base_url), CREDENTIALS) == token
+        assert (first.logins, second.logins, second.refreshes) == (1, 0, 0)
+
+    def test_refresh_inside_margin(self, tmp_path):
+        """
+        A token within `refresh_margin` of expiry is renewed, not re-issued
+        """
+        cache = TokenCache(tmp_path, refresh_margin=3600 + 60)
+        client = APIClient(self.server.base_url)
+
+        first = cache.get_token(client, CREDENTIALS)
+        second = cache.get_token(client, CREDENTIALS)
+
+        assert second != first
+        assert (cache.logins, cache.refreshes) == (1, 1)
+        client.set_auth_token(second)
+        assert client.get("/users/12345").status_code == 200
+
+    def test_login_when_refresh_fails(self, tmp_path):
+        """
+        A rejected refresh token falls back to a full login
+        """
+        cache = TokenCache(tmp_path, refresh_margin=3600 + 60)
+        client = APIClient(self.server.base_url)
+        cache.get_token(client, CREDENTIALS)
+        self.server.httpd.state.refresh_tokens.clear()
+
+        assert cache.get_token(client, CREDENTIALS)
+        assert (cache.logins, cache.refreshes) == (2, 1)
+
+    def test_concurrent_workers_log_in_once(self, tmp_path):
+        """
+        Caches in parallel threads are serialised by the flock alone
+        """
+        caches = [TokenCache(tmp_path) for _ in range(8)]
+        tokens = []
+        barrier = threading.Barrier(len(caches))
+
+        def worker(cache):
+            barrier.wait()
+            tokens.append(cache.get_token(APIClient(self.server.base_url), CREDENTIALS))
+
+        threads = [threading.Thread(target=worker, args=(c,)) for c in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(tokens)) == 1
+        assert sum(cache.logins for cache in caches) == 1
+
+    def test_rejected_token_is_invalidated(self, tmp_path):
+        """
+        A 401 for the cached token drops it so the next test logs in again
+        """
+        cache = TokenCache(tmp_path)
+        client = APIClient(self.server.base_url)
+        revoked = cache.authorize(client, CREDENTIALS)
+        self.server.httpd.state.access_tokens.clear()
+
+        assert client.get("/users/12345").status_code == 401
+        fresh = APIClient(self.server.base_url)
+        assert cache.authorize(fresh, CREDENTIALS) != revoked
+        assert cache.logins == 2
+        assert fresh.get("/users/12345").status_code == 200
+
+
+@pytest.mark.no_slo
+class TestCassette:
+    """
+    Record against a live mock, replay with the server gone
+    """
+
+    def record(self, path, latency=0.0):
+        """Record a short session and return its responses"""
+        with MockAPIServer(latency=latency) as server:
+            with Cassette(path, mode=RECORD) as cassette:
+                cassette.meta["seed"] = "abc123"
+                client = APIClient(server.base_url, cassette=cassette)
+                return [
+                    client.get("/products", params={"limit": 5, "page": 2}),
+                    client.post("/auth/login", json_data=CREDENTIALS),
+                    client.post("/auth/login", json_data=CREDENTIALS),
+                    client.get("/users/12345"),
+                ]
+
+    def test_round_trip(self, tmp_path):
+        """
+        Replayed responses match the recorded ones, in recorded order
+        """
+        path = tmp_path / "session.cas"
+        recorded = self.record(path)
+
+        with Cassette(path, mode=REPLAY) as cassette:
+            client = APIClient(OFFLINE_URL, cassette=cassette)
+            replayed = [
+                client.get("/products", params={"page": 2, "limit": 5}),
+                client.post("/auth/login", json_data=CREDENTIALS),
+                client.post("/auth/login", json_data=CREDENTIALS),
+                client.get("/users/12345"),
+            ]
+            assert len(cassette) == 4
+            assert cassette.meta == {"seed": "abc123"}
+
+        for before, after in zip(recorded, replayed):
+            assert after.status_code == before.status_code
+            assert after.headers == before.headers
+            assert after.content == before.content
+        first, second = (r.json()["accessToken"] for r in replayed[1:3])
+        assert first != second
+
+    def test_replay_miss(self, tmp_path):
+        """
+        An unrecorded request fails loudly instead of reaching the network
+        """
+        path = tmp_path / "session.cas"
+        self.record(path)
+
+        with Cassette(path, mode=REPLAY) as cassette:
+            client = APIClient(OFFLINE_URL, cassette=cassette)
+            with pytest.raises(CassetteMiss, match="/products\\?limit=5&page=3"):
+                client.get("/products", params={"page": 3, "limit": 5})
+            # Identical requests past the recorded count reuse the last one
+            client.get("/users/12345")
+            assert client.get("/users/12345").status_code == 401
+
+    def test_body_selects_response(self, tmp_path):
+        """
+        Requests differing only in body replay by body, not by call order
+        """
+        path = tmp_path / "logins.cas"
+        wrong = {"email": CREDENTIALS["email"], "password": "wrong"}
+        with MockAPIServer() as server:
+            with Cassette(path, mode=RECORD) as cassette:
+                client = APIClient(server.base_url, cassette=cassette)
+                assert client.post("/auth/login", json_data=CREDENTIALS).ok
+                assert client.post("/auth/login", json_data=wrong).status_code == 401
+
+        with Cassette(path, mode=REPLAY) as cassette:
+            client = APIClient(OFFLINE_URL, cassette=cassette)
+            assert client.post("/auth/login", json_data=wrong).status_code == 401
+            assert client.post("/auth/login", json_data=CREDENTIALS).ok
+            with pytest.raises(CassetteMiss, match="/auth/login #"):
+                client.post("/auth/login", json_data={"email": "x@example.com"})
+
+    def test_realtime_replay(self, tmp_path):
+        """
+        With replay_latency responses take as long as when recorded
+        """
+        path = tmp_path / "slow.cas"
+        self.record(path, latency=0.05)
+
+        for realtime in (False, True):
+            with Cassette(path, mode=REPLAY, replay_latency=realtime) as cassette:
+                client = APIClient(OFFLINE_URL, cassette=cassette)
+                timing = client.get("/products", params={"limit": 5, "page": 2}).timing
+            if realtime:
+                assert timing.total >= 0.05
+            else:
+                assert timing.total < 0.05
+
+
+class TestJSONArrayStream:
+    """
+    Incremental array decoding with tokens split across chunk boundaries
+    """
+
+    BODY = json.dumps(
+        {
+            "meta": {"note": 'quote " and backslash \\ before "data"'},
+            "data": [
+                {"name": 'Say \\"hi\\"', "tags": ["a", ["b", ["c"]], []]},
+                12345,
+                -1.5e3,
+                "caf\u00e9 \u2603 \\u0041",
+                [[1, 2], [3, [4, 5]]],
+                {"empty": {}, "null": None, "flags": [True, False]},
+                "",
+            ],
+            "links": {"next": "/products?page=2"},
+        },
+        ensure_ascii=False,
+        indent=1,
+    ).encode("utf-8")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7])
+    def test_matches_json_loads(self, chunk_size):
+        """
+        Every chunking yields the same items and remainder as json.loads
+        """
+        chunks = [
+            self.BODY[i : i + chunk_size] for i in range(0, len(self.BODY), chunk_size)
+        ]
+        expected = json.loads(self.BODY)
+
+        stream = JSONArrayStream(chunks)
+        assert list(stream) == expected["data"]
+        assert stream.count == len(expected["data"])
+        assert stream.document == {**expected, "data": None}
+
+    def test_truncated_body(self):
+        """
+        A body cut off inside the array is an error, not a short listing
+        """
+        with pytest.raises(ValueError, match="Unterminated 'data' array"):
+            list(JSONArrayStream([self.BODY[: self.BODY.index(b"12345")]]))
+
+
+class TestBudgets:
+    """
+    Budget file parsing, verdicts and the xdist collector hand-off
+    """
+
+    BUDGETS = """
+defaults:
+  max_error_rate: 0.01
+endpoints:
+  GET /users/123:
+    p95: 0.05
+  GET /products:
+    mean: 0.5
+    min_throughput: 100
+    min_samples: 50
+"""
+
+    def collector(self, products=100, user_seconds=0.1, errors=0):
+        """Collector holding a fixed mix of samples"""
+        collector = SLOCollector()
+        for index in range(products):
+            status = 500 if index < errors else 200
+            collector.record("GET", "/products?page=1", status, 0.01)
+        for user_id in range(10):
+            collector.record("GET", f"/users/{user_id}", 200, user_seconds)
+        collector.record("DELETE", "/users/7", 204, 0.01)
+        return collector
+
+    def test_load(self, tmp_path):
+        """
+        Ids normalise to {id}, defaults apply, unknown metrics are refused
+        """
+        path = tmp_path / "budgets.yaml"
+        path.write_text(self.BUDGETS)
+        budgets = Budgets.load(path)
+
+        assert sorted(budgets.budgets) == ["GET /products", "GET /users/{id}"]
+        users = budgets.budgets["GET /users/{id}"]
+        assert (users.latency, users.max_error_rate) == ({"p95": 0.05}, 0.01)
+        assert budgets.budgets["GET /products"].min_samples == 50
+
+        with pytest.raises(ValueError, match="unknown budget metric 'p95ms'"):
+            Budgets({"GET /x": {"p95ms": 1}})
+
+    def test_verdict(self, tmp_path):
+        """
+        Breached latency and error limits are listed; others pass
+        """
+        path = tmp_path / "budgets.yaml"
+        path.write_text(self.BUDGETS)
+        budgets = Budgets.load(path)
+
+        verdict = budgets.evaluate(self.collector(errors=2), throughput=False)
+        print(f"\n{verdict.table()}")
+        assert not verdict.passed
+        breaches = {(key, metric) for key, metric, _, _ in verdict.breaches}
+        assert breaches == {("GET /users/{id}", "p95"), ("GET /products", "error_rate")}
+        table = verdict.table()
+        assert "DELETE /users/{id}" in table and "no budget" in table
+
+        assert budgets.evaluate(self.collector(user_seconds=0.01), False).passed
+
+    def test_throughput_only_for_own_runs(self, tmp_path):
+        """
+        min_throughput is judged from the collector's span when asked to
+        """
+        path = tmp_path / "budgets.yaml"
+        path.write_text(self.BUDGETS)
+        budgets = Budgets.load(path)
+        collector = self.collector(user_seconds=0.01)
+        # 100 requests spread over 10 seconds: 10 req/s
+        collector.spans["GET /products"] = (1000.0, 1010.0)
+
+        (breach,) = budgets.evaluate(collector).breaches
+        assert breach == ("GET /products", "throughput", 10.0, 100)
+        assert budgets.evaluate(collector, throughput=False).passed
+
+    def test_worker_collectors_merge(self):
+        """
+        to_dict/from_dict/merge (the xdist path) loses no samples
+        """
+        first, second = self.collector(errors=1), self.collector(products=50)
+        first.spans["GET /products"] = (100.0, 110.0)
+        second.spans["GET /products"] = (105.0, 120.0)
+
+        merged = SLOCollector()
+        for worker in (first, second):
+            shipped = json.loads(json.dumps(worker.to_dict()))
+            merged.merge(SLOCollector.from_dict(shipped))
+
+        assert merged.histogram(endpoint="GET /products").count == 150
+        assert merged.histogram(endpoint="GET /products", status="5xx").count == 1
+        assert merged.histogram(endpoint="GET /users/{id}").count == 20
+        assert merged.spans["GET /products"] == (100.0, 120.0)
+        assert merged.throughput("GET /products") == 7.5
+
+
+class TestRetryPolicy:
+    """
+    Which failures RetryPolicy retries and how long it waits
+    """
+
+    def response(self, status, **headers):
+        """Bare response with a status and headers"""
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        return response
+
+    def test_retry_after_is_honoured_in_full(self):
+        """
+        A short Retry-After is waited out; a long one returns the 429
+        """
+        policy = RetryPolicy(retries=3, max_backoff=2.0)
+        short = self.response(429, **{"Retry-After": "2"})
+        long = self.response(429, **{"Retry-After": "30"})
+
+        assert policy.should_retry("POST", 1, short)
+        assert policy.delay(1, short) == 2
+        assert not policy.should_retry("GET", 1, long)
+        assert not policy.should_retry("GET", 1, self.response(503, **long.headers))
+
+    def test_connect_failures_retry_any_method(self):
+        """
+        A refused connection sent nothing, so even POST may be retried
+        """
+        policy = RetryPolicy()
+        with pytest.raises(requests.ConnectionError) as refused:
+            requests.post(f"{OFFLINE_URL}/users", timeout=1)
+        read_timeout = requests.ReadTimeout("read timed out")
+
+        assert policy.should_retry("POST", 1, error=refused.value)
+        assert not policy.should_retry("POST", 1, error=read_timeout)
+        assert policy.should_retry("GET", 1, error=read_timeout)
+
+
+@pytest.mark.no_slo
+class TestBurst:
+    """
+    Concurrent burst probe used by the rate-limit suite
+    """
+
+    def test_worker_errors_are_raised(self):
+        """
+        A transport error in a burst thread fails the caller, not silently
+        """
+        with MockAPIServer() as server:
+            base_url = server.base_url
+
+        with pytest.raises(requests.ConnectionError):
+            burst(lambda: APIClient(base_url, timeout=1), "/products", 50, 5)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Streaming Latency Histogram
+Author: QA Team
+Date: 2026-10-18
+Framework: standard library (HDR-style log-linear buckets)
+"""
+
+import math
+import re
+import threading
+from array import array
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory latency histogram with HDR-style log-linear buckets
+
+    Values are stored in microseconds. Every power-of-two range is split
+    into `sub_bucket_count / 2` linear sub-buckets, so any recorded value
+    is reported within 1 / (sub_bucket_count / 2) of its true value
+    (0.8% with the default of 256). Recording is O(1) and memory is fixed
+    by the trackable range, independent of how many samples are recorded.
+    """
+
+    def __init__(self, max_seconds=3600.0, sub_bucket_count=256):
+        if sub_bucket_count & (sub_bucket_count - 1):
+            raise ValueError("sub_bucket_count must be a power of two")
+        self.max_seconds = max_seconds
+        self.sub_bucket_count = sub_bucket_count
+        self.sub_bucket_bits = sub_bucket_count.bit_length() - 1
+        self.sub_bucket_half = sub_bucket_count // 2
+        self.max_value = int(max_seconds * 1_000_000)
+        self.counts = array("Q", bytes(8 * (self.index_of(self.max_value) + 1)))
+        self.count = 0
+        self.total = 0
+        self.min_value = None
+        self.max_recorded = 0
+
+    def index_of(self, value):
+        """Bucket index holding a value in microseconds"""
+        if value < self.sub_bucket_count:
+            return value
+        exponent = value.bit_length() - self.sub_bucket_bits
+        sub_bucket = (value >> exponent) - self.sub_bucket_half
+        return (
+            self.sub_bucket_count + (exponent - 1) * self.sub_bucket_half + sub_bucket
+        )
+
+    def highest_equivalent(self, index):
+        """Largest microsecond value that maps to a bucket index"""
+        if index < self.sub_bucket_count:
+            return index
+        offset = index - self.sub_bucket_count
+        exponent = offset // self.sub_bucket_half + 1
+        sub_bucket = offset % self.sub_bucket_half + self.sub_bucket_half
+        return ((sub_bucket + 1) << exponent) - 1
+
+    def record(self, seconds, count=1):
+        """Record a latency given in seconds"""
+        value = min(max(int(seconds * 1_000_000), 0), self.max_value)
+        self.counts[self.index_of(value)] += count
+        self.count += count
+        self.total += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_recorded:
+            self.max_recorded = value
+
+    def merge(self, other):
+        """Add all samples of another histogram with the same layout"""
+        if (other.max_value, other.sub_bucket_count) != (
+            self.max_value,
+            self.sub_bucket_count,
+        ):
+            raise ValueError("Cannot merge histograms with different layouts")
+        for index, value in enumerate(other.counts):
+            if value:
+                self.counts[index] += value
+        self.count += other.count
+        self.total += other.total
+        if other.min_value is not None:
+            if self.min_value is None or other.min_value < self.min_value:
+                self.min_value = other.min_value
+        self.max_recorded = max(self.max_recorded, other.max_recorded)
+        return self
+
+    def percentile(self, percent):
+        """Latency in seconds at or below which `percent`% of samples fall"""
+        if not self.count:
+            return 0.0
+        target = max(math.ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for index, value in enumerate(self.counts):
+            seen += value
+            if seen >= target:
+                return min(self.highest_equivalent(index), self.max_recorded) / 1e6
+        return self.max
+
+    @property
+    def mean(self):
+        """Mean latency in seconds"""
+        return self.total / self.count / 1e6 if self.count else 0.0
+
+    @property
+    def min(self):
+        """Smallest recorded latency in seconds"""
+        return (self.min_value or 0) / 1e6
+
+    @property
+    def max(self):
+        """Largest recorded latency in seconds"""
+        return self.max_recorded / 1e6
+
+    def percentiles(self, percents=PERCENTILES):
+        """Mapping of percentile to latency in seconds"""
+        return {percent: self.percentile(percent) for percent in percents}
+
+    def to_dict(self):
+        """Sparse, JSON-serialisable form for shipping between processes"""
+        return {
+            "max_seconds": self.max_seconds,
+            "sub_bucket_count": self.sub_bucket_count,
+            "counts": {str(i): v for i, v in enumerate(self.counts) if v},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min_value,
+            "max": self.max_recorded,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a histogram produced by to_dict()"""
+        histogram = cls(data["max_seconds"], data["sub_bucket_count"])
+        for index, value in data["counts"].items():
+            histogram.counts[int(index)] = value
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min_value = data["min"]
+        histogram.max_recorded = data["max"]
+        return histogram
+
+
+def endpoint_key(method, endpoint):
+    """Normalise a request to `METHOD /path/{id}` so ids share one series"""
+    path = endpoint.split("?", 1)[0]
+    return f"{method.upper()} {NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+def status_class(status):
+    """Bucket a status code into 2xx/4xx/...; non-HTTP failures are 'error'"""
+    if isinstance(status, int):
+        return f"{status // 100}xx"
+    return "error"
+
+
+# Status classes that count as errors everywhere (4xx are expected outcomes)
+ERROR_CLASSES = ("5xx", "error")
+
+
+def is_error(status):
+    """Whether a request outcome is a 5xx or a transport failure"""
+    return status_class(status) in ERROR_CLASSES
+
+
+class LatencyRecorder:
+    """
+    Thread-safe set of histograms keyed by endpoint and status class
+    """
+
+    def __init__(self, max_seconds=3600.0):
+        self.max_seconds = max_seconds
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def record(self, method, endpoint, status, seconds):
+        """Record one request outcome"""
+        key = (endpoint_key(method, endpoint), status_class(status))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = LatencyHistogram(self.max_seconds)
+                self.histograms[key] = histogram
+            histogram.record(seconds)
+
+    def merge(self, other):
+        """Fold another recorder (e.g. from another worker) into this one"""
+        with self.lock:
+            for key, histogram in other.histograms.items():
+                if key in self.histograms:
+                    self.histograms[key].merge(histogram)
+                else:
+                    self.histograms[key] = LatencyHistogram(self.max_seconds).merge(
+                        histogram
+                    )
+        return self
+
+    def histogram(self, endpoint=None, status=None):
+        """Merged histogram filtered by endpoint key and/or status class"""
+        merged = LatencyHistogram(self.max_seconds)
+        with self.lock:
+            for (key, klass), histogram in self.histograms.items():
+                if endpoint is not None and key != endpoint:
+                    continue
+                if status is not None and klass != status:
+                    continue
+                merged.merge(histogram)
+        return merged
+
+    def report(self):
+        """Per endpoint/status percentile table"""
+        header = f"{'endpoint':<32} {'status':<6} {'count':>8}" + "".join(
+            f" {'p' + format(p, 'g'):>8}" for p in PERCENTILES
+        )
+        lines = [header]
+        with self.lock:
+            for (key, klass), histogram in sorted(self.histograms.items()):
+                lines.append(
+                    f"{key:<32} {klass:<6} {histogram.count:>8}"
+                    + "".join(
+                        f" {value * 1000:>6.1f}ms"
+                        for value in histogram.percentiles().values()
+                    )
+                )
+        return "\n".join(lines)
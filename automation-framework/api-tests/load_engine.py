@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Load Generation Engine
+Author: QA Team
+Date: 2026-10-18
+Framework: threading worker pool driving APIClient
+"""
+
+import threading
+import time
+
+from latency_histogram import LatencyHistogram
+
+
+class Phase:
+    """
+    One stage of a load profile
+
+    The target (virtual users in concurrency mode, requests per second in
+    rps mode) is interpolated linearly from `start` to `end` over the
+    phase duration, so ramp-up, steady and ramp-down are all phases.
+    """
+
+    def __init__(self, name, duration, start, end=None):
+        self.name = name
+        self.duration = duration
+        self.start = start
+        self.end = start if end is None else end
+
+    def target_at(self, elapsed):
+        """Target load `elapsed` seconds into the phase"""
+        if self.duration <= 0:
+            return self.end
+        fraction = min(max(elapsed / self.duration, 0.0), 1.0)
+        return self.start + (self.end - self.start) * fraction
+
+
+class LoadProfile:
+    """
+    Ordered list of phases plus the mode they are expressed in
+    """
+
+    CONCURRENCY = "concurrency"
+    RPS = "rps"
+
+    def __init__(self, name, phases, mode=CONCURRENCY, workers=None):
+        if mode not in (self.CONCURRENCY, self.RPS):
+            raise ValueError(f"Unknown load mode: {mode}")
+        self.name = name
+        self.phases = phases
+        self.mode = mode
+        self.workers = workers
+
+    @property
+    def duration(self):
+        """Total planned duration in seconds"""
+        return sum(phase.duration for phase in self.phases)
+
+    @property
+    def peak(self):
+        """Highest target reached by any phase"""
+        return max(max(phase.start, phase.end) for phase in self.phases)
+
+    def to_dict(self):
+        """JSON-serialisable form for shipping between processes"""
+        return {
+            "name": self.name,
+            "mode": self.mode,
+            "workers": self.workers,
+            "phases": [[p.name, p.duration, p.start, p.end] for p in self.phases],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a profile produced by to_dict()"""
+        phases = [Phase(*phase) for phase in data["phases"]]
+        return cls(data["name"], phases, data["mode"], data["workers"])
+
+
+class PhaseStats:
+    """
+    Aggregated results for one phase of a run
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.requests = 0
+        self.errors = 0
+        self.status_counts = {}
+        self.histogram = LatencyHistogram()
+        self.started = None
+        self.ended = None
+        self.lock = threading.Lock()
+
+    def record(self, status, latency, ok):
+        """Record the outcome of one request"""
+        with self.lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.histogram.record(latency)
+
+    def merge(self, other):
+        """
+        Fold in the same phase from a parallel worker
+
+        The workers ran side by side, so the merged phase lasts as long as
+        the longest of them.
+        """
+        with self.lock:
+            self.requests += other.requests
+            self.errors += other.errors
+            for status, count in other.status_counts.items():
+                self.status_counts[status] = self.status_counts.get(status, 0) + count
+            self.histogram.merge(other.histogram)
+            elapsed = max(self.elapsed, other.elapsed)
+            self.started, self.ended = 0.0, elapsed
+        return self
+
+    def to_dict(self):
+        """JSON-serialisable form for shipping between processes"""
+        with self.lock:
+            return {
+                "name": self.name,
+                "requests": self.requests,
+                "errors": self.errors,
+                "status_counts": list(self.status_counts.items()),
+                "histogram": self.histogram.to_dict(),
+                "elapsed": self.elapsed,
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild stats produced by to_dict()"""
+        stats = cls(data["name"])
+        stats.requests = data["requests"]
+        stats.errors = data["errors"]
+        stats.status_counts = {status: count for status, count in data["status_counts"]}
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        stats.started, stats.ended = 0.0, data["elapsed"]
+        return stats
+
+    @property
+    def elapsed(self):
+        """Wall time the phase was active"""
+        if self.started is None:
+            return 0.0
+        ended = time.perf_counter() if self.ended is None else self.ended
+        return ended - self.started
+
+    @property
+    def throughput(self):
+        """Completed requests per second"""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self):
+        """Fraction of failed requests"""
+        return self.errors / self.requests if self.requests else 0.0
+
+
+class LoadResult:
+    """
+    Outcome of a LoadEngine run, broken down per phase
+    """
+
+    def __init__(self, profile, phases):
+        self.profile = profile
+        self.phases = phases
+
+    @property
+    def requests(self):
+        """Total requests sent"""
+        return sum(phase.requests for phase in self.phases)
+
+    @property
+    def errors(self):
+        """Total failed requests"""
+        return sum(phase.errors for phase in self.phases)
+
+    @property
+    def error_rate(self):
+        """Fraction of failed requests across the run"""
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self):
+        """Completed requests per second across the run"""
+        elapsed = sum(phase.elapsed for phase in self.phases)
+        return self.requests / elapsed if elapsed else 0.0
+
+    def histogram(self):
+        """Latency histogram merged across all phases"""
+        merged = LatencyHistogram()
+        for phase in self.phases:
+            merged.merge(phase.histogram)
+        return merged
+
+    def phase(self, name):
+        """Stats for the named phase"""
+        return next(phase for phase in self.phases if phase.name == name)
+
+    def summary(self):
+        """Human readable per-phase summary"""
+        lines = [f"Load profile: {self.profile.name} ({self.profile.mode})"]
+        for phase in self.phases:
+            lines.append(
+                f"  {phase.name:<10} requests={phase.requests:<6} "
+                f"rps={phase.throughput:8.1f} "
+                f"p50={phase.histogram.percentile(50) * 1000:7.1f}ms "
+                f"p95={phase.histogram.percentile(95) * 1000:7.1f}ms "
+                f"p99={phase.histogram.percentile(99) * 1000:7.1f}ms "
+                f"errors={phase.error_rate:.2%}"
+            )
+        return "\n".join(lines)
+
+
+class LoadEngine:
+    """
+    Worker pool that executes a task according to a LoadProfile
+
+    Each worker thread owns a client built by `client_factory` and calls
+    `task(client)` in a loop; the task returns a response whose status is
+    judged by `check` (default: status code below 400). In concurrency mode
+    only the first N workers are active, where N follows the phase target.
+    In rps mode all workers share a pacer that spaces request starts
+    1/target seconds apart. `observer(status, latency, ok)`, if given,
+    also sees every outcome (e.g. endurance.WindowRecorder).
+
+    `partition=(index, count)` runs only this engine's share when `count`
+    engines (e.g. processes) drive one profile together: virtual user u
+    belongs to engine u % count, and rps targets are divided by count.
+    """
+
+    def __init__(
+        self,
+        client_factory,
+        task,
+        profile,
+        check=None,
+        tick=0.05,
+        observer=None,
+        partition=(0, 1),
+    ):
+        self.client_factory = client_factory
+        self.task = task
+        self.profile = profile
+        self.check = check or (lambda response: response.status_code < 400)
+        self.tick = tick
+        self.observer = observer
+        self.partition = partition
+        self.target = 0.0
+        self.current = None
+        self.stop_event = threading.Event()
+        self.pacer_lock = threading.Lock()
+        self.last_send = 0.0
+
+    def worker_count(self):
+        """Number of worker threads needed for the profile"""
+        index, count = self.partition
+        if self.profile.mode == LoadProfile.CONCURRENCY:
+            users = int(round(self.profile.peak))
+            return max(len(range(index, users, count)), 1)
+        if self.profile.workers is None:
+            return 50
+        return max(len(range(index, self.profile.workers, count)), 1)
+
+    def run(self):
+        """Execute every phase in order and return a LoadResult"""
+        stats = [PhaseStats(phase.name) for phase in self.profile.phases]
+        self.stop_event.clear()
+        self.last_send = time.perf_counter()
+        workers = [
+            threading.Thread(target=self.worker, args=(index,), daemon=True)
+            for index in range(self.worker_count())
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for phase, phase_stats in zip(self.profile.phases, stats):
+                phase_stats.started = time.perf_counter()
+                self.current = phase_stats
+                while True:
+                    elapsed = time.perf_counter() - phase_stats.started
+                    if elapsed >= phase.duration:
+                        break
+                    self.target = phase.target_at(elapsed)
+                    time.sleep(min(self.tick, phase.duration - elapsed))
+                phase_stats.ended = time.perf_counter()
+        finally:
+            self.target = 0.0
+            self.stop_event.set()
+            for worker in workers:
+                worker.join()
+
+        return LoadResult(self.profile, stats)
+
+    def next_slot(self):
+        """Reserve the next send time in rps mode, or None when idle"""
+        with self.pacer_lock:
+            rate = self.target / self.partition[1]
+            if rate <= 0:
+                return None
+            now = time.perf_counter()
+            slot = max(self.last_send + 1.0 / rate, now)
+            if slot - now > self.tick:
+                return None
+            self.last_send = slot
+            return slot
+
+    def worker(self, index):
+        """Worker loop executing the task until the run stops"""
+        client = self.client_factory()
+        offset, count = self.partition
+        while not self.stop_event.is_set():
+            if self.profile.mode == LoadProfile.CONCURRENCY:
+                if index * count + offset >= round(self.target):
+                    self.stop_event.wait(self.tick)
+                    continue
+            else:
+                slot = self.next_slot()
+                if slot is None:
+                    self.stop_event.wait(self.tick)
+                    continue
+                delay = slot - time.perf_counter()
+                if delay > 0 and self.stop_event.wait(delay):
+                    break
+            self.execute(client)
+
+    def execute(self, client):
+        """Run the task once and record it against the active phase"""
+        stats = self.current
+        start = time.perf_counter()
+        try:
+            response = self.task(client)
+            status = response.status_code
+            ok = self.check(response)
+        except Exception as exc:
+            status = type(exc).__name__
+            ok = False
+        latency = time.perf_counter() - start
+        stats.record(status, latency, ok)
+        if self.observer is not None:
+            self.observer(status, latency, ok)
+
+
+def load_profile(peak, duration=60.0):
+    """Load test: ramp to expected peak, hold, ramp down"""
+    return LoadProfile(
+        "load",
+        [
+            Phase("ramp-up", duration * 0.25, 0, peak),
+            Phase("steady", duration * 0.5, peak),
+            Phase("ramp-down", duration * 0.25, peak, 0),
+        ],
+    )
+
+
+def stress_profile(peak, duration=60.0):
+    """Stress test: step beyond expected peak, then recover"""
+    step = duration / 5
+    return LoadProfile(
+        "stress",
+        [
+            Phase("normal", step, peak * 0.5),
+            Phase("peak", step, peak),
+            Phase("overload", step, peak * 1.5),
+            Phase("breaking", step, peak * 2),
+            Phase("recovery", step, peak * 0.5),
+        ],
+    )
+
+
+def spike_profile(peak, duration=60.0):
+    """Spike test: normal load, sudden burst, back to normal"""
+    return LoadProfile(
+        "spike",
+        [
+            Phase("normal", duration * 0.4, peak * 0.2),
+            Phase("spike", duration * 0.2, peak),
+            Phase("recovery", duration * 0.4, peak * 0.2),
+        ],
+    )
+
+
+def endurance_profile(peak, duration=3600.0):
+    """Endurance test: sustained load at 70% of peak"""
+    ramp = min(duration * 0.1, 300.0)
+    sustained = peak * 0.7
+    return LoadProfile(
+        "endurance",
+        [
+            Phase("ramp-up", ramp, 0, sustained),
+            Phase("steady", duration - 2 * ramp, sustained),
+            Phase("ramp-down", ramp, sustained, 0),
+        ],
+    )
+
+
+PROFILES = {
+    "load": load_profile,
+    "stress": stress_profile,
+    "spike": spike_profile,
+    "endurance": endurance_profile,
+}
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""
+Load Profile Test Suite
+Author: QA Team
+Date: 2026-10-18
+Framework: pytest with load_engine against the local stub server
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import aiohttp
+import numpy as np
+import pytest
+import requests
+
+from api_client import APIClient
+from async_api_client import AsyncAPIClient
+from distributed import Coordinator
+from endurance import EnduranceRunner, detect_drift
+from latency_histogram import LatencyRecorder, endpoint_key
+from load_engine import PROFILES, LoadEngine, LoadProfile, Phase, PhaseStats
+from metrics_exporter import MetricsExporter
+from mock_server import MockAPIServer
+from open_loop import (
+    OpenLoopScheduler,
+    constant_arrivals,
+    poisson_arrivals,
+    stepped_arrivals,
+)
+from rate_limit import RateLimitThrottle
+from regression import REGRESSION, BaselineStore, compare, gate
+from request_timing import RequestTiming, global_hooks
+from resilience import CircuitBreakers, RetryPolicy
+from resource_tracker import ResourceTracker
+from result_store import ResultSet, ResultWriter, grouped_percentiles
+from scenario import ScenarioRunner, guide_scenario
+
+
+@pytest.mark.no_slo
+class TestLoadProfiles:
+    """
+    Runs the load, stress, spike and endurance profiles from
+    docs/performance-testing-guide.md at a scaled-down size (stress runs
+    past the peak on purpose, so these stay out of the session budgets)
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_api):
+        """Setup test environment"""
+        self.base_url = mock_api.base_url
+        yield
+
+    def fetch_products(self, client):
+        """Task executed by every virtual user"""
+        return client.get("/products", params={"page": 1, "limit": 10})
+
+    @pytest.mark.parametrize("profile_name", ["load", "stress", "spike", "endurance"])
+    def test_profile(self, profile_name):
+        """
+        Each documented profile completes without errors against the stub
+        """
+        profile = PROFILES[profile_name](peak=10, duration=2.0)
+        engine = LoadEngine(
+            lambda: APIClient(self.base_url), self.fetch_products, profile
+        )
+
+        result = engine.run()
+        print(f"\n{result.summary()}")
+
+        assert result.requests > 0, "No requests were sent"
+        assert [p.name for p in result.phases] == [p.name for p in profile.phases]
+        assert result.error_rate == 0, f"Error rate {result.error_rate:.2%}"
+
+    def test_target_rps(self):
+        """
+        Rps mode holds the requested arrival rate
+        """
+        profile = LoadProfile(
+            "constant-rate", [Phase("steady", 2.0, 50)], mode=LoadProfile.RPS
+        )
+        engine = LoadEngine(
+            lambda: APIClient(self.base_url), self.fetch_products, profile
+        )
+
+        result = engine.run()
+        print(f"\n{result.summary()}")
+
+        assert result.error_rate == 0
+        assert 40 <= result.throughput <= 55, f"Throughput {result.throughput:.1f}"
+
+    def test_throttled_saturation(self):
+        """
+        A shared RateLimitThrottle runs workers up to the quota without 429s
+        """
+        profile = LoadProfile("saturate", [Phase("steady", 3.0, 20)])
+        throttle = RateLimitThrottle()
+
+        with MockAPIServer(rate_limit=50, rate_window=1) as server:
+            engine = LoadEngine(
+                lambda: APIClient(server.base_url, throttle=throttle),
+                self.fetch_products,
+                profile,
+            )
+            result = engine.run()
+        print(f"\n{result.summary()}")
+
+        assert throttle.throttled > 0, "Quota was never reached"
+        assert 429 not in result.phase("steady").status_counts
+        assert result.error_rate == 0, f"Error rate {result.error_rate:.2%}"
+
+    def test_distributed_rps_split(self):
+        """
+        Worker processes share an rps target and their results merge into one
+        """
+        profile = LoadProfile(
+            "distributed", [Phase("steady", 2.0, 100)], mode=LoadProfile.RPS
+        )
+        outcome = Coordinator(self.base_url, profile, workers=2).run()
+        print(f"\n{outcome.summary()}")
+
+        result = outcome.result
+        assert len(outcome.workers) == 2
+        assert result.error_rate == 0
+        assert result.requests == pytest.approx(200, rel=0.15)
+        assert result.phase("steady").elapsed == pytest.approx(2.0, abs=0.5)
+        assert outcome.collector.histogram().count == result.requests
+
+    def test_distributed_connect_timeout(self):
+        """
+        Missing remote workers fail the run and release the local ones
+        """
+        profile = LoadProfile("distributed", [Phase("steady", 1.0, 10)])
+        coordinator = Coordinator(
+            self.base_url, profile, workers=1, remote=1, connect_timeout=3
+        )
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match="Only 1 of 2 workers connected"):
+            coordinator.run()
+
+        assert time.monotonic() - started < 10
+        assert [process.returncode for process in coordinator.processes] == [0]
+
+    def test_merged_empty_phases_take_no_time(self):
+        """
+        Phases no worker reached merge to zero elapsed, not the clock
+        """
+        merged = PhaseStats("steady").merge(PhaseStats("steady"))
+        assert merged.elapsed == 0.0
+        assert PhaseStats.from_dict(merged.to_dict()).elapsed == 0.0
+        assert merged.throughput == 0
+
+    def test_partitions_cover_every_virtual_user(self):
+        """
+        Splitting a concurrency profile loses and duplicates no users
+        """
+        profile = PROFILES["load"](peak=10, duration=1.0)
+        engines = [
+            LoadEngine(None, None, profile, partition=(index, 3)) for index in range(3)
+        ]
+        assert [engine.worker_count() for engine in engines] == [4, 3, 3]
+
+    def test_guide_journeys(self, api_credentials):
+        """
+        The Section 5 journey mix runs end to end with per-step timing
+        """
+        tracker = ResourceTracker()
+        scenario = guide_scenario(
+            api_credentials, think=(0.01, 0.03), tracker=tracker, seed=7
+        )
+        profile = LoadProfile("journeys", [Phase("steady", 3.0, 10)])
+        result = ScenarioRunner(
+            lambda: APIClient(self.base_url), scenario, profile
+        ).run()
+        print(f"\n{result.summary()}")
+
+        for name in ("browse_and_purchase", "quick_search", "account_management"):
+            journey = result.journey(name)
+            assert journey.requests > 0, f"{name} never ran"
+            assert journey.error_rate == 0, f"{name}: {journey.status_counts}"
+        # The created user id flows into every later account step
+        register = result.step("account_management", "register")
+        closed = result.step("account_management", "close_account")
+        assert closed.status_counts == {204: closed.requests}
+        assert register.requests - closed.requests <= 10
+        # Accounts of journeys stopped mid-way are left for cleanup
+        assert len(tracker) == register.requests - closed.requests
+        client = APIClient(self.base_url)
+        token = client.post("/auth/login", json_data=api_credentials).json()
+        report = tracker.cleanup(self.base_url, token["accessToken"])
+        assert not report.failed and not len(tracker)
+        browse = result.journey("browse_and_purchase").requests
+        assert browse > result.journey("account_management").requests
+
+    def test_journey_mix_follows_weights(self, api_credentials):
+        """
+        Journeys are picked in proportion to their weights
+        """
+        scenario = guide_scenario(api_credentials, seed=1)
+        picks = [scenario.pick().name for _ in range(5000)]
+        for name, share in (
+            ("browse_and_purchase", 0.6),
+            ("quick_search", 0.3),
+            ("account_management", 0.1),
+        ):
+            assert picks.count(name) / len(picks) == pytest.approx(share, abs=0.03)
+
+
+@pytest.mark.no_slo
+class TestResilience:
+    """
+    Load runs keep making progress against a flaky or failing backend
+    (injected failures stay out of the session's performance budgets)
+    """
+
+    def fetch_products(self, client):
+        """Task executed by every virtual user"""
+        return client.get("/products", params={"page": 1, "limit": 10})
+
+    def test_retries_absorb_transient_errors(self):
+        """
+        Jittered retries turn a 20% server error rate into near-zero failures
+        """
+        profile = LoadProfile("flaky", [Phase("steady", 2.0, 10)])
+        retry = RetryPolicy(retries=3, backoff=0.01, statuses=(500, 502, 503))
+
+        with MockAPIServer(error_rate=0.2, seed=0) as server:
+            engine = LoadEngine(
+                lambda: APIClient(server.base_url, retry=retry),
+                self.fetch_products,
+                profile,
+            )
+            result = engine.run()
+        print(f"\n{result.summary()}")
+
+        assert result.requests > 0
+        assert result.error_rate < 0.01, f"Error rate {result.error_rate:.2%}"
+
+    def test_circuit_breaker_isolates_failing_host(self):
+        """
+        An open circuit fails fast instead of piling workers onto the host
+        """
+        profile = LoadProfile("outage", [Phase("steady", 2.0, 10)])
+        breakers = CircuitBreakers(failure_threshold=5, reset_timeout=0.5)
+
+        with MockAPIServer(latency=0.05, error_rate=1.0) as server:
+            engine = LoadEngine(
+                lambda: APIClient(server.base_url, breakers=breakers),
+                self.fetch_products,
+                profile,
+            )
+            result = engine.run()
+        print(f"\n{result.summary()}\n{breakers.metrics()}")
+
+        (metrics,) = breakers.metrics().values()
+        statuses = result.phase("steady").status_counts
+        assert metrics["trips"] >= 1
+        assert metrics["rejected"] > statuses.get(500, 0), "Circuit did not shed load"
+        assert statuses.get("CircuitOpenError") == metrics["rejected"]
+
+    def test_async_client_is_timed_and_times_out(self):
+        """
+        AsyncAPIClient requests reach the global hooks and honour the timeout
+        """
+        timings = []
+
+        async def run(server):
+            async with AsyncAPIClient(server.base_url, timeout=(1, 0.1)) as client:
+                response = await client.get("/products")
+                server.httpd.latency = 0.5
+                with pytest.raises(aiohttp.ServerTimeoutError):
+                    await client.get("/products", params={"page": 2})
+                return response
+
+        global_hooks.subscribe(timings.append)
+        try:
+            with MockAPIServer(latency=0.05) as server:
+                response = asyncio.run(run(server))
+        finally:
+            global_hooks.unsubscribe(timings.append)
+
+        ok, timed_out = timings
+        assert response.timing is ok
+        assert ok.status == 200 and ok.response_bytes == len(response.content)
+        assert ok.phases["connect"] > 0 and ok.phases["ttfb"] >= 50_000_000
+        assert timed_out.status.endswith("TimeoutError")
+        assert timed_out.total < 0.5
+
+
+class TestOpenLoop:
+    """
+    Arrival schedules and coordinated-omission-free latency
+    """
+
+    def fetch_products(self, client):
+        """Task executed for every arrival"""
+        return client.get("/products", params={"page": 1, "limit": 10})
+
+    def test_arrival_schedules(self):
+        """
+        Schedules produce the planned number of arrivals in order
+        """
+        constant = list(constant_arrivals(10, 2.0))
+        assert constant == pytest.approx([i / 10 for i in range(20)])
+
+        stepped = list(stepped_arrivals([(1.0, 5), (1.0, 0), (1.0, 20)]))
+        assert len(stepped) == 25
+        assert not [at for at in stepped if 1.0 <= at < 2.0]
+
+        poisson = list(poisson_arrivals(200, 5.0, seed=3))
+        assert poisson == sorted(poisson)
+        assert len(poisson) == pytest.approx(1000, rel=0.1)
+        assert poisson == list(poisson_arrivals(200, 5.0, seed=3))
+
+    @pytest.mark.no_slo
+    def test_stall_is_charged_to_latency(self):
+        """
+        Arrivals queued behind a saturated server count their wait
+        """
+        # One worker at 50ms per request serves 20 rps; 40 rps are offered
+        with MockAPIServer(latency=0.05) as server:
+            result = OpenLoopScheduler(
+                lambda: APIClient(server.base_url),
+                self.fetch_products,
+                constant_arrivals(40, 2.0),
+                workers=1,
+            ).run()
+        print(f"\n{result.summary()}")
+
+        assert result.requests == result.planned == 80
+        assert result.service.percentile(95) < 0.2
+        assert result.latency.percentile(95) > 1.0
+        assert result.lag.max > 1.0
+        assert result.max_backlog > 10
+
+    @pytest.mark.no_slo
+    def test_transport_errors_are_recorded(self):
+        """
+        Arrivals that never got a response still count against their endpoint
+        """
+        recorder = LatencyRecorder()
+        result = OpenLoopScheduler(
+            lambda: APIClient("http://127.0.0.1:9"),
+            self.fetch_products,
+            constant_arrivals(20, 0.5),
+            workers=2,
+            recorder=recorder,
+        ).run()
+
+        assert result.requests == 10
+        failed = recorder.histogram(endpoint_key("GET", "/products"), "error")
+        assert failed.count == 10
+        assert recorder.histogram().count == 10
+
+
+@pytest.mark.no_slo
+class TestMetricsExporter:
+    """
+    Live metrics while a load run is in progress
+    """
+
+    def scrape(self, url, openmetrics=False):
+        """Body of one scrape"""
+        headers = {"Accept": "application/openmetrics-text"} if openmetrics else {}
+        response = requests.get(url, headers=headers, timeout=5)
+        assert response.status_code == 200
+        return response.text
+
+    def sample(self, text, name):
+        """Value of the first sample whose line starts with `name`"""
+        line = next(line for line in text.splitlines() if line.startswith(name))
+        return float(line.rsplit(" ", 1)[1])
+
+    def test_live_metrics_during_load(self, tmp_path):
+        """
+        In-flight requests, counters and latency buckets update mid-run
+        """
+        path = tmp_path / "api_client.prom"
+        profile = LoadProfile("metrics", [Phase("steady", 2.0, 5)])
+
+        with MockAPIServer(latency=0.05) as server, MetricsExporter(
+            path=str(path), interval=0.5
+        ) as exporter:
+            engine = LoadEngine(
+                lambda: APIClient(server.base_url),
+                lambda client: client.get("/products", params={"page": 1}),
+                profile,
+            )
+            run = threading.Thread(target=engine.run)
+            run.start()
+            time.sleep(1.5)
+            live = self.scrape(exporter.url)
+            run.join()
+            final = self.scrape(exporter.url, openmetrics=True)
+        print(f"\n{live}")
+
+        assert self.sample(live, "api_client_requests_in_flight") >= 1
+        assert self.sample(live, "api_client_requests_per_second") > 0
+        count = 'api_client_request_duration_seconds_count{method="GET",'
+        finished = self.sample(final, count)
+        assert finished > self.sample(live, count) > 0
+        assert self.sample(final, 'api_client_requests_total{method="GET",') == finished
+        assert 'le="0.05"' in final and 'le="+Inf"' in final
+        assert final.endswith("# EOF\n")
+        assert "# TYPE api_client_requests counter" in final
+        assert self.sample(path.read_text(), count) == finished
+
+
+@pytest.mark.no_slo
+class TestResultStore:
+    """
+    Binary sample files and their vectorized analysis
+    """
+
+    def test_samples_round_trip(self, tmp_path):
+        """
+        Every request of a run is stored and summarised consistently
+        """
+        path = tmp_path / "run.qar"
+        profile = LoadProfile("samples", [Phase("steady", 1.5, 5)])
+
+        with MockAPIServer(error_rate=0.1, seed=4) as server, ResultWriter(
+            path, block_size=100
+        ).attach():
+            result = LoadEngine(
+                lambda: APIClient(server.base_url),
+                lambda client: client.get("/products", params={"page": 1}),
+                profile,
+            ).run()
+        samples = ResultSet.load(path)
+        row = samples.summary()["GET /products"]
+        print(f"\n{row}")
+
+        assert len(samples) == row["count"] == result.requests
+        assert row["error_rate"] == pytest.approx(result.error_rate)
+        assert row["p95"] == pytest.approx(result.histogram().percentile(95), rel=0.02)
+        series = samples.timeseries(interval=0.5)
+        assert sum(count for _, count, *_ in series) == result.requests
+        assert (samples["bytes"][samples.status_codes() == 200] > 0).all()
+
+    def test_open_loop_latency_is_stored(self, tmp_path):
+        """
+        Scheduled requests are stored with their intended-time latency
+        """
+        path = tmp_path / "run.qar"
+        with MockAPIServer(latency=0.05) as server, ResultWriter(path).attach():
+            result = OpenLoopScheduler(
+                lambda: APIClient(server.base_url),
+                lambda client: client.get("/products"),
+                constant_arrivals(40, 1.0),
+                workers=1,
+            ).run()
+        samples = ResultSet.load(path)
+
+        assert len(samples) == result.requests
+        assert samples.summary()["GET /products"]["p95"] == pytest.approx(
+            result.latency.percentile(95), rel=0.05
+        )
+        assert np.percentile(samples["total"], 95) < 0.2
+        with pytest.raises(KeyError):
+            samples.timeseries(endpoint="GET /orders")
+
+    def test_append_after_crash(self, tmp_path):
+        """
+        A torn final block is dropped and later runs append cleanly
+        """
+        path = tmp_path / "run.qar"
+        with MockAPIServer() as server, ResultWriter(path).attach():
+            APIClient(server.base_url).get("/products")
+        with open(path, "ab") as handle:
+            handle.write(b"S\x10\x00\x00\x00partial")
+        with MockAPIServer() as server, ResultWriter(path).attach():
+            client = APIClient(server.base_url)
+            client.get("/products")
+            client.get("/users/1")
+
+        samples = ResultSet.load(path)
+        assert len(samples) == 3
+        assert [name for name, _ in samples.endpoints()] == [
+            "GET /products",
+            "GET /users/{id}",
+        ]
+
+    def test_grouped_percentiles_match_numpy(self):
+        """
+        The one-pass grouped percentiles equal per-group nearest rank
+        """
+        rng = np.random.default_rng(0)
+        groups = rng.integers(0, 5, 100_000)
+        values = rng.lognormal(-4, 1, 100_000)
+        table = grouped_percentiles(groups, values, (50, 99))
+        for group, (count, mean, (p50, p99)) in enumerate(table):
+            members = values[groups == group]
+            assert count == len(members)
+            assert mean == pytest.approx(members.mean())
+            expected = np.percentile(members, [50, 99], method="inverted_cdf")
+            assert [p50, p99] == pytest.approx(expected)
+
+
+class TestRegression:
+    """
+    Run-to-run comparison of stored latency distributions
+    """
+
+    def write_run(self, path, latencies, errors=0):
+        """Result file of GET /products samples with given latencies"""
+        with ResultWriter(path) as writer:
+            for index, seconds in enumerate(latencies):
+                timing = RequestTiming("GET", "/products")
+                timing.status = 500 if index < errors else 200
+                timing.total_ns = timing.latency_ns = int(seconds * 1e9)
+                writer.record(timing)
+        return ResultSet.load(path)
+
+    def latencies(self, seed, scale=1.0, count=3000):
+        """Log-normal latencies around 20ms"""
+        rng = np.random.default_rng(seed)
+        return rng.lognormal(np.log(0.02), 0.4, count) * scale
+
+    def test_noise_is_not_a_regression(self, tmp_path):
+        """
+        Two draws from one distribution, and a real but tiny shift, pass
+        """
+        base = self.write_run(tmp_path / "base.qar", self.latencies(1))
+        same = self.write_run(tmp_path / "same.qar", self.latencies(2))
+        tiny = self.write_run(tmp_path / "tiny.qar", self.latencies(3, 1.01, 30000))
+
+        assert compare(base, same).passed
+        assert compare(base, tiny).passed
+
+    def test_slowdown_and_errors_are_regressions(self, tmp_path):
+        """
+        A 20% slowdown and a jump in 5xx responses both fail the gate
+        """
+        base = self.write_run(tmp_path / "base.qar", self.latencies(1))
+        slow = self.write_run(tmp_path / "slow.qar", self.latencies(2, 1.2))
+        failing = self.write_run(tmp_path / "fail.qar", self.latencies(3), errors=150)
+
+        comparison = compare(base, slow)
+        print(f"\n{comparison.table()}")
+        (row,) = comparison.regressions
+        assert row.endpoint == "GET /products"
+        assert row.changes[95][1] > 0.05
+        (row,) = compare(base, failing).regressions
+        assert row.error_rates == (0.0, 0.05)
+
+    def test_baseline_gate(self, tmp_path):
+        """
+        Passing runs are promoted; a regressed run is not
+        """
+        store = BaselineStore(tmp_path / "baselines", keep=3)
+        first = tmp_path / "first.qar"
+        self.write_run(first, self.latencies(1))
+        assert gate(first, store, promote=True, label="night-1") == []
+
+        second = tmp_path / "second.qar"
+        self.write_run(second, self.latencies(2))
+        ((reference, comparison),) = gate(second, store, True, "night-2")
+        assert reference == "night-1" and comparison.passed
+
+        third = tmp_path / "third.qar"
+        self.write_run(third, self.latencies(3, 1.3))
+        comparisons = gate(third, store, promote=True, label="night-3")
+        assert [label for label, _ in comparisons] == ["night-2", "night-1"]
+        assert comparisons[0][1].rows[0].verdict == REGRESSION
+        assert store.labels() == ["night-1", "night-2"]
+
+        store.rebase(third, "accepted")
+        assert store.labels() == ["accepted"]
+
+    def test_gradual_drift_is_caught(self, tmp_path):
+        """
+        Steps each below the threshold still fail against the oldest run
+        """
+        store = BaselineStore(tmp_path / "baselines")
+        options = {"threshold": 0.2}
+        for night, scale in enumerate((1.0, 1.1, 1.2, 1.32)):
+            path = tmp_path / f"night-{night}.qar"
+            self.write_run(path, self.latencies(night, scale))
+            comparisons = gate(path, store, True, f"night-{night}", **options)
+            newest = comparisons[0][1] if comparisons else None
+            assert newest is None or newest.passed, f"night {night}"
+
+        verdicts = {label: c.passed for label, c in comparisons}
+        assert verdicts == {"night-2": True, "night-0": False}
+        assert store.labels() == ["night-0", "night-1", "night-2"]
+
+
+@pytest.mark.no_slo
+class TestEndurance:
+    """
+    Windowed endurance runs and drift detection
+    """
+
+    def fetch_products(self, client):
+        """Task executed by every virtual user"""
+        return client.get("/products", params={"page": 1, "limit": 10})
+
+    def window(self, p95, throughput=100.0, error_rate=0.0):
+        """Synthetic window snapshot"""
+        return {
+            "requests": 100,
+            "p50": p95 / 2,
+            "p95": p95,
+            "p99": p95 * 1.2,
+            "throughput": throughput,
+            "error_rate": error_rate,
+        }
+
+    def test_detect_drift(self):
+        """
+        Steady growth is flagged, noise around a flat line is not
+        """
+        flat = [self.window(0.1 + 0.01 * (i % 3)) for i in range(12)]
+        rising = [self.window(0.1 + 0.02 * i, 100.0 - 5 * i) for i in range(12)]
+
+        assert not [t.metric for t in detect_drift(flat) if t.drifting]
+        drifting = {t.metric for t in detect_drift(rising) if t.drifting}
+        assert {"p50", "p95", "p99", "throughput"} <= drifting
+        assert "error_rate" not in drifting
+
+    def test_latency_creep_is_detected(self, tmp_path):
+        """
+        A server slowing down over the run shows up as p95 drift, with one
+        snapshot line written per window
+        """
+        path = tmp_path / "endurance.jsonl"
+        profile = LoadProfile("soak", [Phase("steady", 3.0, 4)])
+        stop = threading.Event()
+
+        with MockAPIServer() as server:
+
+            def slow_down():
+                while not stop.wait(0.05):
+                    server.httpd.latency += 0.001
+
+            threading.Thread(target=slow_down, daemon=True).start()
+            try:
+                outcome = EnduranceRunner(
+                    lambda: APIClient(server.base_url),
+                    self.fetch_products,
+                    profile,
+                    path=path,
+                    window=0.5,
+                ).run()
+            finally:
+                stop.set()
+        print(f"\n{outcome.summary()}")
+
+        snapshots = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(snapshots) == len(outcome.history) >= 5
+        assert sum(s["requests"] for s in snapshots) == outcome.result.requests
+        assert "p95" in [trend.metric for trend in outcome.drifting]
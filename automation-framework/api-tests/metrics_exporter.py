@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Live Metrics Exporter
+Author: QA Team
+Date: 2026-10-18
+Framework: request_timing hooks rendered as Prometheus text / OpenMetrics
+
+Publishes what APIClient is doing while a run is in progress: requests in
+flight, a rolling requests-per-second gauge, request and error counters
+by status, and latency histograms per endpoint (ids folded to {id} so
+label cardinality stays bounded). Scrape http://host:port/metrics, or
+point node_exporter's textfile collector at the file written every
+`interval` seconds. The request path only pays for a lock, a few dict
+updates and a bisect; rendering happens on scrape.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from latency_histogram import endpoint_key, is_error
+from request_timing import global_hooks, global_start_hooks
+
+# Upper bounds in seconds; the +Inf bucket is implicit
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def label_value(value):
+    """Escape a label value for the exposition formats"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def labels(**pairs):
+    """Rendered `{name="value",...}` label set"""
+    body = ",".join(f'{name}="{label_value(value)}"' for name, value in pairs.items())
+    return f"{{{body}}}"
+
+
+def number(value):
+    """Sample value as the formats expect it"""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class LiveMetrics:
+    """
+    Counters, gauges and histograms fed by the global timing hooks
+
+    `window` seconds of per-second counts back the requests-per-second
+    gauge. Pass a CircuitBreakers registry as `breakers` to export its
+    per-host state and trip counts as well.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, window=10, breakers=None):
+        self.buckets = tuple(buckets)
+        self.window = window
+        self.breakers = breakers
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = {}
+        self.errors = {}
+        self.histograms = {}
+        self.response_bytes = 0
+        self.second_counts = [0] * window
+        self.second_stamps = [0] * window
+
+    def subscribe(self):
+        """Start receiving every APIClient request"""
+        global_start_hooks.subscribe(self.request_started)
+        global_hooks.subscribe(self.request_finished)
+
+    def unsubscribe(self):
+        """Stop receiving requests"""
+        global_start_hooks.unsubscribe(self.request_started)
+        global_hooks.unsubscribe(self.request_finished)
+
+    def request_started(self, timing):
+        """global_start_hooks subscriber"""
+        with self.lock:
+            self.in_flight += 1
+
+    def request_finished(self, timing):
+        """global_hooks subscriber"""
+        key = endpoint_key(timing.method, timing.endpoint)
+        method, _, endpoint = key.partition(" ")
+        status = str(timing.status)
+        error = is_error(timing.status)
+        seconds = timing.total
+        second = int(time.monotonic())
+        slot = second % self.window
+        with self.lock:
+            self.in_flight -= 1
+            key = (method, endpoint, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if error:
+                self.errors[key] = self.errors.get(key, 0) + 1
+            histogram = self.histograms.get((method, endpoint))
+            if histogram is None:
+                histogram = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self.histograms[(method, endpoint)] = histogram
+            histogram[0][bisect_left(self.buckets, seconds)] += 1
+            histogram[1] += seconds
+            histogram[2] += 1
+            self.response_bytes += timing.response_bytes
+            if self.second_stamps[slot] != second:
+                self.second_stamps[slot] = second
+                self.second_counts[slot] = 0
+            self.second_counts[slot] += 1
+
+    def requests_per_second(self):
+        """Completed requests per second over the last full seconds"""
+        now = int(time.monotonic())
+        with self.lock:
+            total = sum(
+                count
+                for stamp, count in zip(self.second_stamps, self.second_counts)
+                if now - self.window < stamp < now
+            )
+        return total / (self.window - 1)
+
+    def render(self, openmetrics=False):
+        """Current values in Prometheus text (or OpenMetrics) format"""
+        lines = []
+
+        def family(name, kind, text, samples):
+            # OpenMetrics names a counter family without its _total suffix
+            if openmetrics and kind == "counter":
+                name = name[: -len("_total")]
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        rps = self.requests_per_second()
+        with self.lock:
+            in_flight = max(self.in_flight, 0)
+            requests = sorted(self.requests.items())
+            errors = sorted(self.errors.items())
+            histograms = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self.histograms.items()
+            )
+            response_bytes = self.response_bytes
+
+        family(
+            "api_client_requests_in_flight",
+            "gauge",
+            "Requests sent and not yet completed",
+            [f"api_client_requests_in_flight {in_flight}"],
+        )
+        family(
+            "api_client_requests_per_second",
+            "gauge",
+            f"Completed requests per second over the last {self.window} seconds",
+            [f"api_client_requests_per_second {number(rps)}"],
+        )
+        family(
+            "api_client_requests_total",
+            "counter",
+            "Completed requests by endpoint and status",
+            [
+                "api_client_requests_total"
+                f"{labels(method=m, endpoint=e, status=s)} {value}"
+                for (m, e, s), value in requests
+            ],
+        )
+        family(
+            "api_client_errors_total",
+            "counter",
+            "Requests answered with 5xx or failed in transport",
+            [
+                "api_client_errors_total"
+                f"{labels(method=m, endpoint=e, status=s)} {value}"
+                for (m, e, s), value in errors
+            ],
+        )
+        family(
+            "api_client_response_bytes_total",
+            "counter",
+            "Response body bytes received",
+            [f"api_client_response_bytes_total {response_bytes}"],
+        )
+        samples = []
+        for (method, endpoint), (counts, total, count) in histograms:
+            cumulative = 0
+            for bound, bucket in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket
+                bucket_labels = labels(
+                    method=method, endpoint=endpoint, le=number(bound)
+                )
+                samples.append(
+                    f"api_client_request_duration_seconds_bucket{bucket_labels} "
+                    f"{cumulative}"
+                )
+            series = labels(method=method, endpoint=endpoint)
+            samples.append(
+                f"api_client_request_duration_seconds_sum{series} {number(total)}"
+            )
+            samples.append(f"api_client_request_duration_seconds_count{series} {count}")
+        family(
+            "api_client_request_duration_seconds",
+            "histogram",
+            "Request latency including retries",
+            samples,
+        )
+        if self.breakers is not None:
+            metrics = sorted(self.breakers.metrics().items())
+            family(
+                "api_client_circuit_state",
+                "gauge",
+                "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+                [
+                    f"api_client_circuit_state{labels(host=host)} "
+                    f"{CIRCUIT_STATES[values['state']]}"
+                    for host, values in metrics
+                ],
+            )
+            family(
+                "api_client_circuit_trips_total",
+                "counter",
+                "Times the circuit breaker opened",
+                [
+                    f"api_client_circuit_trips_total{labels(host=host)} "
+                    f"{values['trips']}"
+                    for host, values in metrics
+                ],
+            )
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves /metrics in the format the scraper asks for
+    """
+
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+
+    def do_GET(self):
+        """GET /metrics"""
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        payload = self.server.metrics.render(openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE
+        )
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class MetricsExporter:
+    """
+    LiveMetrics published over HTTP and/or to a file while a run is active
+
+    Usable as a context manager. `port=None` disables the endpoint (0
+    picks a free port, see `url`); with `path` the metrics are also
+    rewritten atomically every `interval` seconds and once more on stop.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        path=None,
+        interval=5.0,
+        metrics=None,
+        breakers=None,
+    ):
+        self.metrics = metrics or LiveMetrics(breakers=breakers)
+        self.path = path
+        self.interval = interval
+        self.httpd = None
+        if port is not None:
+            self.httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+            self.httpd.daemon_threads = True
+            self.httpd.metrics = self.metrics
+        self.stop_event = threading.Event()
+        self.threads = []
+
+    @property
+    def url(self):
+        """Scrape URL of the metrics endpoint"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        """Subscribe to requests and start serving/writing"""
+        self.metrics.subscribe()
+        self.stop_event.clear()
+        if self.httpd is not None:
+            self.threads.append(threading.Thread(target=self.httpd.serve_forever))
+        if self.path is not None:
+            self.threads.append(threading.Thread(target=self.write_loop))
+        for thread in self.threads:
+            thread.daemon = True
+            thread.start()
+        return self
+
+    def stop(self):
+        """Unsubscribe, stop serving and write the final file"""
+        self.metrics.unsubscribe()
+        self.stop_event.set()
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        if self.path is not None:
+            self.write()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def write_loop(self):
+        """Rewrite the metrics file every `interval` seconds"""
+        while not self.stop_event.wait(self.interval):
+            self.write()
+
+    def write(self):
+        """Atomically replace the metrics file"""
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.metrics.render())
+        os.replace(temporary, self.path)
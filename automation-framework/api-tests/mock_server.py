@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Local Mock API Server
+Author: QA Team
+Date: 2026-10-18
+Framework: http.server (standard library)
+
+Implements the contract from test-documentation/test-cases/api-testing.md
+(/auth/login, /auth/refresh, /users, /users/{id}, /products) including its
+error shapes and rate-limit headers, so the suites run offline.
+"""
+
+import base64
+import json
+import math
+import random
+import re
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/v1"
+USER_PATH = re.compile(r"^/users/(\d+)$")
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+VALID_CREDENTIALS = {"testuser@example.com": "Test@1234"}
+USER_FIELDS = ("email", "firstName", "lastName", "phone")
+
+
+def timestamp():
+    """Current time in ISO 8601 UTC"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def fake_jwt(subject):
+    """Opaque token with JWT shape (header.payload.signature)"""
+
+    def encode(data):
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    header = encode({"alg": "HS256", "typ": "JWT"})
+    payload = encode({"sub": subject, "iat": int(time.time())})
+    return f"{header}.{payload}.{secrets.token_urlsafe(16)}"
+
+
+def error_body(code, message, **extra):
+    """Standard error envelope"""
+    return {
+        "error": {"code": code, "message": message, **extra, "timestamp": timestamp()}
+    }
+
+
+class MockState:
+    """
+    In-memory users, tokens, catalog and rate-limit counters
+    """
+
+    def __init__(
+        self, product_count=150, rate_limit=None, rate_window=60, token_ttl=3600
+    ):
+        self.lock = threading.Lock()
+        self.product_count = product_count
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.token_ttl = token_ttl
+        self.rate_counters = {}
+        self.access_tokens = {}
+        self.refresh_tokens = set()
+        self.next_id = 20000
+        created = "2025-01-15T10:30:00Z"
+        self.users = {
+            12345: {
+                "id": 12345,
+                "email": "testuser@example.com",
+                "firstName": "John",
+                "lastName": "Doe",
+                "phone": "+1234567890",
+                "status": "active",
+                "createdAt": created,
+                "updatedAt": created,
+            },
+            12344: {
+                "id": 12344,
+                "email": "existinguser@example.com",
+                "firstName": "Existing",
+                "lastName": "User",
+                "phone": "+1234567891",
+                "status": "active",
+                "createdAt": created,
+                "updatedAt": created,
+            },
+        }
+
+    def issue_tokens(self, subject):
+        """Create an access/refresh token pair"""
+        access, refresh = fake_jwt(subject), fake_jwt(f"refresh:{subject}")
+        with self.lock:
+            self.access_tokens[access] = time.time() + self.token_ttl
+            self.refresh_tokens.add(refresh)
+        return {
+            "accessToken": access,
+            "refreshToken": refresh,
+            "tokenType": "Bearer",
+            "expiresIn": self.token_ttl,
+        }
+
+    def is_authorized(self, header):
+        """Whether an Authorization header carries a live access token"""
+        if not header or not header.startswith("Bearer "):
+            return False
+        expires = self.access_tokens.get(header[len("Bearer ") :])
+        return expires is not None and expires > time.time()
+
+    def consume_rate(self, client):
+        """Count a request; returns (limit, remaining, reset) or None if off"""
+        if not self.rate_limit:
+            return None
+        now = time.time()
+        with self.lock:
+            window_start, used = self.rate_counters.get(client, (now, 0))
+            if now - window_start >= self.rate_window:
+                window_start, used = now, 0
+            used += 1
+            self.rate_counters[client] = (window_start, used)
+        reset = math.ceil(window_start + self.rate_window)
+        return self.rate_limit, self.rate_limit - used, reset
+
+    def product(self, index):
+        """Catalog item at a 1-based position (generated, not stored)"""
+        return {
+            "id": index,
+            "name": f"Product {index:07d}",
+            "price": round(5 + (index * 7919 % 10000) / 100, 2),
+            "stock": index * 31 % 500,
+        }
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """
+    Request handler implementing the API contract
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+
+    @property
+    def state(self):
+        """Shared server state"""
+        return self.server.state
+
+    def send_json(self, status, body, headers=None):
+        """Send a JSON response (or empty body) with a Content-Length"""
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in {**self.extra_headers, **(headers or {})}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def read_json(self):
+        """Parse the request body; None if absent or malformed"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+
+    def handle_any(self, method):
+        """Common pipeline: body, latency/fault injection, rate limit, route"""
+        body = self.read_json()
+        self.extra_headers = {}
+        server = self.server
+
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.random.uniform(0, server.jitter))
+
+        if server.error_rate and server.random.random() < server.error_rate:
+            self.send_json(500, error_body("INTERNAL_ERROR", "Injected failure"))
+            return
+
+        client = self.headers.get("Authorization") or self.client_address[0]
+        rate = self.state.consume_rate(client)
+        if rate is not None:
+            limit, remaining, reset = rate
+            self.extra_headers = {
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(max(remaining, 0)),
+                "X-RateLimit-Reset": str(reset),
+            }
+            if remaining < 0:
+                retry_after = max(reset - int(time.time()), 1)
+                self.send_json(
+                    429,
+                    error_body(
+                        "RATE_LIMIT_EXCEEDED",
+                        "Too many requests. Please try again later.",
+                        retryAfter=retry_after,
+                    ),
+                    {"Retry-After": str(retry_after)},
+                )
+                return
+
+        parsed = urlparse(self.path)
+        if not parsed.path.startswith(API_PREFIX):
+            self.send_json(404, error_body("NOT_FOUND", "Unknown endpoint"))
+            return
+        path = parsed.path[len(API_PREFIX) :]
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        self.route(method, path, query, body)
+
+    def route(self, method, path, query, body):
+        """Dispatch to the endpoint implementation"""
+        if path == "/auth/login" and method == "POST":
+            return self.login(body)
+        if path == "/auth/refresh" and method == "POST":
+            return self.refresh(body)
+        if path == "/products" and method == "GET":
+            return self.list_products(query)
+
+        match = USER_PATH.match(path)
+        if path == "/users" or match:
+            if not self.state.is_authorized(self.headers.get("Authorization")):
+                return self.send_json(
+                    401,
+                    error_body("UNAUTHORIZED", "Authentication required"),
+                    {"WWW-Authenticate": 'Bearer realm="API"'},
+                )
+            if path == "/users" and method == "POST":
+                return self.create_user(body)
+            if match and method == "GET":
+                return self.get_user(int(match.group(1)))
+            if match and method == "PUT":
+                return self.update_user(int(match.group(1)), body)
+            if match and method == "DELETE":
+                return self.delete_user(int(match.group(1)))
+            return self.send_json(
+                405, error_body("METHOD_NOT_ALLOWED", f"{method} not allowed")
+            )
+
+        self.send_json(404, error_body("NOT_FOUND", "Unknown endpoint"))
+
+    def login(self, body):
+        """POST /auth/login"""
+        if not body or not body.get("email") or not body.get("password"):
+            return self.send_json(
+                400, error_body("VALIDATION_ERROR", "Email and password are required")
+            )
+        if VALID_CREDENTIALS.get(body["email"]) != body["password"]:
+            return self.send_json(
+                401, error_body("INVALID_CREDENTIALS", "Invalid email or password")
+            )
+        users = list(self.state.users.values())
+        user = next(u for u in users if u["email"] == body["email"])
+        tokens = self.state.issue_tokens(user["id"])
+        tokens["user"] = {k: user[k] for k in ("id", "email", "firstName", "lastName")}
+        self.send_json(200, tokens)
+
+    def refresh(self, body):
+        """POST /auth/refresh"""
+        token = (body or {}).get("refreshToken")
+        if token not in self.state.refresh_tokens:
+            return self.send_json(
+                401, error_body("INVALID_REFRESH_TOKEN", "Refresh token is invalid")
+            )
+        self.send_json(200, self.state.issue_tokens(token))
+
+    def user_not_found(self, user_id):
+        """404 for an unknown user id"""
+        self.send_json(
+            404,
+            error_body("USER_NOT_FOUND", f"User with ID {user_id} does not exist"),
+        )
+
+    def get_user(self, user_id):
+        """GET /users/{id}"""
+        user = self.state.users.get(user_id)
+        if user is None:
+            return self.user_not_found(user_id)
+        self.send_json(200, user)
+
+    def create_user(self, body):
+        """POST /users"""
+        body = body or {}
+        details = []
+        if not EMAIL_PATTERN.match(str(body.get("email", ""))):
+            details.append(
+                {
+                    "field": "email",
+                    "message": "Email format is invalid",
+                    "rejectedValue": body.get("email"),
+                }
+            )
+        for field in ("firstName", "lastName", "password"):
+            if not body.get(field):
+                details.append({"field": field, "message": f"{field} is required"})
+        if details:
+            return self.send_json(
+                400,
+                error_body("VALIDATION_ERROR", "Invalid request data", details=details),
+            )
+
+        state = self.state
+        with state.lock:
+            duplicate = any(u["email"] == body["email"] for u in state.users.values())
+            if not duplicate:
+                user_id = state.next_id
+                state.next_id += 1
+                now = timestamp()
+                user = {"id": user_id, "status": "active"}
+                user.update({f: body[f] for f in USER_FIELDS if f in body})
+                user.update({"createdAt": now, "updatedAt": now})
+                state.users[user_id] = user
+        if duplicate:
+            return self.send_json(
+                409,
+                error_body(
+                    "EMAIL_ALREADY_EXISTS",
+                    f"User with email {body['email']} already exists",
+                    field="email",
+                ),
+            )
+        self.send_json(201, user, {"Location": f"/users/{user_id}"})
+
+    def update_user(self, user_id, body):
+        """PUT /users/{id}"""
+        updates = {f: v for f, v in (body or {}).items() if f in USER_FIELDS}
+        with self.state.lock:
+            user = self.state.users.get(user_id)
+            if user is not None:
+                user.update(updates)
+                user["updatedAt"] = timestamp()
+                user = dict(user)
+        if user is None:
+            return self.user_not_found(user_id)
+        self.send_json(200, user)
+
+    def delete_user(self, user_id):
+        """DELETE /users/{id}"""
+        with self.state.lock:
+            user = self.state.users.pop(user_id, None)
+        if user is None:
+            return self.user_not_found(user_id)
+        self.send_json(204, None)
+
+    def list_products(self, query):
+        """GET /products with page/limit/sort"""
+        try:
+            page = int(query.get("page", 1))
+            limit = int(query.get("limit", 10))
+        except ValueError:
+            page, limit = 0, 0
+        if page < 1 or not 1 <= limit <= 100:
+            return self.send_json(
+                400, error_body("VALIDATION_ERROR", "Invalid pagination parameters")
+            )
+
+        total = self.state.product_count
+        total_pages = max((total + limit - 1) // limit, 1)
+        start = (page - 1) * limit
+        positions = range(start + 1, min(start + limit, total) + 1)
+        if query.get("sort") == "name:desc":
+            positions = [total + 1 - i for i in positions]
+        products = [self.state.product(i) for i in positions]
+
+        def link(number):
+            return f"/products?page={number}&limit={limit}"
+
+        links = {"self": link(page), "first": link(1), "last": link(total_pages)}
+        if page < total_pages:
+            links["next"] = link(page + 1)
+        if page > 1:
+            links["prev"] = link(page - 1)
+        self.send_json(
+            200,
+            {
+                "data": products,
+                "pagination": {
+                    "page": page,
+                    "limit": limit,
+                    "totalPages": total_pages,
+                    "totalItems": total,
+                    "hasNext": page < total_pages,
+                    "hasPrevious": page > 1,
+                },
+                "links": links,
+            },
+        )
+
+    def do_GET(self):
+        """Handle GET requests"""
+        self.handle_any("GET")
+
+    def do_POST(self):
+        """Handle POST requests"""
+        self.handle_any("POST")
+
+    def do_PUT(self):
+        """Handle PUT requests"""
+        self.handle_any("PUT")
+
+    def do_DELETE(self):
+        """Handle DELETE requests"""
+        self.handle_any("DELETE")
+
+
+class MockHTTPServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server with a listen backlog sized for load tests
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class MockAPIServer:
+    """
+    Mock API running in the background on a loopback port
+
+    Usable as a context manager; base_url points at the /v1 API root.
+    `latency` (+ up to `jitter`) seconds are added to every response and
+    `error_rate` of requests fail with 500; `seed` makes both repeatable.
+    Rate limiting (per bearer token, else per client IP) is off unless
+    `rate_limit` requests per `rate_window` seconds is given.
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        rate_limit=None,
+        rate_window=60,
+        product_count=150,
+        token_ttl=3600,
+        seed=None,
+    ):
+        self.httpd = MockHTTPServer((host, port), MockAPIHandler)
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.random = random.Random(seed)
+        self.httpd.state = MockState(
+            product_count=product_count,
+            rate_limit=rate_limit,
+            rate_window=rate_window,
+            token_ttl=token_ttl,
+        )
+        self.thread = None
+
+    @property
+    def state(self):
+        """Server-side state (users, tokens, counters)"""
+        return self.httpd.state
+
+    @property
+    def base_url(self):
+        """Base URL of the running server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self):
+        """Start serving in a daemon thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server and close its socket"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the mock API server")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--products", type=int, default=150)
+    args = parser.parse_args()
+
+    server = MockAPIServer(
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        product_count=args.products,
+    )
+    print(f"Mock API listening on {server.base_url}")
+    server.httpd.serve_forever()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Open-Loop Arrival Scheduler
+Author: QA Team
+Date: 2026-10-18
+Framework: arrival dispatcher plus worker pool driving APIClient
+
+A closed loop (each user waits for its response before sending again)
+sends less when the server stalls, so the stall hides in the results:
+coordinated omission. OpenLoopScheduler instead issues requests on a fixed
+arrival schedule and measures each latency from the intended send time,
+so a request that had to queue behind a stall is charged for the wait.
+How far the generator itself fell behind schedule is reported separately
+as `lag`, so an undersized worker pool is not mistaken for a slow server.
+"""
+
+import queue
+import random
+import threading
+import time
+
+from latency_histogram import LatencyHistogram
+from request_timing import intend_start
+
+
+class ArrivalSchedule:
+    """
+    Intended send times (seconds from the start) for a piecewise rate
+
+    `steps` is a list of (duration, rate) pairs. Arrivals within a step
+    are evenly spaced, or exponentially spaced (a Poisson process) with
+    `poisson=True`; `seed` makes the Poisson draws repeatable.
+    """
+
+    def __init__(self, steps, poisson=False, seed=None):
+        self.steps = steps
+        self.poisson = poisson
+        self.seed = seed
+
+    @property
+    def duration(self):
+        """Total schedule length in seconds"""
+        return sum(duration for duration, _ in self.steps)
+
+    def __iter__(self):
+        rng = random.Random(self.seed)
+        offset = 0.0
+        for duration, rate in self.steps:
+            end = offset + duration
+            if rate > 0:
+                count = 0
+                at = offset + (rng.expovariate(rate) if self.poisson else 0.0)
+                while at < end:
+                    yield at
+                    count += 1
+                    if self.poisson:
+                        at += rng.expovariate(rate)
+                    else:
+                        at = offset + count / rate
+            offset = end
+
+
+def constant_arrivals(rate, duration):
+    """Evenly spaced arrivals at `rate` per second"""
+    return ArrivalSchedule([(duration, rate)])
+
+
+def poisson_arrivals(rate, duration, seed=None):
+    """Poisson arrivals averaging `rate` per second"""
+    return ArrivalSchedule([(duration, rate)], poisson=True, seed=seed)
+
+
+def stepped_arrivals(steps, poisson=False, seed=None):
+    """Rate held constant for each (duration, rate) step in turn"""
+    return ArrivalSchedule(steps, poisson=poisson, seed=seed)
+
+
+class OpenLoopResult:
+    """
+    Outcome of an open-loop run
+
+    `latency` is measured from the intended send time, `service` from the
+    actual send, and `lag` is how late each request was actually sent.
+    """
+
+    def __init__(self, planned):
+        self.planned = planned
+        self.requests = 0
+        self.errors = 0
+        self.status_counts = {}
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.lag = LatencyHistogram()
+        self.max_backlog = 0
+        self.duration = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, status, ok, intended, sent, done):
+        """Record one request's outcome and timestamps"""
+        with self.lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.latency.record(done - intended)
+            self.service.record(done - sent)
+            self.lag.record(sent - intended)
+
+    @property
+    def error_rate(self):
+        """Fraction of failed requests"""
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self):
+        """Completed requests per second"""
+        return self.requests / self.duration if self.duration else 0.0
+
+    def summary(self):
+        """Human readable latency, service time and schedule lag"""
+        lines = [
+            f"Open loop: planned={self.planned} completed={self.requests} "
+            f"rps={self.throughput:.1f} errors={self.error_rate:.2%} "
+            f"max_backlog={self.max_backlog}"
+        ]
+        for name in ("latency", "service", "lag"):
+            histogram = getattr(self, name)
+            lines.append(
+                f"  {name:<8}"
+                + "".join(
+                    f" p{p}={histogram.percentile(p) * 1000:7.1f}ms"
+                    for p in (50, 95, 99)
+                )
+                + f" max={histogram.max * 1000:7.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class OpenLoopScheduler:
+    """
+    Sends `task(client)` on an ArrivalSchedule regardless of responses
+
+    run() releases each arrival at its intended time to a pool of
+    `workers` threads, each owning a client from `client_factory`. When
+    every worker is busy arrivals queue up (see `max_backlog`) rather than
+    being skipped. With a LatencyRecorder as `recorder`, each request
+    is also recorded per endpoint (from the timing APIClient attaches to
+    the response, or to the exception for transport errors) with its
+    intended-time latency, so budgets judge the corrected numbers. The
+    first request of each arrival carries its intended send time in
+    RequestTiming.latency for global subscribers such as the result store.
+    """
+
+    def __init__(
+        self, client_factory, task, schedule, workers=50, check=None, recorder=None
+    ):
+        self.client_factory = client_factory
+        self.task = task
+        self.schedule = schedule
+        self.workers = workers
+        self.check = check or (lambda response: response.status_code < 400)
+        self.recorder = recorder
+        self.queue = queue.Queue()
+
+    def run(self):
+        """Dispatch the whole schedule and return an OpenLoopResult"""
+        arrivals = list(self.schedule)
+        result = OpenLoopResult(len(arrivals))
+        workers = [
+            threading.Thread(target=self.worker, args=(result,), daemon=True)
+            for _ in range(self.workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        origin = time.perf_counter()
+        try:
+            for offset in arrivals:
+                intended = origin + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.queue.put(intended)
+                result.max_backlog = max(result.max_backlog, self.queue.qsize())
+        finally:
+            for _ in workers:
+                self.queue.put(None)
+            for worker in workers:
+                worker.join()
+        result.duration = time.perf_counter() - origin
+        return result
+
+    def worker(self, result):
+        """Send each released arrival until told to stop"""
+        client = self.client_factory()
+        while True:
+            intended = self.queue.get()
+            if intended is None:
+                return
+            sent = time.perf_counter()
+            intend_start(int(intended * 1e9))
+            try:
+                response = self.task(client)
+                status = response.status_code
+                ok = self.check(response)
+                timing = getattr(response, "timing", None)
+            except Exception as exc:
+                status = type(exc).__name__
+                ok = False
+                timing = getattr(exc, "timing", None)
+            done = time.perf_counter()
+            intend_start(None)
+            result.record(status, ok, intended, sent, done)
+            if self.recorder is not None and timing is not None:
+                self.recorder.record(
+                    timing.method, timing.endpoint, status, done - intended
+                )
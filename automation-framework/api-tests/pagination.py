@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Paginated Listing Iterator
+Author: QA Team
+Date: 2026-10-18
+Framework: requests streaming with incremental json decoding
+
+Walks every page of a listing such as /products one item at a time. Only
+the page being checked and the prefetched next page are ever in memory,
+and items are decoded from the body as they are consumed, so invariants
+can be checked across catalogs of any size.
+"""
+
+import codecs
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+WHITESPACE = re.compile(r"\s*")
+
+
+class JSONArrayStream:
+    """
+    Decodes the items of one top-level array in a JSON document lazily
+
+    Iterating yields the elements of `document[key]` as soon as each is
+    complete in the incoming chunks. Once exhausted, `document` holds the
+    rest of the object with that array replaced by None (e.g. the
+    pagination metadata and links of a listing page).
+    """
+
+    def __init__(self, chunks, key="data"):
+        self.chunks = iter(chunks)
+        self.key = key
+        self.start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.exhausted = False
+        self.document = None
+        self.count = 0
+
+    def read(self):
+        """Append the next chunk to the buffer; False once the body is done"""
+        for chunk in self.chunks:
+            text = self.utf8.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        if not self.exhausted:
+            self.exhausted = True
+            self.buffer += self.utf8.decode(b"", final=True)
+        return False
+
+    def __iter__(self):
+        match = self.start.search(self.buffer)
+        while match is None and self.read():
+            match = self.start.search(self.buffer)
+        if match is None:
+            self.document = json.loads(self.buffer) if self.buffer.strip() else {}
+            return
+
+        prefix = f'{self.buffer[:match.start()]}"{self.key}": null'
+        self.buffer = self.buffer[match.end() :]
+        pos = 0
+        while True:
+            pos = WHITESPACE.match(self.buffer, pos).end()
+            if pos == len(self.buffer):
+                self.buffer, pos = "", 0
+                if not self.read():
+                    raise ValueError(f"Unterminated '{self.key}' array")
+                continue
+            if self.buffer[pos] == "]":
+                pos += 1
+                break
+            if self.buffer[pos] == ",":
+                pos += 1
+                continue
+            try:
+                item, end = self.decoder.raw_decode(self.buffer, pos)
+                end = WHITESPACE.match(self.buffer, end).end()
+            except json.JSONDecodeError:
+                end = len(self.buffer)
+            # Only trust a value followed by its delimiter: a number cut at
+            # the chunk edge (12|3, 1.|5) decodes "successfully" too early
+            if end == len(self.buffer) or self.buffer[end] not in ",]":
+                self.buffer = self.buffer[pos:]
+                pos = 0
+                if not self.read():
+                    raise ValueError(f"Truncated item in '{self.key}' array")
+                continue
+            pos = end
+            self.count += 1
+            yield item
+
+        while self.read():
+            pass
+        self.document = json.loads(prefix + self.buffer[pos:])
+        self.buffer = ""
+
+
+class Paginator:
+    """
+    Iterates the items of every page of a page/limit listing
+
+    Follows `pagination.hasNext` (or `links.next` when there is no
+    pagination block), requesting page+1 with the original params so sort
+    order and filters carry over. With `prefetch` the next page is
+    downloaded on a background thread while the current one is consumed;
+    on the last page that one speculative request is discarded.
+    """
+
+    def __init__(
+        self,
+        client,
+        endpoint,
+        params=None,
+        key="data",
+        page_param="page",
+        prefetch=True,
+        chunk_size=16384,
+        max_pages=None,
+    ):
+        self.client = client
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+        self.key = key
+        self.page_param = page_param
+        self.prefetch = prefetch
+        self.chunk_size = chunk_size
+        self.max_pages = max_pages
+        self.pages = 0
+        self.items = 0
+        self.pagination = {}
+        self.links = {}
+
+    def fetch(self, page, download=False):
+        """Request one page; `download` reads the body now (prefetch thread)"""
+        params = {**self.params, self.page_param: page}
+        response = self.client.request("GET", self.endpoint, params=params, stream=True)
+        response.raise_for_status()
+        if download:
+            response.content
+        return response
+
+    def has_next(self, document, page_items):
+        """Whether the page just read says another page follows"""
+        self.pagination = document.get("pagination") or {}
+        self.links = document.get("links") or {}
+        if "hasNext" in self.pagination:
+            return bool(self.pagination["hasNext"])
+        if self.links:
+            return "next" in self.links
+        return page_items > 0
+
+    @staticmethod
+    def discard(upcoming):
+        """Drop an unneeded prefetch, whatever it ended with"""
+        try:
+            upcoming.result().close()
+        except Exception:
+            pass
+
+    def __iter__(self):
+        page = int(self.params.get(self.page_param, 1))
+        upcoming = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            try:
+                response = self.fetch(page)
+                while True:
+                    if self.prefetch:
+                        upcoming = pool.submit(self.fetch, page + 1, True)
+
+                    stream = JSONArrayStream(
+                        response.iter_content(self.chunk_size), self.key
+                    )
+                    try:
+                        for item in stream:
+                            self.items += 1
+                            yield item
+                    finally:
+                        response.close()
+                    self.pages += 1
+
+                    more = self.has_next(stream.document, stream.count)
+                    if not more or self.pages == self.max_pages:
+                        return
+                    page += 1
+                    if upcoming is None:
+                        response = self.fetch(page)
+                    else:
+                        response, upcoming = upcoming.result(), None
+            finally:
+                # Stopped early (last page, max_pages or consumer break)
+                if upcoming is not None:
+                    self.discard(upcoming)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Rate-Limit-Aware Throttling
+Author: QA Team
+Date: 2026-10-18
+Framework: token bucket driven by X-RateLimit-* / Retry-After headers
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# X-RateLimit-Reset values below this are delta-seconds, above are epochs
+EPOCH_THRESHOLD = 1_000_000_000
+
+
+def header_int(headers, name):
+    """Integer header value, or None when missing or malformed"""
+    try:
+        return int(float(headers[name]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate` tokens per second, up to `capacity`
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token, returning how long the caller must wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimitThrottle:
+    """
+    Client-side throttle that tracks the server's advertised quota
+
+    Shared by every client sending on one quota (e.g. all load workers).
+    Before each request acquire() waits while the known remaining budget
+    for the current window is spent or a Retry-After is in force; observe()
+    updates that budget from X-RateLimit-Limit/Remaining/Reset and
+    Retry-After. An optional `rate` adds a fixed requests/second cap.
+    """
+
+    def __init__(self, rate=None, reset_margin=0.05):
+        self.bucket = TokenBucket(rate) if rate else None
+        self.reset_margin = reset_margin
+        self.lock = threading.Lock()
+        self.limit = None
+        self.budget = None
+        self.window_reset = 0.0
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.waited = 0.0
+        self.throttled = 0
+
+    def delay(self):
+        """Seconds to wait before the next request may be sent"""
+        now = time.time()
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.budget is not None and self.budget <= 0:
+            if self.window_reset > now:
+                return self.window_reset + self.reset_margin - now
+            # Window rolled over: assume a fresh quota until told otherwise
+            self.budget = self.limit
+        return 0.0
+
+    def acquire(self):
+        """Block until the request fits in the quota, then claim it"""
+        waited = self.bucket.acquire() if self.bucket else 0.0
+        while True:
+            with self.lock:
+                wait = self.delay()
+                if wait <= 0:
+                    if self.budget is not None:
+                        self.budget -= 1
+                    self.in_flight += 1
+                    self.waited += waited
+                    if waited:
+                        self.throttled += 1
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+    def observe(self, response):
+        """Update the quota from a response's rate-limit headers"""
+        headers = response.headers
+        limit = header_int(headers, "X-RateLimit-Limit")
+        remaining = header_int(headers, "X-RateLimit-Remaining")
+        reset = header_int(headers, "X-RateLimit-Reset")
+        retry_after = header_int(headers, "Retry-After")
+        now = time.time()
+        if reset is not None and reset < EPOCH_THRESHOLD:
+            reset = now + reset
+
+        with self.lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+            if limit is not None:
+                self.limit = limit
+            if remaining is not None:
+                # Other requests in flight will also spend server quota
+                server_budget = remaining - self.in_flight
+                if reset is not None and reset > self.window_reset:
+                    self.window_reset = reset
+                    self.budget = server_budget
+                elif self.budget is None:
+                    self.budget = server_budget
+                else:
+                    self.budget = min(self.budget, server_budget)
+            if response.status_code == 429:
+                self.budget = 0
+                self.blocked_until = max(self.blocked_until, now + (retry_after or 1))
+
+    def release(self):
+        """Forget an acquired slot whose request failed without a response"""
+        with self.lock:
+            self.in_flight = max(self.in_flight - 1, 0)
+
+
+class BurstResult:
+    """
+    Outcome of burst(): status counts and the first 429, not every response
+    """
+
+    def __init__(self):
+        self.sent = 0
+        self.status_counts = {}
+        self.first_limited = None
+        self.elapsed = 0.0
+
+
+def burst(client_factory, endpoint, max_requests, concurrency=20, params=None):
+    """
+    Fire up to `max_requests` GETs concurrently, stopping at the first 429
+
+    Each of the `concurrency` threads uses its own client from
+    `client_factory`, so a quota can be exhausted in well under a second.
+    An exception in any thread stops the burst and is re-raised.
+    """
+    result = BurstResult()
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def worker():
+        client = client_factory()
+        while not stop.is_set():
+            with lock:
+                if result.sent >= max_requests:
+                    return
+                result.sent += 1
+            try:
+                response = client.get(endpoint, params=params)
+            except Exception:
+                stop.set()
+                raise
+            with lock:
+                status = response.status_code
+                result.status_counts[status] = result.status_counts.get(status, 0) + 1
+                if status == 429 and result.first_limited is None:
+                    result.first_limited = response
+                    stop.set()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        futures = [pool.submit(worker) for _ in range(concurrency)]
+    result.elapsed = time.perf_counter() - start
+    for future in futures:
+        future.result()
+    return result
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Run-to-Run Regression Detection
+Author: QA Team
+Date: 2026-10-18
+Framework: numpy statistics over result_store files
+
+Compares each endpoint's latency distribution in a run against a
+baseline run. A one-sided Mann-Whitney U test asks whether the run is
+slower at all; a bootstrap confidence interval on the relative change
+of each percentile asks whether it is slower by more than `threshold`.
+Only an endpoint that passes both is a regression, so a statistically
+real 1% shift or a noisy p99 does not fail the build. Error rates are
+compared with a two-proportion z-test.
+
+    python regression.py compare baseline.qar run.qar
+    python regression.py gate run.qar --store perf-baselines --promote
+
+Both exit 1 when any endpoint regressed. `gate` checks the run against
+the newest baseline and against the oldest one kept, so a slowdown that
+creeps in below the threshold night after night is still caught.
+"""
+
+import argparse
+import math
+import os
+import shutil
+import time
+
+import numpy as np
+
+from result_store import ResultSet
+
+OK = "ok"
+REGRESSION = "REGRESSION"
+IMPROVED = "improved"
+INSUFFICIENT = "insufficient"
+
+
+def mann_whitney(base, current):
+    """
+    One-sided p-values (current slower, current faster) and effect size
+
+    Normal approximation with tie correction; the effect size is the
+    probability that a random current sample exceeds a random base one.
+    """
+    n1, n2 = len(base), len(current)
+    combined = np.concatenate((base, current))
+    order = np.argsort(combined, kind="mergesort")
+    _, first, counts = np.unique(combined[order], return_index=True, return_counts=True)
+    ranks = np.empty(len(combined))
+    ranks[order] = np.repeat(first + (counts + 1) / 2, counts)
+    u = ranks[n1:].sum() - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    ties = float((counts.astype(np.float64) ** 3 - counts).sum())
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0, 1.0, 0.5
+    sigma = math.sqrt(variance)
+    mean = n1 * n2 / 2
+    slower = 0.5 * math.erfc((u - mean - 0.5) / sigma / math.sqrt(2))
+    faster = 0.5 * math.erfc((mean - u - 0.5) / sigma / math.sqrt(2))
+    return slower, faster, u / (n1 * n2)
+
+
+def bootstrap_percentile(ordered, percent, resamples, rng):
+    """
+    Bootstrap distribution of a nearest-rank percentile
+
+    The k-th smallest of a size-n resample is the sorted sample at
+    ceil(n * U) for U ~ Beta(k, n - k + 1), so each replicate costs O(1)
+    instead of a resample and sort.
+    """
+    n = len(ordered)
+    k = max(math.ceil(percent / 100 * n), 1)
+    index = np.ceil(n * rng.beta(k, n - k + 1, resamples)).astype(np.int64) - 1
+    return ordered[np.clip(index, 0, n - 1)]
+
+
+def two_proportions(errors1, n1, errors2, n2):
+    """One-sided p-value that the second error rate is higher"""
+    pooled = (errors1 + errors2) / (n1 + n2)
+    spread = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    if not spread:
+        return 1.0
+    z = (errors2 / n2 - errors1 / n1) / spread
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class EndpointComparison:
+    """
+    Verdict for one endpoint
+
+    `changes` maps each percentile to (relative change, CI low, CI high).
+    """
+
+    def __init__(self, endpoint, base_count, current_count):
+        self.endpoint = endpoint
+        self.base_count = base_count
+        self.current_count = current_count
+        self.p_slower = self.p_faster = 1.0
+        self.effect = 0.5
+        self.changes = {}
+        self.error_rates = (0.0, 0.0)
+        self.error_p = 1.0
+        self.verdict = INSUFFICIENT
+        self.reasons = []
+
+
+class Comparison:
+    """
+    All endpoint verdicts of compare()
+    """
+
+    def __init__(self, rows, alpha, threshold):
+        self.rows = rows
+        self.alpha = alpha
+        self.threshold = threshold
+
+    @property
+    def regressions(self):
+        """Endpoints that got significantly slower or less reliable"""
+        return [row for row in self.rows if row.verdict == REGRESSION]
+
+    @property
+    def passed(self):
+        """Whether no endpoint regressed"""
+        return not self.regressions
+
+    def table(self):
+        """Compact per-endpoint verdict table"""
+        percents = sorted({p for row in self.rows for p in row.changes})
+        lines = [
+            f"{'endpoint':<28} {'base':>7} {'run':>7}"
+            + "".join(f" {f'p{p:g} change [CI]':>24}" for p in percents)
+            + f" {'p(slower)':>9}  verdict"
+        ]
+        for row in self.rows:
+            cells = ""
+            for percent in percents:
+                change = row.changes.get(percent)
+                cells += (
+                    f" {change[0]:>+7.1%} [{change[1]:>+6.1%},{change[2]:>+6.1%}]"
+                    if change
+                    else f" {'-':>24}"
+                )
+            lines.append(
+                f"{row.endpoint:<28} {row.base_count:>7} {row.current_count:>7}"
+                f"{cells} {row.p_slower:>9.2g}  {row.verdict}"
+            )
+            for reason in row.reasons:
+                lines.append(f"    {reason}")
+        outcome = "PASS" if self.passed else f"FAIL: {len(self.regressions)} regressed"
+        lines.append(
+            f"{outcome} (alpha={self.alpha:g}, threshold={self.threshold:.0%})"
+        )
+        return "\n".join(lines)
+
+
+def compare(
+    base,
+    current,
+    percents=(50, 95),
+    alpha=0.01,
+    threshold=0.05,
+    error_threshold=0.005,
+    min_samples=30,
+    resamples=2000,
+    seed=0,
+):
+    """
+    Compare two ResultSets endpoint by endpoint
+
+    Latency is judged on successful samples only. An endpoint regresses
+    when Mann-Whitney says it is slower (p < alpha) and the lower bound of
+    the (1 - alpha) bootstrap interval of some percentile's relative
+    change exceeds `threshold`, or when its error rate rose by more than
+    `error_threshold` with p < alpha.
+    """
+    rng = np.random.default_rng(seed)
+    tail = alpha / 2 * 100
+    base_ids, current_ids = dict(base.endpoints()), dict(current.endpoints())
+    base_ok, current_ok = ~base.errors(), ~current.errors()
+    rows = []
+    for endpoint in sorted(set(base_ids) & set(current_ids)):
+        base_mask = base["endpoint"] == base_ids[endpoint]
+        current_mask = current["endpoint"] == current_ids[endpoint]
+        before = np.sort(base["latency"][base_mask & base_ok].astype(np.float64))
+        after = np.sort(
+            current["latency"][current_mask & current_ok].astype(np.float64)
+        )
+        row = EndpointComparison(endpoint, len(before), len(after))
+        rows.append(row)
+
+        totals = (int(base_mask.sum()), int(current_mask.sum()))
+        errors = (totals[0] - len(before), totals[1] - len(after))
+        row.error_rates = (errors[0] / totals[0], errors[1] / totals[1])
+        row.error_p = two_proportions(errors[0], totals[0], errors[1], totals[1])
+        if min(totals) < min_samples:
+            continue
+        row.verdict = OK
+        rise = row.error_rates[1] - row.error_rates[0]
+        if row.error_p < alpha and rise > error_threshold:
+            row.verdict = REGRESSION
+            row.reasons.append(
+                f"error rate {row.error_rates[0]:.2%} -> {row.error_rates[1]:.2%}"
+                f" (p={row.error_p:.2g})"
+            )
+        if min(len(before), len(after)) < min_samples:
+            continue
+
+        row.p_slower, row.p_faster, row.effect = mann_whitney(before, after)
+        for percent in percents:
+            boot_before = bootstrap_percentile(before, percent, resamples, rng)
+            boot_after = bootstrap_percentile(after, percent, resamples, rng)
+            ratios = boot_after / np.maximum(boot_before, 1e-9) - 1
+            low, high = np.percentile(ratios, [tail, 100 - tail])
+            point = percentile_of(after, percent) / percentile_of(before, percent) - 1
+            row.changes[percent] = (point, float(low), float(high))
+            if row.p_slower < alpha and low > threshold:
+                row.verdict = REGRESSION
+                row.reasons.append(
+                    f"p{percent:g} slower by at least {low:.1%} (p={row.p_slower:.2g})"
+                )
+        if row.verdict == OK and row.p_faster < alpha:
+            if any(high < -threshold for _, _, high in row.changes.values()):
+                row.verdict = IMPROVED
+    return Comparison(rows, alpha, threshold)
+
+
+def percentile_of(ordered, percent):
+    """Nearest-rank percentile of a sorted array"""
+    return ordered[max(math.ceil(percent / 100 * len(ordered)), 1) - 1]
+
+
+class BaselineStore:
+    """
+    Directory of past result files, newest last
+
+    Files are named `<label>.qar`; the label defaults to a UTC timestamp
+    so names sort chronologically. Only the newest `keep` are kept.
+    """
+
+    def __init__(self, root, keep=30):
+        self.root = os.fspath(root)
+        self.keep = keep
+        os.makedirs(self.root, exist_ok=True)
+
+    def labels(self):
+        """Stored run labels, oldest first"""
+        return sorted(
+            name[: -len(".qar")]
+            for name in os.listdir(self.root)
+            if name.endswith(".qar")
+        )
+
+    def path(self, label):
+        """File of a stored run"""
+        return os.path.join(self.root, f"{label}.qar")
+
+    def latest(self):
+        """Label of the newest stored run, or None"""
+        labels = self.labels()
+        return labels[-1] if labels else None
+
+    def references(self):
+        """Labels to gate against: the newest run and the oldest kept one"""
+        labels = self.labels()
+        return sorted({labels[-1], labels[0]}, reverse=True) if labels else []
+
+    def add(self, path, label=None):
+        """Copy a result file into the store and prune old runs"""
+        label = label or time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        shutil.copyfile(path, self.path(label))
+        for old in self.labels()[: -self.keep]:
+            os.remove(self.path(old))
+        return label
+
+    def rebase(self, path, label=None):
+        """Replace every stored run with this one (an accepted change)"""
+        for old in self.labels():
+            os.remove(self.path(old))
+        return self.add(path, label)
+
+
+def gate(path, store, promote=False, label=None, **options):
+    """
+    Compare a run with store.references(); [(label, Comparison), ...]
+
+    The newest baseline catches a step change, the oldest kept one (the
+    anchor) catches drift accumulated across passing runs. The list is
+    empty when the store has no runs yet. With `promote` a run that
+    passed every comparison (or the very first one) is stored as well.
+    """
+    current = ResultSet.load(path)
+    comparisons = [
+        (reference, compare(ResultSet.load(store.path(reference)), current, **options))
+        for reference in store.references()
+    ]
+    if promote and all(comparison.passed for _, comparison in comparisons):
+        store.add(path, label)
+    return comparisons
+
+
+def main():
+    """Command line comparison and baseline gate"""
+    parser = argparse.ArgumentParser(description="Performance regression check")
+    commands = parser.add_subparsers(dest="command", required=True)
+    direct = commands.add_parser("compare", help="compare two result files")
+    direct.add_argument("base")
+    direct.add_argument("current")
+    stored = commands.add_parser("gate", help="compare with the newest baseline")
+    stored.add_argument("current")
+    stored.add_argument("--store", required=True, help="baseline directory")
+    stored.add_argument("--promote", action="store_true")
+    stored.add_argument(
+        "--accept",
+        action="store_true",
+        help="make this run the only baseline (after a deliberate change)",
+    )
+    stored.add_argument("--label", help="name for the promoted baseline")
+    for command in (direct, stored):
+        command.add_argument("--alpha", type=float, default=0.01)
+        command.add_argument("--threshold", type=float, default=0.05)
+        command.add_argument("--percentiles", default="50,95")
+    args = parser.parse_args()
+
+    options = {
+        "alpha": args.alpha,
+        "threshold": args.threshold,
+        "percents": tuple(float(p) for p in args.percentiles.split(",")),
+    }
+    if args.command == "compare":
+        comparison = compare(
+            ResultSet.load(args.base), ResultSet.load(args.current), **options
+        )
+        print(comparison.table())
+        raise SystemExit(0 if comparison.passed else 1)
+
+    store = BaselineStore(args.store)
+    if args.accept:
+        print(f"Baselines reset to {store.rebase(args.current, args.label)}")
+        return
+    comparisons = gate(args.current, store, args.promote, args.label, **options)
+    if not comparisons:
+        print("No baseline yet" + (": run stored" if args.promote else ""))
+        return
+    for reference, comparison in comparisons:
+        print(f"vs {reference}:\n{comparison.table()}\n")
+    raise SystemExit(0 if all(c.passed for _, c in comparisons) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Request Timing Instrumentation
+Author: QA Team
+Date: 2026-10-18
+Framework: requests/urllib3 with time.perf_counter_ns
+"""
+
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ("retry", "connect", "tls", "ttfb", "body", "decode")
+
+_active = threading.local()
+
+
+class RequestTiming:
+    """
+    Monotonic per-phase timings of a single request, in nanoseconds
+
+    Phases do not overlap and only cover work actually done for this
+    request: `connect` (DNS lookup plus TCP handshake, since urllib3
+    resolves inside its connect call) and `tls` are zero when a pooled
+    connection was reused; `ttfb` is the wait from sending the request to
+    receiving the response headers; `body` is the download of the body and
+    `decode` the JSON parse. When a request is retried, `retry` holds
+    everything before the final attempt (failed attempts and backoff) and
+    the other phases describe the final attempt only.
+
+    `intended_ns` is set when an open-loop scheduler meant the request to
+    go out earlier (see intend_start); `latency` then counts from that
+    moment, so time spent queued behind a stall is not lost.
+    """
+
+    def __init__(self, method, endpoint):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.status = None
+        self.response_bytes = 0
+        self.phases = dict.fromkeys(PHASES, 0)
+        self.started_ns = time.perf_counter_ns()
+        self.attempt_started_ns = self.started_ns
+        self.attempts = 1
+        self.total_ns = 0
+        self.intended_ns = None
+        self.latency_ns = 0
+
+    def add(self, phase, duration_ns):
+        """Accumulate time spent in a phase"""
+        self.phases[phase] += duration_ns
+
+    def next_attempt(self):
+        """Fold everything so far into `retry` and start a fresh attempt"""
+        now = time.perf_counter_ns()
+        self.phases = dict.fromkeys(PHASES, 0)
+        self.phases["retry"] = now - self.started_ns
+        self.attempt_started_ns = now
+        self.attempts += 1
+        self.status = None
+
+    def finish(self):
+        """Close the measurement window"""
+        now = time.perf_counter_ns()
+        self.total_ns = now - self.started_ns
+        self.latency_ns = now - min(
+            self.intended_ns or self.started_ns, self.started_ns
+        )
+
+    @property
+    def total(self):
+        """Total request time in seconds"""
+        return self.total_ns / 1e9
+
+    @property
+    def latency(self):
+        """Seconds from the intended send time (else from the start)"""
+        return self.latency_ns / 1e9
+
+    def seconds(self, phase):
+        """Time spent in a phase in seconds"""
+        return self.phases[phase] / 1e9
+
+    def __repr__(self):
+        phases = " ".join(f"{p}={self.seconds(p) * 1000:.2f}ms" for p in PHASES)
+        return (
+            f"<RequestTiming {self.method} {self.endpoint} {self.status} "
+            f"attempts={self.attempts} "
+            f"total={self.total * 1000:.2f}ms {phases}>"
+        )
+
+
+class TimingHooks:
+    """
+    Subscribers notified with a RequestTiming after every request
+    """
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        """Register `callback(timing)`; returns the callback for unsubscribe"""
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Remove a previously registered callback"""
+        self.subscribers.remove(callback)
+
+    def emit(self, timing):
+        """Deliver a finished timing to every subscriber"""
+        for callback in self.subscribers:
+            callback(timing)
+
+
+# Notified for every request from every APIClient (e.g. the SLO plugin)
+global_hooks = TimingHooks()
+
+# Notified with the fresh timing as every APIClient request starts
+global_start_hooks = TimingHooks()
+
+
+def intend_start(perf_counter_ns):
+    """Intended send time of the next request started on this thread"""
+    _active.intended_ns = perf_counter_ns
+
+
+def start_timing(method, endpoint):
+    """Begin timing a request on the current thread"""
+    timing = RequestTiming(method, endpoint)
+    timing.intended_ns = getattr(_active, "intended_ns", None)
+    _active.intended_ns = None
+    _active.timing = timing
+    return timing
+
+
+def stop_timing():
+    """Detach the current thread's timing"""
+    _active.timing = None
+
+
+def current_timing():
+    """Timing of the request in flight on this thread, if any"""
+    return getattr(_active, "timing", None)
+
+
+class TimedConnectionMixin:
+    """
+    Adds connect/TLS phase timings to urllib3 connections
+    """
+
+    def _new_conn(self):
+        start = time.perf_counter_ns()
+        try:
+            return super()._new_conn()
+        finally:
+            self.new_conn_ns = time.perf_counter_ns() - start
+
+    def connect(self):
+        self.new_conn_ns = 0
+        start = time.perf_counter_ns()
+        super().connect()
+        elapsed = time.perf_counter_ns() - start
+        timing = current_timing()
+        if timing is not None:
+            timing.add("connect", self.new_conn_ns)
+            if isinstance(self, HTTPSConnection):
+                timing.add("tls", elapsed - self.new_conn_ns)
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    """HTTP connection reporting connect time"""
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection reporting connect and TLS handshake time"""
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Pool creating timed HTTP connections"""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Pool creating timed HTTPS connections"""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter whose pools use the timed connection classes
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Retries and Circuit Breaking
+Author: QA Team
+Date: 2026-10-18
+Framework: requests exceptions, jittered exponential backoff
+
+Keeps a failing or hung backend from stalling tests: APIClient retries
+transient failures of idempotent calls and stops sending to a host whose
+circuit breaker has tripped.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.exceptions import ConnectTimeoutError
+
+from rate_limit import header_int
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Request refused locally because the host's circuit is open
+    """
+
+
+def connect_failed(error):
+    """Whether a request failed while connecting, before anything was sent"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    # urllib3's NewConnectionError (refused, DNS) subclasses ConnectTimeoutError
+    return isinstance(reason, ConnectTimeoutError)
+
+
+class RetryPolicy:
+    """
+    Which failures to retry and how long to back off
+
+    Idempotent methods are retried on connection errors, timeouts and
+    `statuses`; any method is retried on a connect failure (refused,
+    unresolvable or timed out, so nothing was sent) and on 429. Backoff is
+    "full jitter": a uniform draw between 0 and backoff * 2**attempt,
+    capped at `max_backoff`. A server's Retry-After is honoured in full;
+    when it exceeds `max_backoff` the response is returned instead.
+    """
+
+    def __init__(
+        self,
+        retries=2,
+        backoff=0.1,
+        max_backoff=2.0,
+        statuses=RETRY_STATUSES,
+        methods=IDEMPOTENT_METHODS,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+
+    def should_retry(self, method, attempt, response=None, error=None):
+        """Whether attempt number `attempt` (1-based) deserves another try"""
+        if attempt > self.retries or isinstance(error, CircuitOpenError):
+            return False
+        if error is not None:
+            if connect_failed(error):
+                return True
+            return method.upper() in self.methods and isinstance(
+                error, (requests.ConnectionError, requests.Timeout)
+            )
+        retry_after = header_int(response.headers, "Retry-After")
+        if retry_after is not None and retry_after > self.max_backoff:
+            return False
+        if response.status_code == 429:
+            return True
+        return method.upper() in self.methods and response.status_code in self.statuses
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before attempt number `attempt` + 1"""
+        if response is not None:
+            retry_after = header_int(response.headers, "Retry-After")
+            if retry_after is not None:
+                return retry_after
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Classic closed/open/half-open breaker for one host
+
+    `failure_threshold` consecutive failures (exceptions or 5xx) open the
+    circuit; after `reset_timeout` seconds one probe request is let
+    through, closing it again on success or reopening it on failure.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    def before(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        with self.lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at >= self.reset_timeout:
+                    self.state = HALF_OPEN
+                    self.probing = False
+            if self.state == HALF_OPEN and not self.probing:
+                self.probing = True
+                return
+            if self.state == CLOSED:
+                return
+            self.rejected += 1
+        raise CircuitOpenError(f"Circuit {self.state}: request not sent")
+
+    def success(self):
+        """Record a healthy response"""
+        with self.lock:
+            self.failures = 0
+            self.probing = False
+            self.state = CLOSED
+
+    def failure(self):
+        """Record a failed request"""
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            tripped = self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            )
+            if tripped:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+
+    def record(self, status):
+        """Record a response by status code (5xx counts as failure)"""
+        if status >= 500:
+            self.failure()
+        else:
+            self.success()
+
+    def metrics(self):
+        """Current state and counters"""
+        return {
+            "state": self.state,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "consecutive_failures": self.failures,
+        }
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per host, shared by every client given this registry
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def for_url(self, url):
+        """Breaker for the host (and port) of `url`"""
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            with self.lock:
+                breaker = self.breakers.setdefault(
+                    host, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                )
+        return breaker
+
+    def metrics(self):
+        """Per-host state and trip counts"""
+        return {host: breaker.metrics() for host, breaker in self.breakers.items()}
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Created Resource Tracker
+Author: QA Team
+Date: 2026-10-18
+Framework: aiohttp fan-out with bounded parallelism
+
+Records every entity a test run creates so it can all be deleted at
+session teardown, keeping shared environments from filling up with test
+data over long or repeated runs.
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+from async_api_client import AsyncAPIClient
+
+# Statuses meaning the resource no longer exists
+GONE = (200, 202, 204, 404, 410)
+
+
+class CleanupReport:
+    """
+    Outcome of ResourceTracker.cleanup()
+    """
+
+    def __init__(self):
+        self.deleted = 0
+        self.failed = {}
+        self.rounds = 0
+        self.elapsed = 0.0
+
+    def __str__(self):
+        text = (
+            f"Cleanup: {self.deleted} deleted, {len(self.failed)} failed "
+            f"in {self.elapsed:.2f}s ({self.rounds} round(s))"
+        )
+        for path, outcome in sorted(self.failed.items()):
+            text += f"\n  {path}: {outcome}"
+        return text
+
+
+class ResourceTracker:
+    """
+    Thread-safe registry of created resource paths (e.g. /users/20001)
+
+    APIClient records a path for every 201 from post() (from the Location
+    header, else the endpoint plus the body's id) and forgets it when a
+    delete() succeeds. cleanup() deletes what is left, newest first, with
+    at most `concurrency` requests in flight, retrying failures up to
+    `retries` more rounds with exponential backoff.
+    """
+
+    def __init__(self, concurrency=20, retries=2, backoff=0.5):
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.paths = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def add(self, path):
+        """Track a resource path relative to the API base URL"""
+        with self.lock:
+            self.paths[path] = None
+
+    def discard(self, path):
+        """Stop tracking a resource (already deleted)"""
+        with self.lock:
+            self.paths.pop(path, None)
+
+    def record(self, base_url, endpoint, response):
+        """Track the resource a successful POST created, if identifiable"""
+        if response.status_code != 201:
+            return None
+        path = response.headers.get("Location")
+        if path:
+            path = self.relative(base_url, path)
+        else:
+            try:
+                path = f"{endpoint.rstrip('/')}/{response.json()['id']}"
+            except (ValueError, KeyError, TypeError):
+                return None
+        self.add(path)
+        return path
+
+    @staticmethod
+    def relative(base_url, location):
+        """Location header as a path relative to the API base URL"""
+        base_path = urlparse(base_url).path.rstrip("/")
+        path = urlparse(location).path if "://" in location else location
+        if base_path and path.startswith(f"{base_path}/"):
+            path = path[len(base_path) :]
+        return path
+
+    def cleanup(self, base_url, token=None):
+        """Delete every tracked resource; returns a CleanupReport"""
+        report = CleanupReport()
+        start = time.perf_counter()
+        with self.lock:
+            pending = list(reversed(self.paths))
+
+        async def delete_all(paths):
+            async with AsyncAPIClient(base_url, concurrency=self.concurrency) as api:
+                if token:
+                    api.set_auth_token(token)
+                return await api.gather(
+                    [("DELETE", path) for path in paths], return_exceptions=True
+                )
+
+        while pending and report.rounds <= self.retries:
+            if report.rounds:
+                time.sleep(self.backoff * 2 ** (report.rounds - 1))
+            report.rounds += 1
+            retry = []
+            for path, response in zip(pending, asyncio.run(delete_all(pending))):
+                status = getattr(response, "status_code", None)
+                if status in GONE:
+                    self.discard(path)
+                    report.deleted += 1
+                    report.failed.pop(path, None)
+                else:
+                    report.failed[path] = status or type(response).__name__
+                    retry.append(path)
+            pending = retry
+
+        report.elapsed = time.perf_counter() - start
+        return report
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Binary Result Store
+Author: QA Team
+Date: 2026-10-18
+Framework: append-only columnar blocks, numpy for analysis
+
+Every APIClient request of a run is stored as one sample: wall-clock
+start time, endpoint, status, latency, total and per-phase seconds, and
+response bytes (48 bytes per sample). `latency` counts from the intended
+send time when an open-loop scheduler set one (see RequestTiming) and
+equals the service time `total` otherwise; analysis uses `latency`.
+Samples are buffered column by column and appended as a block every
+`block_size` samples, so recording costs the same no matter how long the
+run is, and a reader maps whole columns straight into numpy arrays.
+
+File layout (little-endian):
+
+    MAGIC
+    block* = u8 kind, u32 count, payload
+             kind "D": u32 length + JSON list of new dictionary strings
+             kind "S": `count` values of each column in COLUMNS order
+
+A block cut short by a crash is ignored on read. Analyse with:
+
+    python result_store.py summary run.qar
+    python result_store.py timeseries run.qar --interval 10
+    python result_store.py diff baseline.qar run.qar
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+
+import numpy as np
+
+from latency_histogram import endpoint_key
+from request_timing import PHASES, global_hooks
+
+MAGIC = b"QARES2\n\0"
+BLOCK = struct.Struct("<cI")
+LENGTH = struct.Struct("<I")
+
+# (name, array typecode, numpy dtype)
+COLUMNS = (
+    ("time", "d", "<f8"),
+    ("endpoint", "H", "<u2"),
+    ("status", "H", "<u2"),
+    ("latency", "f", "<f4"),
+    ("total", "f", "<f4"),
+    *((phase, "f", "<f4") for phase in PHASES),
+    ("bytes", "I", "<u4"),
+)
+
+PERCENTS = (50, 90, 95, 99)
+
+
+class ResultWriter:
+    """
+    Appends request samples to a result file
+
+    Subscribe `record` to request_timing.global_hooks (see `attach`) or
+    call it with each RequestTiming. Endpoints and statuses are stored as
+    ids into a string dictionary that grows with the file.
+    """
+
+    def __init__(self, path, block_size=8192):
+        self.path = os.fspath(path)
+        self.block_size = block_size
+        self.lock = threading.Lock()
+        self.strings = {}
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            strings, _, end = read_blocks(self.path)
+            for text in strings:
+                self.strings[text] = len(self.strings)
+            # Drop a block left incomplete by a crashed writer
+            self.file = open(self.path, "r+b")
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            self.file = open(self.path, "wb")
+            self.file.write(MAGIC)
+        self.new_strings = []
+        self.columns = [array(code) for _, code, _ in COLUMNS]
+        self.attached = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def attach(self):
+        """Record every APIClient request from now on"""
+        global_hooks.subscribe(self.record)
+        self.attached = True
+        return self
+
+    def string_id(self, text):
+        """Dictionary id of a string, adding it if new (lock held)"""
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+            self.new_strings.append(text)
+        return index
+
+    def record(self, timing):
+        """Buffer one finished RequestTiming"""
+        phases = timing.phases
+        with self.lock:
+            values = (
+                time.time() - timing.latency,
+                self.string_id(endpoint_key(timing.method, timing.endpoint)),
+                self.string_id(str(timing.status)),
+                timing.latency,
+                timing.total,
+                *(phases[phase] / 1e9 for phase in PHASES),
+                timing.response_bytes,
+            )
+            for column, value in zip(self.columns, values):
+                column.append(value)
+            if len(self.columns[0]) >= self.block_size:
+                self.flush_block()
+
+    def flush_block(self):
+        """Write buffered strings and samples as blocks (lock held)"""
+        if self.new_strings:
+            payload = json.dumps(self.new_strings).encode("utf-8")
+            self.file.write(BLOCK.pack(b"D", len(self.new_strings)))
+            self.file.write(LENGTH.pack(len(payload)) + payload)
+            self.new_strings = []
+        count = len(self.columns[0])
+        if count:
+            self.file.write(BLOCK.pack(b"S", count))
+            for column in self.columns:
+                if sys.byteorder == "big":
+                    column.byteswap()
+                self.file.write(column.tobytes())
+            self.columns = [array(code) for _, code, _ in COLUMNS]
+        self.file.flush()
+
+    def close(self):
+        """Flush the last partial block and close the file"""
+        if self.attached:
+            global_hooks.unsubscribe(self.record)
+            self.attached = False
+        with self.lock:
+            if self.file is not None:
+                self.flush_block()
+                self.file.close()
+                self.file = None
+
+
+def read_blocks(path):
+    """Dictionary strings, raw sample blocks and end of the last whole block"""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a result file")
+    strings, blocks = [], []
+    row = sum(struct.calcsize(code) for _, code, _ in COLUMNS)
+    offset = len(MAGIC)
+    while offset + BLOCK.size <= len(data):
+        kind, count = BLOCK.unpack_from(data, offset)
+        start = offset + BLOCK.size
+        if kind == b"D":
+            if start + LENGTH.size > len(data):
+                break
+            (length,) = LENGTH.unpack_from(data, start)
+            end = start + LENGTH.size + length
+            if end > len(data):
+                break
+            strings.extend(json.loads(data[start + LENGTH.size : end]))
+        elif kind == b"S":
+            end = start + count * row
+            if end > len(data):
+                break
+            blocks.append((data, start, count))
+        else:
+            raise ValueError(f"{path}: unknown block kind {kind!r} at {offset}")
+        offset = end
+    return strings, blocks, offset
+
+
+class ResultSet:
+    """
+    Every sample of a result file as numpy columns
+    """
+
+    def __init__(self, strings, columns):
+        self.strings = strings
+        self.columns = columns
+        # HTTP code per status id (0 for transport errors)
+        self.codes = np.array(
+            [int(text) if text.isdigit() else 0 for text in strings] or [0],
+            dtype="<u2",
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Read a result file written by ResultWriter"""
+        strings, blocks, _ = read_blocks(path)
+        parts = {name: [] for name, _, _ in COLUMNS}
+        for data, offset, count in blocks:
+            for name, _, dtype in COLUMNS:
+                column = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+                parts[name].append(column)
+                offset += column.nbytes
+        columns = {
+            name: (np.concatenate(chunks) if chunks else np.empty(0, dtype))
+            for (name, _, dtype), chunks in zip(COLUMNS, parts.values())
+        }
+        return cls(strings, columns)
+
+    def __len__(self):
+        return len(self.columns["time"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def status_codes(self):
+        """HTTP status code per sample (0 for transport errors)"""
+        return self.codes[self["status"]]
+
+    def errors(self):
+        """Boolean mask of errors (5xx and transport, see is_error)"""
+        codes = self.status_codes()
+        return (codes == 0) | (codes >= 500)
+
+    def endpoints(self):
+        """Endpoint names present, with their dictionary ids"""
+        ids = np.unique(self["endpoint"])
+        return [(self.strings[index], index) for index in ids]
+
+    def summary(self, percents=PERCENTS):
+        """{endpoint: row} with count, error rate, mean and percentiles"""
+        groups = self["endpoint"]
+        table = grouped_percentiles(groups, self["latency"], percents)
+        errors = np.bincount(groups, weights=self.errors(), minlength=len(table))
+        rows = {}
+        for name, index in self.endpoints():
+            count, mean, values = table[index]
+            rows[name] = {
+                "count": count,
+                "error_rate": float(errors[index] / count),
+                "mean": float(mean),
+                **{f"p{p}": value for p, value in zip(percents, values)},
+            }
+        return rows
+
+    def timeseries(self, interval=10.0, endpoint=None, percents=PERCENTS):
+        """
+        Rows of (offset seconds, count, rps, error rate, percentiles)
+
+        Raises KeyError for an `endpoint` the file has no samples of.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if endpoint is not None:
+            ids = dict(self.endpoints())
+            if endpoint not in ids:
+                raise KeyError(endpoint)
+            mask = self["endpoint"] == ids[endpoint]
+        times = self["time"][mask]
+        if not len(times):
+            return []
+        origin = times.min()
+        buckets = ((times - origin) // interval).astype(np.int64)
+        table = grouped_percentiles(buckets, self["latency"][mask], percents)
+        errors = np.bincount(buckets, weights=self.errors()[mask], minlength=len(table))
+        rows = []
+        for bucket, (count, mean, values) in enumerate(table):
+            if count:
+                rows.append(
+                    (bucket * interval, count, count / interval)
+                    + (float(errors[bucket] / count),)
+                    + tuple(values)
+                )
+        return rows
+
+
+def grouped_percentiles(groups, values, percents):
+    """
+    Per group id: (count, mean, [percentiles]) with nearest-rank percentiles
+
+    One lexsort orders values within their groups, so millions of samples
+    take one vectorized pass instead of a loop per group.
+    """
+    if not len(groups):
+        return []
+    size = int(groups.max()) + 1
+    counts = np.bincount(groups, minlength=size)
+    sums = np.bincount(groups, weights=values, minlength=size)
+    ordered = values[np.lexsort((values, groups))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    columns = []
+    for percent in percents:
+        rank = np.maximum(np.ceil(percent / 100 * counts).astype(np.int64), 1)
+        column = np.zeros(size)
+        column[present] = ordered[(starts + rank - 1)[present]]
+        columns.append(column)
+    table = []
+    for index in range(size):
+        count = int(counts[index])
+        mean = sums[index] / count if count else 0.0
+        table.append((count, mean, [float(column[index]) for column in columns]))
+    return table
+
+
+def format_summary(rows, percents=PERCENTS):
+    """Endpoint table of ResultSet.summary()"""
+    lines = [
+        f"{'endpoint':<28} {'count':>9} {'errors':>7} {'mean':>8}"
+        + "".join(f" {'p' + str(p):>8}" for p in percents)
+    ]
+    for name, row in sorted(rows.items()):
+        lines.append(
+            f"{name:<28} {row['count']:>9} {row['error_rate']:>7.2%}"
+            f" {row['mean'] * 1000:>6.1f}ms"
+            + "".join(f" {row[f'p{p}'] * 1000:>6.1f}ms" for p in percents)
+        )
+    return "\n".join(lines)
+
+
+def format_diff(base, current, percents=PERCENTS):
+    """Per-endpoint percentile change between two summaries"""
+    lines = [f"{'endpoint':<28} {'metric':<6} {'base':>9} {'current':>9} {'change':>8}"]
+    for name in sorted(set(base) | set(current)):
+        if name not in base or name not in current:
+            side = "current" if name in current else "base"
+            lines.append(f"{name:<28} only in {side}")
+            continue
+        for metric in ("mean", *(f"p{p}" for p in percents)):
+            before, after = base[name][metric], current[name][metric]
+            change = (after - before) / before if before else 0.0
+            lines.append(
+                f"{name:<28} {metric:<6} {before * 1000:>7.1f}ms {after * 1000:>7.1f}ms"
+                f" {change:>+8.1%}"
+            )
+        before, after = base[name]["error_rate"], current[name]["error_rate"]
+        lines.append(f"{name:<28} {'errors':<6} {before:>9.2%} {after:>9.2%}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command line analysis of result files"""
+    parser = argparse.ArgumentParser(description="Analyse binary result files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary = commands.add_parser("summary", help="per-endpoint percentiles")
+    summary.add_argument("path")
+    series = commands.add_parser("timeseries", help="percentiles per interval")
+    series.add_argument("path")
+    series.add_argument("--interval", type=float, default=10.0, help="seconds")
+    series.add_argument("--endpoint", help='e.g. "GET /products"')
+    diff = commands.add_parser("diff", help="compare two runs")
+    diff.add_argument("base")
+    diff.add_argument("current")
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        results = ResultSet.load(args.path)
+        print(f"{len(results)} samples")
+        print(format_summary(results.summary()))
+    elif args.command == "timeseries":
+        results = ResultSet.load(args.path)
+        try:
+            rows = results.timeseries(args.interval, args.endpoint)
+        except KeyError:
+            known = ", ".join(f'"{name}"' for name, _ in results.endpoints())
+            parser.error(f'no samples for "{args.endpoint}"; endpoints: {known}')
+        print(
+            f"{'offset':>8} {'count':>8} {'rps':>8} {'errors':>7}"
+            + "".join(f" {'p' + str(p):>8}" for p in PERCENTS)
+        )
+        for offset, count, rps, error_rate, *values in rows:
+            print(
+                f"{offset:>7.1f}s {count:>8} {rps:>8.1f} {error_rate:>7.2%}"
+                + "".join(f" {value * 1000:>6.1f}ms" for value in values)
+            )
+    else:
+        base = ResultSet.load(args.base).summary()
+        current = ResultSet.load(args.current).summary()
+        print(format_diff(base, current))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+User Journey Scenarios
+Author: QA Team
+Date: 2026-10-18
+Framework: APIClient journeys driven by load_engine
+
+A Scenario is a weighted mix of Journeys; a Journey is an ordered list of
+Steps with think time between them. Each virtual user of a LoadEngine run
+picks a journey by weight, runs its steps in order with a fresh context
+dict (values extracted from one response feed later steps), and stops at
+the first failing step. Journey latency is the time spent in requests,
+think time excluded, matching the "Total Journey Time" targets in
+Section 5 of the performance testing guide.
+"""
+
+import random
+import threading
+import time
+
+from data_factory import UserFactory
+from load_engine import LoadEngine, PhaseStats
+
+
+class Step:
+    """
+    One request of a journey
+
+    `action(client, context)` sends the request and returns the response;
+    `check(response)` judges it (default: status code below 400) and
+    `extract` maps context keys to `fn(response)` for later steps. `think`
+    (seconds or a (low, high) range) overrides the journey's think time
+    after this step.
+    """
+
+    def __init__(self, name, action, check=None, extract=None, think=None):
+        self.name = name
+        self.action = action
+        self.check = check or (lambda response: response.status_code < 400)
+        self.extract = extract or {}
+        self.think = think
+
+
+class JourneyRun:
+    """
+    Outcome of one journey iteration (the LoadEngine task result)
+    """
+
+    def __init__(self, journey):
+        self.journey = journey
+        self.status_code = None
+        self.ok = True
+        self.failed_step = None
+        self.aborted = False
+        self.elapsed = 0.0
+        self.think = 0.0
+
+
+class Journey:
+    """
+    Named, weighted sequence of steps
+    """
+
+    def __init__(self, name, steps, weight=1.0, think=0.0):
+        self.name = name
+        self.steps = steps
+        self.weight = weight
+        self.think = think
+
+    def think_time(self, step, rng):
+        """Seconds to pause after `step`"""
+        think = step.think if step.think is not None else self.think
+        if isinstance(think, (tuple, list)):
+            return rng.uniform(*think)
+        return think
+
+    def run(self, client, stats, rng, stop_event):
+        """Execute every step once, recording each into `stats`"""
+        run = JourneyRun(self.name)
+        context = {}
+        for position, step in enumerate(self.steps):
+            start = time.perf_counter()
+            try:
+                response = step.action(client, context)
+                status = response.status_code
+                ok = step.check(response)
+                if ok:
+                    for key, extract in step.extract.items():
+                        context[key] = extract(response)
+            except Exception as exc:
+                status = type(exc).__name__
+                ok = False
+            latency = time.perf_counter() - start
+            stats.step(self.name, step.name).record(status, latency, ok)
+            run.elapsed += latency
+            run.status_code = status
+            if not ok:
+                run.ok, run.failed_step = False, step.name
+                break
+            if position < len(self.steps) - 1:
+                pause = self.think_time(step, rng)
+                run.think += pause
+                if pause > 0 and stop_event.wait(pause):
+                    run.aborted = True
+                    return run
+        stats.journey(self.name).record(run.status_code, run.elapsed, run.ok)
+        return run
+
+
+class ScenarioStats:
+    """
+    PhaseStats per journey (end to end) and per journey step
+    """
+
+    def __init__(self, journeys):
+        self.journeys = {journey.name: PhaseStats(journey.name) for journey in journeys}
+        self.steps = {
+            (journey.name, step.name): PhaseStats(step.name)
+            for journey in journeys
+            for step in journey.steps
+        }
+
+    def journey(self, name):
+        """Stats for a journey"""
+        return self.journeys[name]
+
+    def step(self, journey, name):
+        """Stats for one step of a journey"""
+        return self.steps[(journey, name)]
+
+    def start(self):
+        """Mark every stats object as started now"""
+        now = time.perf_counter()
+        for stats in (*self.journeys.values(), *self.steps.values()):
+            stats.started = now
+
+    def stop(self):
+        """Mark every stats object as ended now"""
+        now = time.perf_counter()
+        for stats in (*self.journeys.values(), *self.steps.values()):
+            stats.ended = now
+
+
+class Scenario:
+    """
+    Weighted mix of journeys
+
+    Journeys are picked independently per iteration with probability
+    proportional to `weight`. Pass `seed` for a reproducible mix. Think
+    times come from a per-worker Random seeded from the shared one, so
+    workers never draw from it concurrently.
+    """
+
+    def __init__(self, name, journeys, seed=None):
+        self.name = name
+        self.journeys = journeys
+        self.weights = [journey.weight for journey in journeys]
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.local = threading.local()
+        self.stats = ScenarioStats(journeys)
+        self.stop_event = threading.Event()
+
+    def pick(self):
+        """Next journey to run"""
+        with self.rng_lock:
+            return self.rng.choices(self.journeys, self.weights)[0]
+
+    def run(self, client):
+        """LoadEngine task: one journey iteration on this user's client"""
+        journey = self.pick()
+        return journey.run(client, self.stats, self.worker_rng(), self.stop_event)
+
+    def worker_rng(self):
+        """This worker thread's own Random for think times"""
+        rng = getattr(self.local, "rng", None)
+        if rng is None:
+            with self.rng_lock:
+                rng = self.local.rng = random.Random(self.rng.random())
+        return rng
+
+
+class ScenarioResult:
+    """
+    LoadResult of the run plus per-journey and per-step stats
+    """
+
+    def __init__(self, name, result, stats):
+        self.name = name
+        self.result = result
+        self.stats = stats
+
+    def journey(self, name):
+        """Stats for a journey"""
+        return self.stats.journey(name)
+
+    def step(self, journey, name):
+        """Stats for one step of a journey"""
+        return self.stats.step(journey, name)
+
+    def summary(self):
+        """Journey table with each journey's steps underneath"""
+        lines = [
+            f"Scenario: {self.name} ({self.result.profile.name})",
+            f"  {'journey / step':<24} {'count':>6} {'rps':>7} {'p50':>8} "
+            f"{'p95':>8} {'p99':>8}  errors",
+        ]
+        for name, journey in self.stats.journeys.items():
+            lines.append(f"  {row(name, journey)}")
+            for (owner, _), step in self.stats.steps.items():
+                if owner == name:
+                    lines.append(f"    {row(step.name, step, 22)}")
+        return "\n".join(lines)
+
+
+def row(name, stats, width=24):
+    """One summary line for a PhaseStats"""
+    histogram = stats.histogram
+    return (
+        f"{name:<{width}} {stats.requests:>6} {stats.throughput:>7.1f}"
+        + "".join(f" {histogram.percentile(p) * 1000:>6.1f}ms" for p in (50, 95, 99))
+        + f"  {stats.error_rate:.2%}"
+    )
+
+
+class ScenarioRunner:
+    """
+    Runs a Scenario under a LoadProfile, one virtual user per worker
+    """
+
+    def __init__(self, client_factory, scenario, profile):
+        self.client_factory = client_factory
+        self.scenario = scenario
+        self.profile = profile
+
+    def run(self):
+        """Run the profile and return a ScenarioResult"""
+        engine = LoadEngine(
+            self.client_factory,
+            self.scenario.run,
+            self.profile,
+            check=lambda run: run.ok,
+        )
+        # Think time waits on the engine's stop event so the run ends on time
+        self.scenario.stop_event = engine.stop_event
+        self.scenario.stats.start()
+        try:
+            result = engine.run()
+        finally:
+            self.scenario.stats.stop()
+        return ScenarioResult(self.scenario.name, result, self.scenario.stats)
+
+
+def login(credentials):
+    """Step action for POST /auth/login, keeping the token on the client"""
+
+    def action(client, context):
+        response = client.post("/auth/login", json_data=credentials)
+        if response.status_code == 200:
+            client.set_auth_token(response.json()["accessToken"])
+        return response
+
+    return action
+
+
+def browse(params):
+    """Step action for GET /products with fixed query parameters"""
+    return lambda client, context: client.get("/products", params=params)
+
+
+def follow(link):
+    """Step action for GET of a link saved in the context"""
+    return lambda client, context: client.get(context[link])
+
+
+def next_link(response):
+    """links.next of a product page"""
+    return response.json()["links"]["next"]
+
+
+def guide_scenario(
+    credentials, think=(5.0, 10.0), factory=None, tracker=None, seed=None
+):
+    """
+    The Section 5 journey mix, mapped onto the endpoints the API exposes
+
+    Cart, checkout and order endpoints do not exist in the API under test,
+    so browse-and-purchase covers its login and catalogue steps, and
+    account management registers, views, updates and closes an account
+    (the created id feeding the later steps). `credentials` is the login
+    body. Registered users are recorded in `tracker` (a ResourceTracker)
+    until closed, so journeys stopped mid-way leave nothing behind.
+    """
+    factory = factory or UserFactory(pool_size=50)
+    user_path = "/users/{user_id}"
+
+    def register(client, context):
+        response = client.post("/users", json_data=factory.build())
+        if tracker is not None:
+            tracker.record(client.base_url, "/users", response)
+        return response
+
+    def view_profile(client, context):
+        return client.get(user_path.format(**context))
+
+    def update_profile(client, context):
+        return client.put(user_path.format(**context), json_data={"lastName": "Q"})
+
+    def close_account(client, context):
+        path = user_path.format(**context)
+        response = client.delete(path)
+        if tracker is not None and response.status_code in (204, 404):
+            tracker.discard(path)
+        return response
+
+    journeys = [
+        Journey(
+            "browse_and_purchase",
+            [
+                Step("login", login(credentials)),
+                Step(
+                    "browse",
+                    browse({"page": 1, "limit": 10}),
+                    extract={"next": next_link},
+                ),
+                Step("search", browse({"page": 1, "limit": 20, "sort": "name:desc"})),
+                Step("next_page", follow("next")),
+            ],
+            weight=60,
+            think=think,
+        ),
+        Journey(
+            "quick_search",
+            [
+                Step("homepage", browse({"page": 1, "limit": 10})),
+                Step(
+                    "search",
+                    browse({"page": 1, "limit": 50, "sort": "name:desc"}),
+                    extract={"next": next_link},
+                ),
+                Step("filter", follow("next")),
+            ],
+            weight=30,
+            think=think,
+        ),
+        Journey(
+            "account_management",
+            [
+                Step("login", login(credentials)),
+                Step(
+                    "register",
+                    register,
+                    check=lambda response: response.status_code == 201,
+                    extract={"user_id": lambda response: response.json()["id"]},
+                ),
+                Step("view_profile", view_profile),
+                Step("update_profile", update_profile),
+                Step(
+                    "close_account",
+                    close_account,
+                    check=lambda response: response.status_code == 204,
+                ),
+            ],
+            weight=10,
+            think=think,
+        ),
+    ]
+    return Scenario("guide", journeys, seed=seed)
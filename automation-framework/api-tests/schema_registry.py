@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Response Schema Registry
+Author: QA Team
+Date: 2026-10-18
+Framework: jsonschema (validators compiled once and cached)
+
+JSON Schemas for the contract in test-documentation/test-cases/api-testing.md,
+keyed by `METHOD /path/{id}` and status code, so a whole body is checked in
+one call on every response, including under load.
+"""
+
+import threading
+
+from jsonschema import Draft202012Validator, FormatChecker
+
+from latency_histogram import endpoint_key
+
+# Matches any endpoint; used for envelopes shared by every route
+ANY_ENDPOINT = "*"
+
+USER_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id",
+        "email",
+        "firstName",
+        "lastName",
+        "status",
+        "createdAt",
+        "updatedAt",
+    ],
+    "properties": {
+        "id": {"type": "integer"},
+        "email": {"type": "string", "format": "email"},
+        "firstName": {"type": "string"},
+        "lastName": {"type": "string"},
+        "phone": {"type": "string"},
+        "status": {"type": "string"},
+        "createdAt": {"type": "string"},
+        "updatedAt": {"type": "string"},
+    },
+    "not": {"required": ["password"]},
+}
+
+TOKEN_SCHEMA = {
+    "type": "object",
+    "required": ["accessToken", "refreshToken", "tokenType", "expiresIn"],
+    "properties": {
+        "accessToken": {"type": "string", "pattern": r"^[^.]+\.[^.]+\.[^.]+$"},
+        "refreshToken": {"type": "string"},
+        "tokenType": {"const": "Bearer"},
+        "expiresIn": {"type": "integer"},
+    },
+}
+
+LOGIN_SCHEMA = {
+    **TOKEN_SCHEMA,
+    "required": TOKEN_SCHEMA["required"] + ["user"],
+    "properties": {
+        **TOKEN_SCHEMA["properties"],
+        "user": {
+            "type": "object",
+            "required": ["id", "email", "firstName", "lastName"],
+            "properties": {
+                "id": {"type": "integer"},
+                "email": {"type": "string", "format": "email"},
+            },
+            "not": {"required": ["password"]},
+        },
+    },
+}
+
+PRODUCT_PAGE_SCHEMA = {
+    "type": "object",
+    "required": ["data", "pagination", "links"],
+    "properties": {
+        "data": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "name", "price", "stock"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "price": {"type": "number", "minimum": 0},
+                    "stock": {"type": "integer", "minimum": 0},
+                },
+            },
+        },
+        "pagination": {
+            "type": "object",
+            "required": [
+                "page",
+                "limit",
+                "totalPages",
+                "totalItems",
+                "hasNext",
+                "hasPrevious",
+            ],
+            "properties": {
+                "page": {"type": "integer", "minimum": 1},
+                "limit": {"type": "integer", "minimum": 1},
+                "totalPages": {"type": "integer", "minimum": 0},
+                "totalItems": {"type": "integer", "minimum": 0},
+                "hasNext": {"type": "boolean"},
+                "hasPrevious": {"type": "boolean"},
+            },
+        },
+        "links": {
+            "type": "object",
+            "required": ["self"],
+            "additionalProperties": {"type": "string"},
+        },
+    },
+}
+
+ERROR_SCHEMA = {
+    "type": "object",
+    "required": ["error"],
+    "properties": {
+        "error": {
+            "type": "object",
+            "required": ["code", "message", "timestamp"],
+            "properties": {
+                "code": {"type": "string"},
+                "message": {"type": "string"},
+                "timestamp": {"type": "string"},
+                "field": {"type": "string"},
+                "retryAfter": {"type": "integer"},
+                "details": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["field", "message"],
+                    },
+                },
+            },
+        }
+    },
+}
+
+# Bodiless responses (204) validate as null
+EMPTY_SCHEMA = {"type": "null"}
+
+SCHEMAS = {
+    ("POST", "/auth/login", 200): LOGIN_SCHEMA,
+    ("POST", "/auth/refresh", 200): TOKEN_SCHEMA,
+    ("GET", "/users/{id}", 200): USER_SCHEMA,
+    ("POST", "/users", 201): USER_SCHEMA,
+    ("PUT", "/users/{id}", 200): USER_SCHEMA,
+    ("DELETE", "/users/{id}", 204): EMPTY_SCHEMA,
+    ("GET", "/products", 200): PRODUCT_PAGE_SCHEMA,
+    **{
+        (ANY_ENDPOINT, ANY_ENDPOINT, status): ERROR_SCHEMA
+        for status in (400, 401, 403, 404, 405, 409, 429, 500, 503)
+    },
+}
+
+
+class SchemaValidationError(AssertionError):
+    """
+    Response body does not match its registered schema
+    """
+
+    def __init__(self, key, status, errors):
+        self.key = key
+        self.status = status
+        self.errors = errors
+        lines = [f"{key} {status}: {len(errors)} schema violation(s)"]
+        for error in errors:
+            path = "/".join(str(part) for part in error.absolute_path) or "<root>"
+            lines.append(f"  {path}: {error.message}")
+        super().__init__("\n".join(lines))
+
+
+class SchemaRegistry:
+    """
+    Validators keyed by endpoint and status, each compiled once
+
+    Schemas are checked and turned into validators at register() time,
+    so validate() is a dict lookup plus the validation itself and is
+    safe to call from many threads at once.
+    """
+
+    def __init__(self, schemas=None):
+        self.validators = {}
+        self.lock = threading.Lock()
+        self.format_checker = FormatChecker()
+        for (method, endpoint, status), schema in (schemas or {}).items():
+            self.register(method, endpoint, status, schema)
+
+    def key(self, method, endpoint):
+        """Registry key for a request; ids collapse to {id} like histograms"""
+        if method == ANY_ENDPOINT:
+            return ANY_ENDPOINT
+        return endpoint_key(method, endpoint)
+
+    def register(self, method, endpoint, status, schema):
+        """Compile and cache a validator; `*` method matches any endpoint"""
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema, format_checker=self.format_checker)
+        with self.lock:
+            self.validators[(self.key(method, endpoint), status)] = validator
+
+    def validator(self, method, endpoint, status):
+        """Cached validator for a response; KeyError when none is registered"""
+        key = self.key(method, endpoint)
+        validator = self.validators.get((key, status))
+        if validator is None:
+            validator = self.validators.get((ANY_ENDPOINT, status))
+        if validator is None:
+            raise KeyError(f"No schema registered for {key} {status}")
+        return validator
+
+    def validate_body(self, method, endpoint, status, data):
+        """Raise SchemaValidationError if `data` breaks the schema"""
+        validator = self.validator(method, endpoint, status)
+        # is_valid stops at the first failure; only collect all on the slow path
+        if not validator.is_valid(data):
+            errors = sorted(
+                validator.iter_errors(data),
+                key=lambda error: [str(part) for part in error.absolute_path],
+            )
+            raise SchemaValidationError(self.key(method, endpoint), status, errors)
+
+    def validate(self, response):
+        """Validate an APIClient response against its endpoint's schema"""
+        timing = response.timing
+        data = response.json() if response.content else None
+        self.validate_body(timing.method, timing.endpoint, response.status_code, data)
+
+    def is_valid(self, response):
+        """Whether an APIClient response matches its schema"""
+        try:
+            self.validate(response)
+        except (SchemaValidationError, KeyError, ValueError):
+            return False
+        return True
+
+    def check(self, response):
+        """LoadEngine check: a successful status with a schema-valid body"""
+        return response.status_code < 400 and self.is_valid(response)
+
+
+def default_registry():
+    """Registry holding the documented API contract"""
+    return SchemaRegistry(SCHEMAS)
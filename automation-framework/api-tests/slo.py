@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Performance Budgets (SLOs)
+Author: QA Team
+Date: 2026-10-18
+Framework: PyYAML budget file evaluated against LatencyHistogram data
+
+Budgets live in performance-budgets.yaml, keyed like the latency reports
+(`GET /users/{id}`), and are checked against all timings a run collected
+rather than against single responses.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+from latency_histogram import (
+    ERROR_CLASSES,
+    LatencyHistogram,
+    LatencyRecorder,
+    endpoint_key,
+)
+
+DEFAULT_BUDGETS = Path(__file__).with_name("performance-budgets.yaml")
+
+LATENCY_METRICS = ("mean", "max")
+
+
+class Budget:
+    """
+    Limits for one endpoint
+
+    Latency limits are in seconds: `pNN` percentiles, `mean` and `max`.
+    `max_error_rate` bounds the share of 5xx and transport errors, and
+    `min_throughput` (requests/second) is only judged once the endpoint
+    has at least `min_samples` requests and a throughput is supplied.
+    """
+
+    def __init__(self, endpoint, limits):
+        self.endpoint = endpoint
+        limits = dict(limits)
+        self.max_error_rate = limits.pop("max_error_rate", None)
+        self.min_throughput = limits.pop("min_throughput", None)
+        self.min_samples = limits.pop("min_samples", 1)
+        self.latency = {}
+        for metric, limit in limits.items():
+            metric = str(metric)
+            if metric not in LATENCY_METRICS and not is_percentile(metric):
+                raise ValueError(f"{endpoint}: unknown budget metric '{metric}'")
+            self.latency[metric] = float(limit)
+
+    def check(self, histogram, errors, throughput):
+        """Breaches as (metric, actual, limit) tuples"""
+        breaches = []
+        for metric, limit in self.latency.items():
+            actual = latency_metric(histogram, metric)
+            if actual > limit:
+                breaches.append((metric, actual, limit))
+        if self.max_error_rate is not None and histogram.count:
+            error_rate = errors / histogram.count
+            if error_rate > self.max_error_rate:
+                breaches.append(("error_rate", error_rate, self.max_error_rate))
+        if (
+            self.min_throughput is not None
+            and throughput is not None
+            and histogram.count >= self.min_samples
+            and throughput < self.min_throughput
+        ):
+            breaches.append(("throughput", throughput, self.min_throughput))
+        return breaches
+
+
+def is_percentile(metric):
+    """Whether a metric name is `pNN` with NN in 0-100"""
+    try:
+        return metric.startswith("p") and 0 <= float(metric[1:]) <= 100
+    except ValueError:
+        return False
+
+
+def latency_metric(histogram, metric):
+    """Value of `mean`, `max` or `pNN` from a histogram, in seconds"""
+    if metric == "mean":
+        return histogram.mean
+    if metric == "max":
+        return histogram.max
+    return histogram.percentile(float(metric[1:]))
+
+
+class Budgets:
+    """
+    All endpoint budgets from a budget file
+    """
+
+    def __init__(self, endpoints, defaults=None):
+        defaults = defaults or {}
+        self.budgets = {}
+        for key, limits in endpoints.items():
+            method, _, path = key.partition(" ")
+            key = endpoint_key(method, path)
+            self.budgets[key] = Budget(key, {**defaults, **(limits or {})})
+
+    @classmethod
+    def load(cls, path=DEFAULT_BUDGETS):
+        """Read a YAML budget file"""
+        with open(path, encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+        return cls(data.get("endpoints") or {}, data.get("defaults"))
+
+    def evaluate(self, collector, throughput=True):
+        """
+        Verdict for everything `collector` recorded
+
+        Throughput is only meaningful when the collector saw one continuous
+        run; pass `throughput=False` for session-wide data, whose spans
+        include the idle time between unrelated tests.
+        """
+        verdict = Verdict()
+        for key in collector.endpoints():
+            histogram = collector.histogram(endpoint=key)
+            errors = sum(
+                collector.histogram(endpoint=key, status=klass).count
+                for klass in ERROR_CLASSES
+            )
+            rate = collector.throughput(key) if throughput else None
+            budget = self.budgets.get(key)
+            breaches = budget.check(histogram, errors, rate) if budget else None
+            verdict.rows.append((key, histogram, errors, rate, breaches))
+        return verdict
+
+
+class Verdict:
+    """
+    Per-endpoint outcome of Budgets.evaluate()
+    """
+
+    def __init__(self):
+        self.rows = []
+
+    @property
+    def breaches(self):
+        """(endpoint, metric, actual, limit) for every breached limit"""
+        return [
+            (key, *breach)
+            for key, _, _, _, breaches in self.rows
+            for breach in breaches or ()
+        ]
+
+    @property
+    def passed(self):
+        """Whether no endpoint broke its budget"""
+        return not self.breaches
+
+    def table(self):
+        """Per-endpoint table with each breached limit listed underneath"""
+        lines = [
+            f"{'endpoint':<28} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} "
+            f"{'errors':>7} {'rps':>7}  verdict"
+        ]
+        for key, histogram, errors, throughput, breaches in self.rows:
+            if breaches is None:
+                outcome = "no budget"
+            else:
+                outcome = "FAIL" if breaches else "ok"
+            error_rate = errors / histogram.count if histogram.count else 0.0
+            lines.append(
+                f"{key:<28} {histogram.count:>7}"
+                + "".join(
+                    f" {histogram.percentile(p) * 1000:>6.1f}ms" for p in (50, 95, 99)
+                )
+                + f" {error_rate:>7.2%}"
+                + (f" {throughput:>7.1f}" if throughput is not None else f" {'-':>7}")
+                + f"  {outcome}"
+            )
+            for metric, actual, limit in breaches or ():
+                lines.append(f"    {metric}: {format_value(metric, actual, limit)}")
+        return "\n".join(lines)
+
+
+def format_value(metric, actual, limit):
+    """Human-readable `actual > limit` for a breach"""
+    if metric == "error_rate":
+        return f"{actual:.2%} > {limit:.2%}"
+    if metric == "throughput":
+        return f"{actual:.1f} req/s < {limit:.1f} req/s"
+    return f"{actual * 1000:.1f}ms > {limit * 1000:.1f}ms"
+
+
+class SLOCollector(LatencyRecorder):
+    """
+    LatencyRecorder that also tracks each endpoint's active time span
+
+    The span (first to last wall-clock sample) gives throughput, and is
+    wall-clock so collectors from several processes can be merged.
+    """
+
+    def __init__(self, max_seconds=3600.0):
+        super().__init__(max_seconds)
+        self.spans = {}
+        self.span_lock = threading.Lock()
+
+    def record(self, method, endpoint, status, seconds):
+        """Record one request outcome and extend its endpoint's span"""
+        super().record(method, endpoint, status, seconds)
+        key, now = endpoint_key(method, endpoint), time.time()
+        with self.span_lock:
+            first, last = self.spans.get(key, (now - seconds, now))
+            self.spans[key] = (min(first, now - seconds), max(last, now))
+
+    def record_timing(self, timing):
+        """TimingHooks subscriber (intended-time latency when scheduled)"""
+        self.record(timing.method, timing.endpoint, timing.status, timing.latency)
+
+    def endpoints(self):
+        """Endpoint keys with at least one sample"""
+        return sorted({key for key, _ in self.histograms})
+
+    def throughput(self, key):
+        """Requests per second over the endpoint's active span"""
+        first, last = self.spans.get(key, (0.0, 0.0))
+        count = self.histogram(endpoint=key).count
+        return count / (last - first) if last > first else 0.0
+
+    def merge(self, other):
+        """Fold in another collector, widening spans"""
+        super().merge(other)
+        with self.span_lock:
+            for key, (first, last) in other.spans.items():
+                mine = self.spans.get(key, (first, last))
+                self.spans[key] = (min(mine[0], first), max(mine[1], last))
+        return self
+
+    def to_dict(self):
+        """JSON-serialisable form for shipping between processes"""
+        with self.lock:
+            histograms = [
+                [key, klass, histogram.to_dict()]
+                for (key, klass), histogram in self.histograms.items()
+            ]
+        return {"histograms": histograms, "spans": dict(self.spans)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a collector produced by to_dict()"""
+        collector = cls()
+        for key, klass, histogram in data["histograms"]:
+            collector.histograms[(key, klass)] = LatencyHistogram.from_dict(histogram)
+        collector.spans = {key: tuple(span) for key, span in data["spans"].items()}
+        return collector
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+SLO Budget Pytest Plugin
+Author: QA Team
+Date: 2026-10-18
+Framework: pytest hooks (pytest-xdist aware)
+
+Collects the timing of every APIClient request made during the session
+and, once all tests are done, judges them against performance-budgets.yaml.
+A breach fails the session and prints a per-endpoint table, so a single
+slow response no longer fails a functional test while a real percentile
+regression no longer goes unnoticed.
+
+Tests that deliberately inject failures opt out with @pytest.mark.no_slo.
+Wired up from conftest.py via add_options() and configure().
+"""
+
+import pytest
+
+from request_timing import global_hooks
+from slo import DEFAULT_BUDGETS, Budgets, SLOCollector
+
+COLLECTOR_KEY = "slo_collector"
+
+
+def add_options(parser):
+    """Budget file selection (call from pytest_addoption)"""
+    group = parser.getgroup("slo", "performance budgets")
+    group.addoption(
+        "--slo-budgets",
+        default=str(DEFAULT_BUDGETS),
+        help="YAML file of per-endpoint performance budgets",
+    )
+    group.addoption(
+        "--no-slo",
+        action="store_true",
+        help="Do not judge the run against performance budgets",
+    )
+
+
+class SLOPlugin:
+    """
+    Session-wide collector and end-of-run verdict
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.budgets = Budgets.load(config.getoption("--slo-budgets"))
+        self.collector = SLOCollector()
+        self.paused = False
+        self.verdict = None
+        global_hooks.subscribe(self.record)
+
+    def record(self, timing):
+        """global_hooks subscriber"""
+        if not self.paused:
+            self.collector.record_timing(timing)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        """Leave tests marked no_slo out of the budgets"""
+        self.paused = item.get_closest_marker("no_slo") is not None
+        try:
+            yield
+        finally:
+            self.paused = False
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Merge a pytest-xdist worker's timings on the controller"""
+        data = getattr(node, "workeroutput", {}).get(COLLECTOR_KEY)
+        if data is not None:
+            self.collector.merge(SLOCollector.from_dict(data))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Ship timings (xdist worker) or judge the run (controller/single)"""
+        global_hooks.unsubscribe(self.record)
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput[COLLECTOR_KEY] = self.collector.to_dict()
+            return
+        if not self.collector.histograms:
+            return
+        # Session spans include idle gaps between tests, so no throughput
+        self.verdict = self.budgets.evaluate(self.collector, throughput=False)
+        if not self.verdict.passed and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Per-endpoint budget table"""
+        if self.verdict is None:
+            return
+        title = "performance budgets"
+        if not self.verdict.passed:
+            title += f": {len(self.verdict.breaches)} breach(es)"
+        terminalreporter.section(title)
+        terminalreporter.write_line(self.verdict.table())
+
+
+def configure(config):
+    """Register the marker and, unless disabled, the plugin"""
+    config.addinivalue_line(
+        "markers", "no_slo: keep this test's requests out of performance budgets"
+    )
+    if not config.getoption("--no-slo"):
+        config.pluginmanager.register(SLOPlugin(config), "slo-budgets")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Auth Token Cache
+Author: QA Team
+Date: 2026-10-18
+Framework: file-backed cache shared by pytest-xdist workers
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class TokenCache:
+    """
+    Caches login tokens keyed on (base_url, credentials)
+
+    Entries live in memory and in `cache_dir` (one JSON file per key,
+    guarded by an flock) so every test and every xdist worker pointing the
+    cache at the same directory shares one login. A token is reused until
+    `refresh_margin` seconds before its `expiresIn` deadline, then renewed
+    with the refresh token, falling back to a full login.
+    """
+
+    def __init__(
+        self,
+        cache_dir,
+        refresh_margin=60,
+        default_ttl=300,
+        login_endpoint="/auth/login",
+        refresh_endpoint="/auth/refresh",
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.login_endpoint = login_endpoint
+        self.refresh_endpoint = refresh_endpoint
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.logins = 0
+        self.refreshes = 0
+
+    @staticmethod
+    def key(base_url, credentials):
+        """Stable cache key; credentials are hashed, never stored"""
+        material = json.dumps([base_url, credentials], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, entry):
+        """Whether an entry is usable without refreshing"""
+        return entry is not None and entry["expiresAt"] - self.refresh_margin > (
+            time.time()
+        )
+
+    def get_token(self, client, credentials):
+        """Return a valid access token, logging in or refreshing if needed"""
+        key = self.key(client.base_url, credentials)
+        entry = self.entries.get(key)
+        if self.is_fresh(entry):
+            return entry["accessToken"]
+
+        with self.lock, self.file_lock(key):
+            entry = self.read(key)
+            if not self.is_fresh(entry):
+                entry = self.refresh(client, entry) or self.login(client, credentials)
+                if entry is None:
+                    return None
+                self.write(key, entry)
+            self.entries[key] = entry
+            return entry["accessToken"]
+
+    def authorize(self, client, credentials):
+        """
+        Set a cached token on `client` and return it (None if login failed)
+
+        A 401 answered to that token (outside the auth endpoints) means
+        the server revoked it early, so the cache entry is invalidated and
+        the next get_token() logs in again.
+        """
+        token = self.get_token(client, credentials)
+        if token is None:
+            return None
+        client.set_auth_token(token)
+
+        def rejected(timing):
+            if (
+                timing.status == 401
+                and client.token == token
+                and not timing.endpoint.startswith("/auth/")
+            ):
+                self.invalidate(client, credentials, token)
+
+        client.timing_hooks.subscribe(rejected)
+        return token
+
+    def invalidate(self, client, credentials, token=None):
+        """
+        Drop a token the server rejected
+
+        With `token`, only an entry still holding that token is dropped, so
+        a token another worker already renewed survives.
+        """
+        key = self.key(client.base_url, credentials)
+        with self.lock, self.file_lock(key):
+            entry = self.read(key)
+            if token is None or entry is None or entry["accessToken"] == token:
+                self.path(key).unlink(missing_ok=True)
+            entry = self.entries.get(key)
+            if token is None or entry is None or entry["accessToken"] == token:
+                self.entries.pop(key, None)
+
+    def login(self, client, credentials):
+        """Full login; returns a cache entry or None on failure"""
+        response = client.post(self.login_endpoint, json_data=credentials)
+        self.logins += 1
+        if response.status_code != 200:
+            return None
+        return self.entry_from(response.json())
+
+    def refresh(self, client, entry):
+        """Renew via refresh token; returns a cache entry or None"""
+        if not entry or not entry.get("refreshToken"):
+            return None
+        response = client.post(
+            self.refresh_endpoint,
+            json_data={"refreshToken": entry["refreshToken"]},
+        )
+        self.refreshes += 1
+        if response.status_code != 200:
+            return None
+        refreshed = self.entry_from(response.json())
+        refreshed["refreshToken"] = refreshed["refreshToken"] or entry["refreshToken"]
+        return refreshed
+
+    def entry_from(self, data):
+        """Build a cache entry from a login/refresh response body"""
+        return {
+            "accessToken": data["accessToken"],
+            "refreshToken": data.get("refreshToken"),
+            "expiresAt": time.time() + data.get("expiresIn", self.default_ttl),
+        }
+
+    def path(self, key):
+        """Cache file for a key"""
+        return self.cache_dir / f"{key}.json"
+
+    def read(self, key):
+        """Load an entry from disk, or None"""
+        try:
+            return json.loads(self.path(key).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def write(self, key, entry):
+        """Atomically persist an entry readable only by the current user"""
+        tmp = self.path(key).with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as handle:
+            json.dump(entry, handle)
+        os.replace(tmp, self.path(key))
+
+    @contextmanager
+    def file_lock(self, key):
+        """Exclusive inter-process lock for one key"""
+        with open(self.cache_dir / f"{key}.lock", "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
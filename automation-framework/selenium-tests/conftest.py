@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the Selenium test suites
+Author: QA Team
+Date: 2026-10-18
+"""
+
+import functools
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from selenium import webdriver
+
+from driver_pool import DriverPool
+
+STATIC_SITE = Path(__file__).parent / "static-site"
+
+
+def pytest_addoption(parser):
+    """Execution mode options for the browser suites"""
+    group = parser.getgroup("selenium", "Selenium execution mode")
+    group.addoption(
+        "--app-url",
+        default="https://qa.example.com",
+        help="Base URL of the web application under test",
+    )
+    group.addoption(
+        "--static-site",
+        action="store_true",
+        help="Serve the bundled static login/dashboard stand-in and test it",
+    )
+    group.addoption(
+        "--headless",
+        action="store_true",
+        help="Run Chrome headless (combine with -n auto for parallel runs)",
+    )
+    group.addoption(
+        "--viewport",
+        default="1366x768",
+        help="Fixed window size WIDTHxHEIGHT used in headless mode",
+    )
+    group.addoption(
+        "--disable-images",
+        action="store_true",
+        help="Do not load images",
+    )
+
+
+class SilentHandler(SimpleHTTPRequestHandler):
+    """Static file handler without per-request logging"""
+
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+
+
+def chrome_options(config, user_data_dir):
+    """Chrome options for the configured execution mode"""
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.add_argument("--disable-extensions")
+    if config.getoption("--headless"):
+        width, height = config.getoption("--viewport").lower().split("x")
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={int(width)},{int(height)}")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    if config.getoption("--disable-images"):
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    return options
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report on the item (e.g. item.rep_call)"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(scope="session")
+def app_url(request):
+    """Base URL of the application, or of the local static stand-in"""
+    if not request.config.getoption("--static-site"):
+        yield request.config.getoption("--app-url").rstrip("/")
+        return
+
+    handler = functools.partial(SilentHandler, directory=str(STATIC_SITE))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, tmp_path_factory):
+    """Warm browsers shared by the session (one pool per xdist worker)"""
+    # basetemp is unique per xdist worker, so profiles never collide
+    profiles = tmp_path_factory.mktemp("chrome-profiles")
+
+    def create_driver():
+        """Start a configured Chrome browser with its own profile dir"""
+        user_data_dir = tempfile.mkdtemp(dir=profiles)
+        driver = webdriver.Chrome(options=chrome_options(request.config, user_data_dir))
+        if not request.config.getoption("--headless"):
+            driver.maximize_window()
+        # No implicit wait: page objects use explicit adaptive waits only
+        driver.implicitly_wait(0)
+        return driver
+
+    pool = DriverPool(create_driver)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(request, driver_pool):
+    """Pooled driver, recycled if the test fails"""
+    driver = driver_pool.acquire()
+    yield driver
+    report = getattr(request.node, "rep_call", None)
+    driver_pool.release(driver, failed=report is None or report.failed)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+WebDriver Pool
+Author: QA Team
+Date: 2026-10-18
+Framework: Selenium WebDriver
+"""
+
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """
+    Keeps warm browser instances alive across tests
+
+    Drivers are created lazily by `factory`, handed out by acquire() and
+    returned with release(). A returned driver has its cookies, local and
+    session storage and extra windows cleared and is parked on about:blank.
+    It is quit instead of reused after `max_uses` tests, after a failed
+    test, or when resetting it fails.
+    """
+
+    def __init__(self, factory, max_uses=25):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.idle = []
+        self.uses = {}
+        self.lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """Take an idle driver, starting a new browser if none is free"""
+        with self.lock:
+            if self.idle:
+                return self.idle.pop()
+        driver = self.factory()
+        with self.lock:
+            self.created += 1
+            self.uses[driver] = 0
+        return driver
+
+    def release(self, driver, failed=False):
+        """Return a driver after a test; recycle it when spent or suspect"""
+        with self.lock:
+            self.uses[driver] += 1
+            spent = self.uses[driver] >= self.max_uses
+        if failed or spent or not self.reset(driver):
+            self.discard(driver)
+            return
+        with self.lock:
+            self.idle.append(driver)
+
+    def reset(self, driver):
+        """Clear browser state between tests; False if the browser is broken"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            # Storage is per origin, so clear it before leaving the page
+            driver.execute_script(
+                "try { window.localStorage.clear(); "
+                "window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def discard(self, driver):
+        """Quit a driver and forget it"""
+        with self.lock:
+            self.uses.pop(driver, None)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        """Quit every idle driver (call at session end)"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for driver in idle:
+            self.discard(driver)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Adaptive Wait Strategy
+Author: QA Team
+Date: 2026-10-18
+Framework: Selenium WebDriver
+"""
+
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class AdaptiveWait:
+    """
+    Explicit wait with adaptive polling
+
+    Drop-in for WebDriverWait.until/until_not (conditions are the usual
+    expected_conditions callables) but polls quickly at first and backs
+    off towards `max_poll`, so conditions that are already true return in
+    milliseconds while long waits do not hammer the browser. Every call
+    can override the timeout. Relies on implicit waits being disabled,
+    otherwise each failed element lookup blocks for the implicit timeout.
+    """
+
+    def __init__(
+        self, driver, timeout=10, initial_poll=0.01, max_poll=0.25, backoff=1.5
+    ):
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+
+    def poll(self, timeout):
+        """Yield until the deadline, sleeping an increasing interval between"""
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        interval = self.initial_poll
+        while True:
+            yield
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+
+    def evaluate(self, condition):
+        """Run a condition, treating transient lookup errors as falsy"""
+        try:
+            return condition(self.driver)
+        except IGNORED_EXCEPTIONS:
+            return False
+
+    def until(self, condition, timeout=None, message=""):
+        """Wait for a truthy condition value and return it"""
+        for _ in self.poll(timeout):
+            value = self.evaluate(condition)
+            if value:
+                return value
+        raise TimeoutException(message)
+
+    def until_not(self, condition, timeout=None, message=""):
+        """Wait for a condition to become falsy"""
+        for _ in self.poll(timeout):
+            if not self.evaluate(condition):
+                return True
+        raise TimeoutException(message)
+
+    def first_of(self, conditions, timeout=None, message=""):
+        """
+        Wait for whichever named condition holds first
+
+        `conditions` maps names to conditions; returns (name, value).
+        """
+        for _ in self.poll(timeout):
+            for name, condition in conditions.items():
+                value = self.evaluate(condition)
+                if value:
+                    return name, value
+        raise TimeoutException(message)
+
+    def stays_false(self, condition, duration):
+        """Fast negative check: True if the condition never holds for `duration`"""
+        for _ in self.poll(duration):
+            if self.evaluate(condition):
+                return False
+        return True